@@ -0,0 +1,60 @@
+"""Micro-benchmark: one engagement scoring pass per tick for many users.
+
+Each simulated tick observes a few distance/utterance/gaze events and then
+picks the next user (`EngagementModel.pick`), as TurnTaker does per tick.
+
+Run with `hatch run python benchmarks/bench_engagement.py`.
+"""
+
+from __future__ import annotations
+
+import random
+import statistics
+import time
+
+from resobot_gw.agents.engagement import EngagementModel
+
+USERS = (10, 50, 200)
+TICKS = 2000
+EVENTS_PER_TICK = 5
+SEED = 1234
+
+
+def run(users: int) -> tuple[float, float]:
+    rng = random.Random(SEED)
+    now = [0.0]
+    model = EngagementModel(clock=lambda: now[0])
+    names = [f"user{i}" for i in range(users)]
+    for name in names:
+        model.distance(name, rng.uniform(0.0, 10.0))
+    pick_s: list[float] = []
+    tick_s: list[float] = []
+    for _ in range(TICKS):
+        now[0] += 0.05
+        t0 = time.perf_counter()
+        for _ in range(EVENTS_PER_TICK):
+            name = rng.choice(names)
+            rng.choice((model.utterance, model.gaze, model.mention))(name)
+            model.distance(name, rng.uniform(0.0, 10.0))
+        t1 = time.perf_counter()
+        pick = model.pick()
+        t2 = time.perf_counter()
+        if pick is not None:
+            model.replied(pick[0])
+        pick_s.append(t2 - t1)
+        tick_s.append(t2 - t0)
+    return statistics.median(pick_s), statistics.quantiles(tick_s, n=100)[98]
+
+
+def main() -> None:
+    print(f"{TICKS} ticks, {EVENTS_PER_TICK} events/tick")
+    for users in USERS:
+        pick, tick_p99 = run(users)
+        print(
+            f"{users:>4} users: pick median {pick * 1e6:6.1f} us,"
+            f" tick (events + pick) p99 {tick_p99 * 1e6:6.1f} us",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Benchmark: Guardian cost per proposal as the rule count grows.
+
+Each rule is scoped to one of many intent kinds and a resource, as policy
+rules usually are. Compares the indexed `Guardian.filter` against checking
+every rule's scope for every proposal, and reports how many rules actually
+ran per proposal.
+
+Run with `hatch run python benchmarks/bench_guardian.py`.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass
+
+from resobot_gw.agents.guardian import Guardian, PolicyRule, Veto
+from resobot_gw.agents.orchestrator import Intent, Resource, Tier
+
+RULE_COUNTS = (10, 100, 1000)
+KINDS = tuple(f"kind{i}" for i in range(50))
+PROPOSALS = 1000
+SEED = 1234
+
+
+@dataclass(eq=False)
+class Scoped(PolicyRule):
+    name: str
+    kinds: frozenset[str]
+    resources: frozenset[Resource]
+
+    def check(self, intent: Intent) -> Intent | Veto:
+        return intent
+
+
+def make_rules(n: int, rng: random.Random) -> list[PolicyRule]:
+    resources = list(Resource)
+    return [
+        Scoped(f"r{i}", frozenset({rng.choice(KINDS)}), frozenset({rng.choice(resources)}))
+        for i in range(n)
+    ]
+
+
+def make_proposals(rng: random.Random) -> list[Intent]:
+    resources = list(Resource)
+    return [
+        Intent(
+            agent=f"agent{i}",
+            kind=rng.choice(KINDS),
+            params={},
+            resources=tuple(rng.sample(resources, rng.randint(1, 3))),
+            score=rng.random(),
+            hold_ms=100,
+            tier=Tier.activity,
+        )
+        for i in range(PROPOSALS)
+    ]
+
+
+def scan_all(rules: list[PolicyRule], proposals: list[Intent]) -> None:
+    for intent in proposals:
+        for rule in rules:
+            if (not rule.kinds or intent.kind in rule.kinds) and (
+                not rule.resources or not rule.resources.isdisjoint(intent.resources)
+            ):
+                rule.check(intent)
+
+
+def main() -> None:
+    rng = random.Random(SEED)
+    proposals = make_proposals(rng)
+    print(f"{'rules':>6} {'indexed_us':>10} {'scan_us':>8} {'rules_run':>9}")
+    for n in RULE_COUNTS:
+        rules = make_rules(n, rng)
+        guardian = Guardian(rules)
+        start = time.perf_counter()
+        guardian.filter(proposals)
+        indexed = (time.perf_counter() - start) / PROPOSALS * 1e6
+        start = time.perf_counter()
+        scan_all(rules, proposals)
+        scan = (time.perf_counter() - start) / PROPOSALS * 1e6
+        ran = sum(s.calls for s in guardian.stats.values()) / PROPOSALS
+        print(f"{n:>6} {indexed:>10.2f} {scan:>8.2f} {ran:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
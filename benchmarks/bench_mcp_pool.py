@@ -0,0 +1,86 @@
+"""Load test: MCP session pool vs. spawn-per-run against the fake stdio server.
+
+Each simulated agent run makes a few tool calls. "spawn" starts a fresh
+`MCPServerStdio` per run (subprocess + handshake); the pool variants borrow warm
+sessions, with more sessions letting concurrent agents use separate pipes.
+
+Run with `hatch run python benchmarks/bench_mcp_pool.py`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+from agents.mcp import MCPServer, MCPServerStdio
+
+from resobot_gw.agents.mcp_pool import MCPSessionPool
+
+FAKE_SERVER = Path(__file__).parents[1] / "tests" / "fake_mcp_server.py"
+AGENTS = 6
+RUNS_PER_AGENT = 5
+CALLS_PER_RUN = 3
+TOOL_LATENCY_MS = 10
+
+
+def factory() -> MCPServerStdio:
+    return MCPServerStdio(
+        params={
+            "command": sys.executable,
+            "args": [str(FAKE_SERVER), "--latency-ms", str(TOOL_LATENCY_MS)],
+        },
+    )
+
+
+async def one_run(server: MCPServer) -> None:
+    for _ in range(CALLS_PER_RUN):
+        await server.call_tool("world_snapshot", {})
+
+
+async def spawn_per_run() -> None:
+    async def agent() -> None:
+        for _ in range(RUNS_PER_AGENT):
+            server = factory()
+            await server.connect()
+            try:
+                await one_run(server)
+            finally:
+                await server.cleanup()
+
+    await asyncio.gather(*(agent() for _ in range(AGENTS)))
+
+
+async def pooled(size: int) -> None:
+    async with MCPSessionPool(factory, size=size) as pool:
+        start = time.perf_counter()
+
+        async def agent() -> None:
+            for _ in range(RUNS_PER_AGENT):
+                async with pool.session() as server:
+                    await one_run(server)
+
+        await asyncio.gather(*(agent() for _ in range(AGENTS)))
+        elapsed = time.perf_counter() - start
+        print(f"  (pool={size}: {elapsed * 1000:.0f} ms excl. warmup, waits={pool.stats.waits})")
+
+
+async def main() -> None:
+    runs = AGENTS * RUNS_PER_AGENT
+    print(f"{AGENTS} agents x {RUNS_PER_AGENT} runs x {CALLS_PER_RUN} calls", end="")
+    print(f", {TOOL_LATENCY_MS} ms/call")
+    for label, scenario in (
+        ("spawn", spawn_per_run),
+        ("pool=1", lambda: pooled(1)),
+        ("pool=3", lambda: pooled(3)),
+        ("pool=6", lambda: pooled(6)),
+    ):
+        start = time.perf_counter()
+        await scenario()
+        elapsed = time.perf_counter() - start
+        print(f"{label:>7}: {elapsed * 1000:7.0f} ms total, {elapsed / runs * 1000:6.1f} ms/run")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,87 @@
+"""Benchmark: episodic memory append cost and top-k search latency.
+
+Fills a fresh `MemoryStore` (in a temporary directory) with synthetic
+episode texts and reports, at each size, the mean and worst append time (the
+worst is what a bus subscriber stalls for; index re-clustering runs in the
+background), the search latency percentiles for top-5 queries, the number of
+IVF partitions, and the recall of the approximate search against an exact
+scan. Reopening the store is timed as well, since startup maps the files and
+the saved index instead of reading or re-clustering them.
+
+Run with `hatch run python benchmarks/bench_memory.py`.
+"""
+
+from __future__ import annotations
+
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from resobot_gw.memory import HashingEmbedder, MemoryStore, VectorIndex
+
+SIZES = (1_000, 10_000, 100_000)
+QUERIES = 200
+SEED = 1234
+WORDS = tuple(f"w{i}" for i in range(2000))
+
+
+def text(rng: random.Random) -> str:
+    return " ".join(rng.choices(WORDS, k=8))
+
+
+def fill(store: MemoryStore, n: int, rng: random.Random) -> tuple[float, float]:
+    """Append up to `n` episodes; returns mean and worst append time in seconds."""
+    added = n - len(store)
+    worst = 0.0
+    start = time.perf_counter()
+    for _ in range(added):
+        t0 = time.perf_counter()
+        store.append(text(rng))
+        worst = max(worst, time.perf_counter() - t0)
+    return (time.perf_counter() - start) / added, worst
+
+
+def main() -> None:
+    rng = random.Random(SEED)
+    embedder = HashingEmbedder()
+    print(
+        f"{'episodes':>9} {'append_us':>9} {'max_ms':>6} {'p50_us':>7} {'p99_us':>7}"
+        f" {'partitions':>10} {'recall@5':>8} {'reopen_ms':>9}",
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "mem"
+        store = MemoryStore(path, embedder, chunk=16384)
+        for n in SIZES:
+            mean, worst = fill(store, n, rng)
+            store.wait_index()  # measure search on the index trained for this size
+            exact = VectorIndex(exact_below=n + 1)
+            vectors = store._vectors.rows[:n]  # noqa: SLF001 - compare against an exact scan
+            queries = [" ".join(rng.choices(WORDS, k=3)) for _ in range(QUERIES)]
+            samples: list[float] = []
+            results = []
+            for query in queries:
+                t0 = time.perf_counter()
+                results.append(store.search(query, k=5))
+                samples.append((time.perf_counter() - t0) * 1e6)
+            # exact scans run apart from the timed loop so they do not evict its cache
+            hits = 0
+            for query, got in zip(queries, results, strict=True):
+                want = {r for r, _ in exact.search(vectors, embedder.embed(query), 5)}
+                hits += len(want & {r.row for r in got})
+            del vectors
+            samples.sort()
+            store.close()
+            t0 = time.perf_counter()
+            store = MemoryStore(path, embedder, chunk=16384)
+            reopen_ms = (time.perf_counter() - t0) * 1e3
+            print(
+                f"{n:>9} {mean * 1e6:>9.1f} {worst * 1e3:>6.1f} {samples[len(samples) // 2]:>7.1f}"
+                f" {samples[int(len(samples) * 0.99)]:>7.1f} {store.index.partitions:>10}"
+                f" {hits / (QUERIES * 5):>8.2f} {reopen_ms:>9.1f}",
+            )
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
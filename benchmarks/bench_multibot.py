@@ -0,0 +1,86 @@
+"""Scaling benchmark: bots x proposals/tick -> ticks/sec for MultiBotArbiter.
+
+Every tick advances the injected clock so locks expire and re-acquire like a
+live gateway. Compares the in-process pass with a process pool. Shipping
+intents and lock tables to workers costs pickling on every tick, so the pool
+only pays off when per-bot arbitration outweighs that (many cores, heavy
+strategies); use the numbers to pick `parallel_min_bots` for a node.
+
+Run with `hatch run python benchmarks/bench_multibot.py`.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+from resobot_gw.agents.multibot import MultiBotArbiter
+from resobot_gw.agents.orchestrator import Intent, Resource, Tier
+
+BOTS = (1, 10, 100, 500)
+PROPOSALS = (10, 100)
+TICK_MS = 50
+SEED = 1234
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now_ms = 0
+
+    def __call__(self) -> int:
+        return self.now_ms
+
+
+def make_workload(bots: int, per_tick: int, rng: random.Random) -> dict[str, list[Intent]]:
+    resources = list(Resource)
+    tiers = list(Tier)
+    return {
+        f"bot{b}": [
+            Intent(
+                agent=f"agent{i}",
+                kind="act",
+                params={},
+                resources=tuple(rng.sample(resources, rng.randint(1, 3))),
+                score=rng.random(),
+                hold_ms=rng.randint(50, 500),
+                tier=rng.choice(tiers),
+            )
+            for i in range(per_tick)
+        ]
+        for b in range(bots)
+    }
+
+
+def ticks_per_sec(workload: dict[str, list[Intent]], executor: Executor | None) -> float:
+    clock = _Clock()
+    multi = MultiBotArbiter(
+        now_ms_fn=clock,
+        executor=executor,
+        parallel_min_bots=2,
+        shards=os.cpu_count() or 4,
+    )
+    total = sum(len(ps) for ps in workload.values())
+    rounds = max(5, 200_000 // max(1, total))
+    start = time.perf_counter()
+    for _ in range(rounds):
+        clock.now_ms += TICK_MS
+        multi.tick(workload)
+    return rounds / (time.perf_counter() - start)
+
+
+def main() -> None:
+    rng = random.Random(SEED)
+    print(f"{'bots':>5} {'props/tick':>10} {'inproc_tps':>11} {'pool_tps':>9}")
+    with ProcessPoolExecutor() as pool:
+        for bots in BOTS:
+            for per_tick in PROPOSALS:
+                workload = make_workload(bots, per_tick, rng)
+                local = ticks_per_sec(workload, None)
+                pooled = ticks_per_sec(workload, pool) if bots > 1 else float("nan")
+                print(f"{bots:>5} {per_tick:>10} {local:>11.1f} {pooled:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
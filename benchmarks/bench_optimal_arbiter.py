@@ -0,0 +1,78 @@
+"""Benchmark: optimal (per-tier set packing) vs. greedy arbitration.
+
+For each proposal count, arbitrates the same seeded proposals on fresh
+arbiters with both strategies and reports the committed utility (sum of
+committed scores), the time per tick, and how often the optimal search hit
+its budget and fell back to greedy.
+
+Run with `hatch run python benchmarks/bench_optimal_arbiter.py`.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+from resobot_gw.agents.orchestrator import Arbiter, Arbitration, Intent, Resource, Tier
+
+SIZES = (5, 10, 30, 100, 1000)
+SEED = 1234
+SAMPLES = 200
+
+
+def make_proposals(n: int, rng: random.Random) -> list[Intent]:
+    resources = list(Resource)
+    tiers = list(Tier)
+    return [
+        Intent(
+            agent=f"agent{i}",
+            kind="act",
+            params={},
+            resources=tuple(rng.sample(resources, rng.randint(1, 3))),
+            score=rng.random(),
+            hold_ms=rng.randint(50, 500),
+            tier=rng.choice(tiers),
+        )
+        for i in range(n)
+    ]
+
+
+def run(
+    strategy: Arbitration,
+    batches: list[list[Intent]],
+    budget_us: int,
+) -> tuple[float, float, int]:
+    """Return (mean utility, mean us per tick, fallbacks)."""
+    arbiters = [
+        Arbiter(now_ms_fn=lambda: 0, strategy=strategy, search_budget_us=budget_us) for _ in batches
+    ]
+    utility = 0.0
+    start = time.perf_counter()
+    results = [arb.tick(batch) for arb, batch in zip(arbiters, batches, strict=True)]
+    elapsed = time.perf_counter() - start
+    for committed in results:
+        utility += sum(i.score for i in committed)
+    fallbacks = sum(arb.search_fallbacks for arb in arbiters)
+    return utility / len(batches), elapsed / len(batches) * 1e6, fallbacks
+
+
+def main() -> None:
+    rng = random.Random(SEED)
+    budget_us = Arbiter().search_budget_us
+    print(f"optimal search budget: {budget_us} us/tick")
+    print(
+        f"{'proposals':>9} {'greedy_util':>11} {'optimal_util':>12} {'gain':>6}"
+        f" {'greedy_us':>9} {'optimal_us':>10} {'fallbacks':>9}",
+    )
+    for n in SIZES:
+        batches = [make_proposals(n, rng) for _ in range(SAMPLES)]
+        g_util, g_us, _ = run(Arbitration.greedy, batches, budget_us)
+        o_util, o_us, fallbacks = run(Arbitration.optimal, batches, budget_us)
+        print(
+            f"{n:>9} {g_util:>11.3f} {o_util:>12.3f} {o_util / g_util - 1:>6.1%}"
+            f" {g_us:>9.1f} {o_us:>10.1f} {fallbacks:>9}",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Time-to-first-commit for `say`: streamed sentences vs. a full response.
+
+A fake streaming model emits a reply token by token after a first-token delay.
+Both variants run through the real pipeline (`OpenAIStreamingProposer` ->
+`Coordinator.pump` -> inbox -> `TickScheduler` at 20 Hz -> commit event); the
+"full" variant only yields the text once the whole reply has streamed, like a
+non-streamed `Runner.run`.
+
+Run with `hatch run python benchmarks/bench_streaming_say.py`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING
+
+from resobot_gw.agents.coordinator import AgentSpec, Coordinator, ReasoningEffort
+from resobot_gw.agents.openai_runner import OpenAIStreamingProposer, TextStreamFn
+from resobot_gw.agents.orchestrator import Arbiter, Tier
+from resobot_gw.bus import Bus, Event
+from resobot_gw.scheduler import TickScheduler
+
+if TYPE_CHECKING:
+    from agents import Agent
+
+REPLY = (
+    "Oh, hi Alice! It's great to see you again. "
+    "I was just looking at the new fountain in the plaza, "
+    "and I think you would really like the lighting at night."
+)
+FIRST_TOKEN_S = 0.25
+TOKEN_INTERVAL_S = 0.02
+CHARS_PER_TOKEN = 4
+RUNS = 10
+SPEC = AgentSpec(
+    name="dialogue_reflex",
+    model="fake",
+    instructions="",
+    reasoning=ReasoningEffort.low,
+    tier=Tier.reflex,
+)
+
+
+async def fake_model(_agent: Agent, _input: str) -> AsyncIterator[str]:
+    await asyncio.sleep(FIRST_TOKEN_S)
+    for i in range(0, len(REPLY), CHARS_PER_TOKEN):
+        yield REPLY[i : i + CHARS_PER_TOKEN]
+        await asyncio.sleep(TOKEN_INTERVAL_S)
+
+
+async def full_response(agent: Agent, run_input: str) -> AsyncIterator[str]:
+    text = "".join([c async for c in fake_model(agent, run_input)])
+    yield text
+
+
+async def first_commit_s(stream_text: TextStreamFn) -> tuple[float, float]:
+    """Seconds from prompt to the first and to the last commit."""
+    loop = asyncio.get_running_loop()
+    bus = Bus()
+    coord = Coordinator(arbiter=Arbiter(), bus=bus)
+    sched = TickScheduler.for_coordinator(coord, (), rate_hz=20.0)
+    start = loop.time()
+    stamps: list[float] = []
+
+    def on_commit(_: Event) -> None:
+        stamps.append(loop.time() - start)
+
+    bus.subscribe("commit", on_commit)
+
+    async def prompts() -> AsyncIterator[str]:
+        await asyncio.sleep(0)
+        yield "Alice waves at you."
+
+    proposer = OpenAIStreamingProposer(SPEC, prompts=prompts, stream_text=stream_text)
+    runner = asyncio.create_task(sched.run())
+    await coord.pump(proposer)
+    await asyncio.sleep(0.1)  # let the last intents reach a tick
+    sched.stop()
+    await runner
+    return stamps[0], stamps[-1]
+
+
+async def main() -> None:
+    print(f"first token {FIRST_TOKEN_S * 1000:.0f} ms, {TOKEN_INTERVAL_S * 1000:.0f} ms/token")
+    for label, fn in (("full", full_response), ("streamed", fake_model)):
+        firsts: list[float] = []
+        lasts: list[float] = []
+        for _ in range(RUNS):
+            first, last = await first_commit_s(fn)
+            firsts.append(first)
+            lasts.append(last)
+        first_ms = statistics.median(firsts) * 1000
+        last_ms = statistics.median(lasts) * 1000
+        print(
+            f"{label:>9}: first commit median {first_ms:6.1f} ms"
+            f" (max {max(firsts) * 1000:6.1f} ms), last commit {last_ms:6.1f} ms",
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
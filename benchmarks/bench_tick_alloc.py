@@ -0,0 +1,91 @@
+"""Allocation benchmark: Intent footprint and memory churned per Arbiter.tick.
+
+Uses tracemalloc to measure (a) bytes retained per constructed `Intent` and
+(b) peak bytes allocated while one `Arbiter.tick` runs, on a fresh arbiter per
+tick, as the number of proposals grows. Timings come from an untraced pass.
+
+Run with `hatch run python benchmarks/bench_tick_alloc.py`.
+"""
+
+from __future__ import annotations
+
+import gc
+import random
+import time
+import tracemalloc
+
+from resobot_gw.agents.orchestrator import Arbiter, Intent, Resource, Tier
+
+SIZES = (10, 100, 1000)
+SEED = 1234
+KINDS = ("say", "look_at", "move_to", "grab", "emote")
+
+
+def make_proposals(n: int, rng: random.Random) -> list[Intent]:
+    resources = list(Resource)
+    tiers = list(Tier)
+    return [
+        Intent(
+            agent=f"agent{i}",
+            kind=rng.choice(KINDS),
+            params={},
+            resources=tuple(rng.sample(resources, rng.randint(1, 3))),
+            score=rng.random(),
+            hold_ms=rng.randint(50, 500),
+            tier=rng.choice(tiers),
+        )
+        for i in range(n)
+    ]
+
+
+def bytes_per_intent(n: int = 10_000) -> float:
+    rng = random.Random(SEED)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        intents = make_proposals(n, rng)
+        used = tracemalloc.get_traced_memory()[0] - base
+    finally:
+        tracemalloc.stop()
+    del intents
+    return used / n
+
+
+def tick_peak_bytes(proposals: list[Intent], rounds: int) -> float:
+    """Mean peak bytes allocated during one tick on a fresh arbiter."""
+    arbiters = [Arbiter(now_ms_fn=lambda: 0) for _ in range(rounds)]
+    total = 0
+    tracemalloc.start()
+    try:
+        for arb in arbiters:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            arb.tick(proposals)
+            total += tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+    return total / rounds
+
+
+def tick_us(proposals: list[Intent], rounds: int) -> float:
+    arbiters = [Arbiter(now_ms_fn=lambda: 0) for _ in range(rounds)]
+    start = time.perf_counter()
+    for arb in arbiters:
+        arb.tick(proposals)
+    return (time.perf_counter() - start) / rounds * 1e6
+
+
+def main() -> None:
+    print(f"bytes per Intent (incl. params dict and resources tuple): {bytes_per_intent():.0f}")
+    rng = random.Random(SEED)
+    print(f"{'proposals':>9} {'peak_bytes/tick':>16} {'us/tick':>8}")
+    for n in SIZES:
+        proposals = make_proposals(n, rng)
+        rounds = max(20, 20_000 // n)
+        peak = tick_peak_bytes(proposals, rounds)
+        print(f"{n:>9} {peak:>16.0f} {tick_us(proposals, rounds):>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
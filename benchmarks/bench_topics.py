@@ -0,0 +1,61 @@
+"""Micro-benchmark: wildcard topic routing with thousands of topics and patterns.
+
+Measures `TopicIndex.match` on a hot (cached) topic and on cold lookups, which
+walk the trie, while the number of subscribed patterns grows.
+
+Run with `hatch run python benchmarks/bench_topics.py`.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+from resobot_gw.bus import Event, TopicIndex
+
+PATTERNS = (10, 1000, 10000)
+TOPICS = 5000
+SEED = 1234
+KINDS = ("commit", "action.done", "perception.user", "slo.breach")
+
+
+def _noop(_: Event) -> None:
+    return None
+
+
+def make_index(patterns: int, bots: list[str], rng: random.Random) -> TopicIndex:
+    index = TopicIndex()
+    for i in range(patterns):
+        bot = rng.choice([*bots, "*"])
+        kind = rng.choice(KINDS)
+        pattern = f"resobot.{bot}.#" if i % 10 == 0 else f"resobot.{bot}.{kind}"
+        index.add(pattern, _noop)
+    return index
+
+
+def per_call_ns(index: TopicIndex, topics: list[str], rounds: int, *, cold: bool) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        if cold:
+            index.add("bench.reset", _noop)  # any change drops the cache
+            index.remove("bench.reset", _noop)
+        for t in topics:
+            index.match(t)
+    return (time.perf_counter() - start) / (rounds * len(topics)) * 1e9
+
+
+def main() -> None:
+    rng = random.Random(SEED)
+    bots = [f"bot{i}" for i in range(TOPICS // len(KINDS))]
+    topics = [f"resobot.{b}.{k}" for b in bots for k in KINDS]
+    print(f"{'patterns':>8} {'topics':>6} {'hot_ns':>8} {'cold_ns':>8}")
+    for n in PATTERNS:
+        index = make_index(n, bots, rng)
+        hot_topic = [topics[0]] * 10_000
+        hot = per_call_ns(index, hot_topic, 20, cold=False)
+        cold = per_call_ns(index, topics, 3, cold=True)
+        print(f"{n:>8} {len(topics):>6} {hot:>8.0f} {cold:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,69 @@
 """Command-line entry for ResoBotGW.
 
-Provides a minimal CLI with a `run` subcommand and `--version` flag.
+Provides a minimal CLI with `run`, `bench` and `replay` subcommands and a
+`--version` flag.
 """
 
 from __future__ import annotations
 
 import argparse
+import json
 import logging
 import sys
+from pathlib import Path
 
 from . import __version__
+from .agents.multibot import ArbiterConfig
+from .agents.orchestrator import Arbitration, Resource, Tier
+from .loadgen import (
+    DEFAULT_RESOURCE_MIX,
+    DEFAULT_TIER_MIX,
+    BenchTarget,
+    WorkloadSpec,
+    generate,
+    run_bench,
+)
+from .replay import LogFormatError, load_log, replay
 from .runtime import GatewayRuntime
 
 
+def _weights(text: str) -> dict[str, float]:
+    """Parse `name=weight,...` into a dict."""
+    out: dict[str, float] = {}
+    for item in text.split(","):
+        name, sep, weight = item.partition("=")
+        try:
+            out[name.strip()] = float(weight) if sep else 1.0
+        except ValueError:
+            msg = f"bad weight in {item!r}"
+            raise argparse.ArgumentTypeError(msg) from None
+    return out
+
+
+def _tier_mix(text: str) -> dict[Tier, float]:
+    try:
+        return {Tier[name]: w for name, w in _weights(text).items()}
+    except KeyError as e:
+        msg = f"unknown tier {e}; choose from {', '.join(t.name for t in Tier)}"
+        raise argparse.ArgumentTypeError(msg) from None
+
+
+def _resource_mix(text: str) -> dict[Resource, float]:
+    try:
+        return {Resource(name): w for name, w in _weights(text).items()}
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from None
+
+
+def _hold_range(text: str) -> tuple[int, int]:
+    lo, _, hi = text.partition(":")
+    try:
+        return int(lo), int(hi or lo)
+    except ValueError:
+        msg = f"expected MIN:MAX milliseconds, got {text!r}"
+        raise argparse.ArgumentTypeError(msg) from None
+
+
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="resobot-gw",
@@ -36,10 +87,142 @@ def _build_parser() -> argparse.ArgumentParser:
         choices=["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG", "NOTSET"],
         help="Logging level",
     )
+    p_run.add_argument(
+        "--metrics-interval",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Log latency histogram summaries at this interval",
+    )
+    p_run.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Serve Prometheus text metrics on this local port",
+    )
+    p_run.add_argument(
+        "--record",
+        type=Path,
+        default=None,
+        metavar="LOG",
+        help="Append every coordinator tick to this replay log (requires a coordinator)",
+    )
+
+    p_bench = subparsers.add_parser(
+        "bench",
+        help="Benchmark the orchestration core on a seeded synthetic workload",
+    )
+    p_bench.add_argument(
+        "--target",
+        action="append",
+        choices=[str(t) for t in BenchTarget],
+        help="Component to drive (repeatable; default: all)",
+    )
+    p_bench.add_argument("--seed", type=int, default=WorkloadSpec.seed)
+    p_bench.add_argument("--proposers", type=int, default=WorkloadSpec.proposers)
+    p_bench.add_argument("--ticks", type=int, default=WorkloadSpec.ticks)
+    p_bench.add_argument("--warmup", type=int, default=WorkloadSpec.warmup_ticks)
+    p_bench.add_argument("--tick-ms", type=int, default=WorkloadSpec.tick_ms)
+    p_bench.add_argument(
+        "--propose-rate",
+        type=float,
+        default=WorkloadSpec.propose_rate,
+        help="Chance each proposer proposes in a tick",
+    )
+    p_bench.add_argument(
+        "--tier-mix",
+        type=_tier_mix,
+        default=None,
+        metavar="TIER=W,...",
+        help="Relative tier weights, e.g. reflex=3,planner=1",
+    )
+    p_bench.add_argument(
+        "--resource-mix",
+        type=_resource_mix,
+        default=None,
+        metavar="RESOURCE=W,...",
+        help="Relative resource weights, e.g. speech=2,head=2,handsL=1",
+    )
+    p_bench.add_argument(
+        "--hold-ms",
+        type=_hold_range,
+        default=WorkloadSpec.hold_ms,
+        metavar="MIN:MAX",
+    )
+    p_bench.add_argument("--max-resources", type=int, default=WorkloadSpec.max_resources)
+    p_bench.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="Write the JSON results here instead of stdout",
+    )
+
+    p_replay = subparsers.add_parser(
+        "replay",
+        help="Feed a recorded log back through the arbiter and compare commits",
+    )
+    p_replay.add_argument("log", type=Path, help="Replay log written by `run --record`")
+    p_replay.add_argument(
+        "--realtime",
+        action="store_true",
+        help="Pace ticks like the recording instead of running flat out",
+    )
+    p_replay.add_argument(
+        "--strategy",
+        choices=[str(a) for a in Arbitration],
+        default=str(ArbiterConfig.strategy),
+        help="Arbitration strategy the log was recorded with",
+    )
+    p_replay.add_argument(
+        "--search-budget-us",
+        type=int,
+        default=ArbiterConfig.search_budget_us,
+        help="Optimal-search budget the log was recorded with",
+    )
 
     return parser
 
 
+def _replay(args: argparse.Namespace) -> int:
+    try:
+        ticks = load_log(args.log)
+    except (OSError, LogFormatError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    config = ArbiterConfig(Arbitration(args.strategy), args.search_budget_us)
+    result = replay(ticks, realtime=args.realtime, config=config)
+    print(json.dumps(result.to_json(), indent=2))
+    return 0 if result.matches else 1
+
+
+def _bench(args: argparse.Namespace) -> int:
+    try:
+        spec = WorkloadSpec(
+            seed=args.seed,
+            proposers=args.proposers,
+            ticks=args.ticks,
+            tick_ms=args.tick_ms,
+            propose_rate=args.propose_rate,
+            hold_ms=args.hold_ms,
+            max_resources=args.max_resources,
+            warmup_ticks=args.warmup,
+            tier_mix=args.tier_mix or DEFAULT_TIER_MIX,
+            resource_mix=args.resource_mix or DEFAULT_RESOURCE_MIX,
+        )
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    workload = generate(spec)
+    targets = args.target or [str(t) for t in BenchTarget]
+    results = [run_bench(BenchTarget(t), workload) for t in targets]
+    text = json.dumps(results, indent=2)
+    if args.output is None:
+        print(text)
+    else:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    return 0
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = _build_parser()
     args = parser.parse_args(argv)
@@ -53,10 +236,20 @@ def main(argv: list[str] | None = None) -> int:
             level=getattr(logging, args.log_level, logging.INFO),
             format="%(levelname)s [cid=%(cid)s] %(name)s: %(message)s",
         )
-        runtime = GatewayRuntime()
+        runtime = GatewayRuntime(
+            metrics_log_interval_s=args.metrics_interval,
+            metrics_port=args.metrics_port,
+            record_path=args.record,
+        )
         # Ensure that the runtime manages the event loop via asyncio.run
         return runtime.start(dry_run=bool(args.dry_run))
 
+    if args.command == "bench":
+        return _bench(args)
+
+    if args.command == "replay":
+        return _replay(args)
+
     parser.print_help()
     return 2
 
@@ -2,18 +2,42 @@
 
 Allows testing inter-agent cooperation by collecting stub intents each tick and
 committing compatible ones via the `Arbiter`. Emits a `commit` event on the Bus.
+
+`tick_async` enforces latency budgets: each proposer gets its spec's budget
+(capped by the coordinator's tick deadline). Proposals that arrive in time are
+arbitrated; late proposers are cancelled or carried into a later tick according
+to their `LatePolicy`, so a slow planner never delays reflex intents. Carried
+work is keyed by agent name; if that agent is missing from a later tick its
+task is cancelled (or, if already finished, dropped) rather than left behind.
+
+Push-style `StreamingProposer`s are pumped into the coordinator's `inbox`
+channel; every tick also arbitrates whatever the inbox holds at its boundary.
+`submit_urgent` skips the boundary entirely for latency-critical intents.
+Holders whose locks are preempted receive a `cancel` event.
+
+An attached `Guardian` filters every proposal, including urgent ones, before
+arbitration; vetoed intents never reach the `Arbiter`.
+
+An attached `TickRecorder` sees every tick boundary: the arbiter clock, all
+proposals that passed the Guardian, and the commits (see `resobot_gw.replay`).
+Urgent intents are recorded as one-proposal ticks.
 """
 
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Iterable, Sequence
-from dataclasses import dataclass
+import time
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Iterable, Sequence
+from dataclasses import dataclass, field
 from enum import StrEnum
 
-from resobot_gw.bus import Bus, Event
+from resobot_gw.bus import Event, Publisher
+from resobot_gw.obs import record, span
 
-from .orchestrator import Arbiter, Intent
+from .guardian import Guardian
+from .ingest import IntentChannel
+from .orchestrator import Arbiter, Intent, Tier
 
 
 class ReasoningEffort(StrEnum):
@@ -24,14 +48,39 @@ class ReasoningEffort(StrEnum):
     high = "high"
 
 
+class LatePolicy(StrEnum):
+    """What happens to a proposer that misses its latency budget."""
+
+    cancel = "cancel"
+    carry = "carry"  # keep running; its proposals join a later tick
+
+
 @dataclass(frozen=True)
 class AgentSpec:
-    """Static configuration for an Agent."""
+    """Static configuration for an Agent.
+
+    - latency_budget_ms: max time a tick waits for this agent (None = tick deadline)
+    - tier: priority tier of the intents this agent proposes
+    """
 
     name: str
     model: str
     instructions: str
     reasoning: ReasoningEffort
+    latency_budget_ms: int | None = None
+    late_policy: LatePolicy = LatePolicy.cancel
+    tier: Tier = Tier.activity
+
+
+@dataclass
+class ProposalStats:
+    """Outcome counters for async proposers across ticks."""
+
+    on_time: int = 0
+    cancelled: int = 0
+    carried: int = 0
+    # carried proposals that completed and were arbitrated in a later tick
+    harvested: int = 0
 
 
 class Proposer:
@@ -54,28 +103,189 @@ class AsyncProposer:
         return ()
 
 
+@dataclass
+class StreamingProposer:
+    """Push-style proposer: yields intents whenever it has them.
+
+    Run it with `Coordinator.pump`; intents join the next tick boundary.
+    """
+
+    spec: AgentSpec
+
+    async def stream(self) -> AsyncIterator[Intent]:  # pragma: no cover - interface stub
+        return
+        yield
+
+
+class TickRecorder(ABC):
+    """Receives each arbitrated tick, e.g. to append it to a replay log."""
+
+    @abstractmethod
+    def record_tick(
+        self,
+        now_ms: int,
+        proposals: Sequence[Intent],
+        committed: Sequence[Intent],
+    ) -> None:
+        raise NotImplementedError
+
+
+# in-flight proposal task -> (proposer, absolute loop-time deadline, carried in)
+_Waiting = dict[asyncio.Task[Iterable[Intent]], tuple[AsyncProposer, float | None, bool]]
+
+
 @dataclass
 class Coordinator:
     arbiter: Arbiter
-    bus: Bus
+    bus: Publisher
     topic_commit: str = "commit"
+    topic_cancel: str = "cancel"
+    # hard cap on how long tick_async waits for any proposer (None = no cap)
+    tick_deadline_ms: int | None = None
+    stats: ProposalStats = field(default_factory=ProposalStats)
+    # in-flight proposals carried over from earlier ticks, keyed by agent name
+    _carried: dict[str, asyncio.Task[Iterable[Intent]]] = field(default_factory=dict)
+    inbox: IntentChannel = field(default_factory=IntentChannel)
+    recorder: TickRecorder | None = None
+    guardian: Guardian | None = None
+    # proposals gathered by the most recent tick, before the Guardian
+    last_proposals: int = field(default=0, init=False)
 
-    def tick(self, proposers: Sequence[Proposer]) -> list[Intent]:
-        proposals: list[Intent] = []
-        for p in proposers:
-            proposals.extend(p.propose())
-        committed = self.arbiter.tick(proposals)
-        if committed:
-            self.bus.publish(Event(topic=self.topic_commit, payload=committed))
+    @property
+    def in_flight(self) -> int:
+        """Carried proposals still owed to a later tick."""
+        return len(self._carried)
+
+    def submit(self, intent: Intent) -> bool:
+        """Push an intent for the next tick boundary."""
+        return self.inbox.submit(intent)
+
+    async def pump(self, proposer: StreamingProposer) -> None:
+        """Forward a streaming proposer's intents into the inbox until it ends."""
+        async for intent in proposer.stream():
+            self.inbox.submit(intent)
+
+    def tick(self, proposers: Sequence[Proposer] = ()) -> list[Intent]:
+        start = time.perf_counter()
+        with span("gather"):
+            proposals: list[Intent] = []
+            for p in proposers:
+                proposals.extend(p.propose())
+        proposals.extend(self.inbox.drain())
+        return self._finish_tick(proposals, start)
+
+    async def tick_async(self, proposers: Sequence[AsyncProposer] = ()) -> list[Intent]:
+        start = time.perf_counter()
+        with span("gather"):
+            proposals = await self._gather(proposers)
+        # drain after gathering so intents pushed meanwhile join this boundary
+        proposals.extend(self.inbox.drain())
+        return self._finish_tick(proposals, start)
+
+    def submit_urgent(self, intent: Intent) -> bool:
+        """Arbitrate `intent` immediately against current locks and publish.
+
+        For reflex/safety intents that cannot wait for the next tick boundary.
+        Runs as a one-proposal tick: Guardian, △ rules, and recorder included.
+        """
+        committed = self._arbitrate([intent])
+        if not committed:
+            return False
+        self._commit(committed)
+        return True
+
+    def _finish_tick(self, proposals: list[Intent], start: float) -> list[Intent]:
+        """Arbitrate and publish a gathered tick, timing it from `start`."""
+        with span("arbitrate"):
+            committed = self._arbitrate(proposals)
+        self._commit(committed)
+        elapsed = time.perf_counter() - start
+        for intent in committed:
+            record("tick_to_commit", elapsed, kind=intent.kind)
         return committed
 
-    async def tick_async(self, proposers: Sequence[AsyncProposer]) -> list[Intent]:
-        proposals: list[Intent] = []
-        async with asyncio.TaskGroup() as tg:
-            tasks = [tg.create_task(p.propose()) for p in proposers]
-        for t in tasks:
-            proposals.extend(list(t.result()))
-        committed = self.arbiter.tick(proposals)
-        if committed:
-            self.bus.publish(Event(topic=self.topic_commit, payload=committed))
+    def _arbitrate(self, proposals: list[Intent]) -> list[Intent]:
+        self.last_proposals = len(proposals)
+        if self.guardian is not None:
+            with span("guardian"):
+                proposals = self.guardian.filter(proposals)
+        if self.recorder is None:
+            return self.arbiter.tick(proposals)
+        now = self.arbiter.now_ms_fn()
+        committed = self.arbiter.tick_at(now, proposals)
+        self.recorder.record_tick(now, proposals, committed)
+        return committed
+
+    def _commit(self, committed: list[Intent]) -> list[Intent]:
+        with span("publish"):
+            for preemption in self.arbiter.pop_preempted():
+                self.bus.publish(Event(topic=self.topic_cancel, payload=preemption))
+            if committed:
+                self.bus.publish(Event(topic=self.topic_commit, payload=committed))
         return committed
+
+    def _budget_ms(self, spec: AgentSpec) -> int | None:
+        budgets = [b for b in (spec.latency_budget_ms, self.tick_deadline_ms) if b is not None]
+        return min(budgets, default=None)
+
+    async def _gather(self, proposers: Sequence[AsyncProposer]) -> list[Intent]:
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        self._reap_carried({p.spec.name for p in proposers})
+        waiting: _Waiting = {}
+        for p in proposers:
+            task = self._carried.pop(p.spec.name, None)
+            carried_in = task is not None
+            if task is None:
+                task = loop.create_task(p.propose())
+            budget = self._budget_ms(p.spec)
+            deadline = None if budget is None else start + budget / 1000
+            waiting[task] = (p, deadline, carried_in)
+
+        proposals: list[Intent] = []
+        try:
+            while waiting:
+                deadlines = [d for _, d, _ in waiting.values() if d is not None]
+                timeout = max(0.0, min(deadlines) - loop.time()) if deadlines else None
+                done, _ = await asyncio.wait(
+                    waiting,
+                    timeout=timeout,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for t in done:
+                    p, _, carried_in = waiting.pop(t)
+                    proposals.extend(t.result())
+                    record("propose", loop.time() - start, agent=p.spec.name)
+                    if carried_in:
+                        self.stats.harvested += 1
+                    else:
+                        self.stats.on_time += 1
+                self._handle_late(waiting, loop.time())
+        except BaseException:
+            for t in waiting:
+                t.cancel()
+            raise
+        return proposals
+
+    def _reap_carried(self, names: set[str]) -> None:
+        """Drop carried tasks whose proposer is absent from this tick."""
+        for name in self._carried.keys() - names:
+            task = self._carried.pop(name)
+            if task.done():
+                if not task.cancelled():
+                    task.exception()  # retrieved, so asyncio does not log it
+            else:
+                task.cancel()
+            self.stats.cancelled += 1
+
+    def _handle_late(self, waiting: _Waiting, now: float) -> None:
+        for t, (p, deadline, _) in list(waiting.items()):
+            if deadline is None or deadline > now or t.done():
+                continue
+            del waiting[t]
+            if p.spec.late_policy is LatePolicy.carry:
+                self._carried[p.spec.name] = t
+                self.stats.carried += 1
+            else:
+                t.cancel()
+                self.stats.cancelled += 1
@@ -0,0 +1,235 @@
+"""Vectorized engagement scoring for multi-user turn taking.
+
+Implements the orchestration spec's engagement score
+
+    E = a*proximity + b*utterance freshness + c*mention + d*gaze crossing
+
+with round-robin-with-salience: the most engaged user is addressed, but the
+user who got the previous reply is damped per consecutive reply (streak
+penalty), and hard-suppressed while the recent same-user repeat rate is at the
+AC-3 cap (< 60% consecutive replies to one user).
+
+Features live in NumPy columns indexed by a per-user slot, so one pass scores
+every user. Freshness, mention, and gaze decay exponentially; decay is applied
+incrementally for the time elapsed since the previous pass rather than
+recomputed from event history. `TurnTaker` turns the top score into its
+`say` intent's score.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from resobot_gw.bus import Event
+
+from .coordinator import AsyncProposer
+from .orchestrator import Intent, Resource
+
+# feature columns
+_PROX, _FRESH, _MENTION, _GAZE = range(4)
+_DECAYING = slice(_FRESH, _GAZE + 1)
+
+
+@dataclass(frozen=True)
+class EngagementWeights:
+    """Weights, decay, and fairness settings.
+
+    - a..d: feature weights (sum to 1 keeps E in [0, 1])
+    - half_life_s: per decaying feature (freshness, mention, gaze)
+    - proximity_range_m: distance at which proximity reaches 0
+    - streak_penalty: multiplicative damping per consecutive reply to one user
+    - max_repeat_rate / repeat_window: AC-3 cap over the last N replies
+    """
+
+    a: float = 0.3
+    b: float = 0.3
+    c: float = 0.25
+    d: float = 0.15
+    half_life_s: tuple[float, float, float] = (4.0, 8.0, 2.0)
+    proximity_range_m: float = 8.0
+    streak_penalty: float = 0.35
+    max_repeat_rate: float = 0.5
+    repeat_window: int = 12
+
+
+class EngagementModel:
+    """Per-user engagement features in NumPy columns, scored in one pass."""
+
+    def __init__(
+        self,
+        weights: EngagementWeights | None = None,
+        *,
+        capacity: int = 64,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.weights = w = weights or EngagementWeights()
+        self._clock = clock
+        self._w = np.array([w.a, w.b, w.c, w.d])
+        # per-second retention of each decaying column: 0.5 ** (1 / half_life)
+        self._ln_keep = np.array([math.log(0.5) / h for h in w.half_life_s])
+        self._x = np.zeros((capacity, 4))
+        self._active = np.zeros(capacity, dtype=bool)
+        self._slot: dict[str, int] = {}
+        self._users: list[str | None] = [None] * capacity
+        self._free: list[int] = list(range(capacity - 1, -1, -1))
+        self._decayed_at = clock()
+        self._last: str | None = None
+        self._streak = 0
+        self._repeats: deque[bool] = deque(maxlen=w.repeat_window)
+
+    def __len__(self) -> int:
+        return len(self._slot)
+
+    @property
+    def users(self) -> list[str]:
+        return list(self._slot)
+
+    def add(self, user: str) -> None:
+        if user in self._slot:
+            return
+        if not self._free:
+            self._grow()
+        i = self._free.pop()
+        self._slot[user] = i
+        self._users[i] = user
+        self._x[i] = 0.0
+        self._active[i] = True
+
+    def remove(self, user: str) -> None:
+        i = self._slot.pop(user, None)
+        if i is None:
+            return
+        self._active[i] = False
+        self._users[i] = None
+        self._free.append(i)
+
+    def _grow(self) -> None:
+        n = len(self._x)
+        self._x = np.concatenate([self._x, np.zeros((n, 4))])
+        self._active = np.concatenate([self._active, np.zeros(n, dtype=bool)])
+        self._users.extend([None] * n)
+        self._free.extend(range(2 * n - 1, n - 1, -1))
+
+    def _row(self, user: str) -> int:
+        self.add(user)
+        return self._slot[user]
+
+    # -- observations ---------------------------------------------------------
+
+    def distance(self, user: str, meters: float) -> None:
+        prox = 1.0 - meters / self.weights.proximity_range_m
+        i = self._row(user)  # may grow (replace) the arrays
+        self._x[i, _PROX] = min(1.0, max(0.0, prox))
+
+    def utterance(self, user: str) -> None:
+        self._touch(user, _FRESH)
+
+    def mention(self, user: str) -> None:
+        self._touch(user, _MENTION)
+
+    def gaze(self, user: str) -> None:
+        self._touch(user, _GAZE)
+
+    def _touch(self, user: str, col: int) -> None:
+        self._decay()  # keep columns consistent before resetting one entry
+        i = self._row(user)
+        self._x[i, col] = 1.0
+
+    def replied(self, user: str) -> None:
+        """Record that a reply went to `user` (drives the fairness terms)."""
+        repeat = user == self._last
+        self._repeats.append(repeat)
+        self._streak = self._streak + 1 if repeat else 1
+        self._last = user
+
+    @property
+    def repeat_rate(self) -> float:
+        """Share of recent replies that went to the same user as the one before."""
+        return sum(self._repeats) / len(self._repeats) if self._repeats else 0.0
+
+    # -- scoring ------------------------------------------------------------
+
+    def _decay(self) -> None:
+        now = self._clock()
+        dt = now - self._decayed_at
+        if dt > 0:
+            self._x[:, _DECAYING] *= np.exp(self._ln_keep * dt)
+            self._decayed_at = now
+
+    def scores(self) -> np.ndarray:
+        """Engagement with fairness applied, per slot (inactive slots are -inf)."""
+        self._decay()
+        e = self._x @ self._w
+        last = self._slot.get(self._last) if self._last is not None else None
+        if last is not None:
+            w = self.weights
+            e[last] *= (1.0 - w.streak_penalty) ** self._streak
+            if self.repeat_rate >= w.max_repeat_rate and len(self._slot) > 1:
+                e[last] = -1.0  # AC-3: someone else goes next
+        e[~self._active] = -np.inf
+        return e
+
+    def ranking(self) -> list[tuple[str, float]]:
+        e = self.scores()
+        order = np.argsort(-e[self._active], kind="stable")
+        slots = np.flatnonzero(self._active)[order]
+        return [(self._users[i] or "", float(e[i])) for i in slots]
+
+    def pick(self) -> tuple[str, float] | None:
+        """Most engaged user and their score, or None without users."""
+        if not self._slot:
+            return None
+        e = self.scores()
+        i = int(np.argmax(e))
+        return self._users[i] or "", max(0.0, float(e[i]))
+
+
+@dataclass
+class TurnTaker(AsyncProposer):
+    """Proposes one `say` to the most engaged user, scored by engagement.
+
+    - compose: reply text for a user (e.g. an agent run); None skips the turn
+    - min_score: below this engagement nobody is addressed
+    - ms_per_char: speaking-time estimate for the intent's hold
+
+    Subscribe `on_commit` to the commit topic so only committed replies count
+    toward the streak and repeat-rate terms.
+    """
+
+    engagement: EngagementModel = field(kw_only=True)
+    compose: Callable[[str], Awaitable[str | None]] = field(kw_only=True)
+    min_score: float = 0.05
+    ms_per_char: int = 60
+
+    async def propose(self) -> Iterable[Intent]:
+        pick = self.engagement.pick()
+        if pick is None or pick[1] < self.min_score:
+            return ()
+        user, score = pick
+        text = await self.compose(user)
+        if not text:
+            return ()
+        intent = Intent(
+            agent=self.spec.name,
+            kind="say",
+            params={"text": text, "to": user},
+            resources=(Resource.speech,),
+            score=score,
+            hold_ms=len(text) * self.ms_per_char,
+            tier=self.spec.tier,
+        )
+        return (intent,)
+
+    def on_commit(self, event: Event) -> None:
+        committed = event.payload if isinstance(event.payload, list) else ()
+        for intent in committed:
+            if isinstance(intent, Intent) and intent.agent == self.spec.name:
+                to = intent.params.get("to")
+                if isinstance(to, str):
+                    self.engagement.replied(to)
@@ -0,0 +1,236 @@
+"""Guardian: the always-on Safety/Policy stage in front of the Arbiter.
+
+`PolicyRule`s are scoped by intent kind and by resource. `PolicyIndex`
+compiles them up front into a table per kind, indexed by resource mask, so a
+proposal only meets the rules that can apply to it and finding them is two
+lookups however many rules exist. A rule returns the intent (params possibly
+amended) or a `Veto`; vetoed intents never reach arbitration and are published
+as `Vetoed` events carrying the rule, reason, and detail (AC-4). A rule that
+raises, or amends more than params, vetoes too: the stage fails closed.
+
+`Guardian.filter` runs before `Arbiter.tick` when attached to a `Coordinator`
+and keeps per-rule call/veto counters and latency (`RuleStats`, plus the
+`policy_rule` span histogram when metrics are enabled). The spec's 50 ms
+budget is checked per call; overruns are logged and counted.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Container, Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+
+from resobot_gw.bus import Event, Publisher
+from resobot_gw.obs import record
+
+from .orchestrator import Intent, Resource, resource_mask
+
+logger = logging.getLogger(__name__)
+
+_MASKS = 1 << len(Resource)
+
+
+@dataclass(frozen=True)
+class Veto:
+    """A rule's refusal: why, plus structured detail for the veto event."""
+
+    reason: str
+    detail: Mapping[str, object] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class Vetoed:
+    """Veto event payload."""
+
+    intent: Intent
+    rule: str
+    reason: str
+    detail: Mapping[str, object]
+
+
+class PolicyRule(ABC):
+    """A Guardian check, scoped so it only sees intents it can apply to.
+
+    - name: label for stats, metrics, and veto events (unique per Guardian)
+    - kinds: intent kinds checked (empty = every kind)
+    - resources: checked when the intent needs any of these (empty = any)
+
+    `check` returns the intent, a copy with amended params, or a `Veto`.
+    """
+
+    name: str
+    kinds: frozenset[str] = frozenset()
+    resources: frozenset[Resource] = frozenset()
+
+    @abstractmethod
+    def check(self, intent: Intent) -> Intent | Veto:
+        raise NotImplementedError
+
+
+@dataclass(eq=False)
+class PrivateObjectRule(PolicyRule):
+    """AC-4: veto manipulating an object listed in `private`.
+
+    The object is `params[key]`; `private` may be a live set that the world
+    model keeps up to date.
+    """
+
+    private: Container[str] = frozenset()
+    key: str = "object"
+    name: str = "private_object"
+    kinds: frozenset[str] = frozenset({"grab", "release", "use"})
+    resources: frozenset[Resource] = frozenset()
+
+    def check(self, intent: Intent) -> Intent | Veto:
+        obj = intent.params.get(self.key)
+        if obj is None or str(obj) not in self.private:
+            return intent
+        return Veto(
+            f"{obj} is a private object",
+            {"object": obj, "agent": intent.agent, "kind": intent.kind},
+        )
+
+
+class PolicyIndex:
+    """Rules compiled by kind and resource mask.
+
+    `rules_for(intent)` returns, in registration order, the rules whose kinds
+    and resources both match the intent, without scanning the others.
+    """
+
+    __slots__ = ("_any", "_by_kind", "rules")
+
+    def __init__(self, rules: Sequence[PolicyRule]) -> None:
+        names = [r.name for r in rules]
+        if len(set(names)) != len(names):
+            msg = f"policy rule names must be unique: {names}"
+            raise ValueError(msg)
+        self.rules = tuple(rules)
+        kinds = {k for r in rules for k in r.kinds}
+        self._by_kind = {
+            k: self._compile([r for r in rules if not r.kinds or k in r.kinds]) for k in kinds
+        }
+        self._any = self._compile([r for r in rules if not r.kinds])
+
+    @staticmethod
+    def _compile(rules: list[PolicyRule]) -> tuple[tuple[PolicyRule, ...], ...]:
+        scoped = [(r, resource_mask(r.resources)) for r in rules]
+        return tuple(tuple(r for r, m in scoped if not m or m & mask) for mask in range(_MASKS))
+
+    def rules_for(self, intent: Intent) -> tuple[PolicyRule, ...]:
+        return self._by_kind.get(intent.kind, self._any)[intent.mask]
+
+
+@dataclass
+class RuleStats:
+    """Per-rule counters; `total_ns`/`max_ns` time `check` calls."""
+
+    calls: int = 0
+    vetoes: int = 0
+    amended: int = 0
+    errors: int = 0
+    total_ns: int = 0
+    max_ns: int = 0
+
+    @property
+    def mean_us(self) -> float:
+        return self.total_ns / self.calls / 1e3 if self.calls else 0.0
+
+
+@dataclass
+class Guardian:
+    """Pre-arbitration policy filter.
+
+    - bus: receives a `Vetoed` event on `topic_veto` for every veto
+    - budget_ms: `filter`/`check` calls slower than this are logged and
+      counted in `overruns`
+    """
+
+    rules: Sequence[PolicyRule] = ()
+    bus: Publisher | None = None
+    topic_veto: str = "veto"
+    budget_ms: float = 50.0
+    overruns: int = field(default=0, init=False)
+    stats: dict[str, RuleStats] = field(init=False)
+    _index: PolicyIndex = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._index = PolicyIndex(self.rules)
+        self.stats = {r.name: RuleStats() for r in self._index.rules}
+
+    def check(self, intent: Intent) -> Intent | None:
+        """Run the applicable rules; returns the (maybe amended) intent or None if vetoed."""
+        start = time.perf_counter_ns()
+        out = self._check(intent)
+        self._check_budget(time.perf_counter_ns() - start, 1)
+        return out
+
+    def filter(self, proposals: Iterable[Intent]) -> list[Intent]:
+        """Drop vetoed proposals and apply amendments, keeping order."""
+        start = time.perf_counter_ns()
+        out: list[Intent] = []
+        n = 0
+        for intent in proposals:
+            n += 1
+            checked = self._check(intent)
+            if checked is not None:
+                out.append(checked)
+        self._check_budget(time.perf_counter_ns() - start, n)
+        return out
+
+    def _check(self, intent: Intent) -> Intent | None:
+        for rule in self._index.rules_for(intent):
+            stats = self.stats[rule.name]
+            start = time.perf_counter_ns()
+            try:
+                result = rule.check(intent)
+            except Exception as exc:
+                logger.exception("policy rule %s failed on %s", rule.name, intent.kind)
+                stats.errors += 1
+                result = Veto(f"rule error: {exc!r}", {"agent": intent.agent, "kind": intent.kind})
+            else:
+                if not isinstance(result, Veto) and (
+                    result.mask != intent.mask or result.kind != intent.kind
+                ):
+                    logger.error(
+                        "policy rule %s changed %s's kind or resources",
+                        rule.name,
+                        intent.kind,
+                    )
+                    stats.errors += 1
+                    result = Veto(
+                        "bad amendment: rules may amend params, not kind or resources",
+                        {"agent": intent.agent, "kind": intent.kind, "amended_kind": result.kind},
+                    )
+            elapsed = time.perf_counter_ns() - start
+            stats.calls += 1
+            stats.total_ns += elapsed
+            stats.max_ns = max(stats.max_ns, elapsed)
+            record("policy_rule", elapsed / 1e9, rule=rule.name)
+            if isinstance(result, Veto):
+                stats.vetoes += 1
+                self._publish(intent, rule, result)
+                return None
+            if result is not intent:
+                stats.amended += 1
+                intent = result
+        return intent
+
+    def _publish(self, intent: Intent, rule: PolicyRule, veto: Veto) -> None:
+        logger.info("veto %s/%s by %s: %s", intent.agent, intent.kind, rule.name, veto.reason)
+        if self.bus is not None:
+            payload = Vetoed(intent, rule.name, veto.reason, veto.detail)
+            self.bus.publish(Event(topic=self.topic_veto, payload=payload))
+
+    def _check_budget(self, elapsed_ns: int, proposals: int) -> None:
+        elapsed_ms = elapsed_ns / 1e6
+        if elapsed_ms > self.budget_ms:
+            self.overruns += 1
+            logger.warning(
+                "guardian took %.1fms for %d proposals (budget %.0fms)",
+                elapsed_ms,
+                proposals,
+                self.budget_ms,
+            )
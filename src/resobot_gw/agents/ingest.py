@@ -0,0 +1,55 @@
+"""Streaming intent ingestion.
+
+Proposers push intents into an `IntentChannel` whenever they have them; the
+Coordinator drains whatever has arrived at each tick boundary. Nothing waits
+for a gather round, so the slowest proposer no longer sets the pace.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+
+from .orchestrator import Intent
+
+
+class IntentChannel:
+    """Multi-producer inbox drained at tick boundaries.
+
+    `submit` is a single deque append, which is atomic under the GIL, so
+    producers on any task or thread can push without locks. `on_submit` is
+    called after each accepted intent from the submitting thread; wrap it with
+    `loop.call_soon_threadsafe` for threads (`TickScheduler.for_coordinator`
+    installs one that does).
+
+    - capacity: max buffered intents; further submits are dropped and counted
+    """
+
+    def __init__(
+        self,
+        *,
+        capacity: int | None = None,
+        on_submit: Callable[[], None] | None = None,
+    ) -> None:
+        self._queue: deque[Intent] = deque()
+        self.capacity = capacity
+        self.on_submit = on_submit
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def submit(self, intent: Intent) -> bool:
+        """Buffer `intent` for the next tick; False if dropped for capacity."""
+        if self.capacity is not None and len(self._queue) >= self.capacity:
+            self.dropped += 1
+            return False
+        self._queue.append(intent)
+        if self.on_submit is not None:
+            self.on_submit()
+        return True
+
+    def drain(self) -> list[Intent]:
+        """Take every intent that arrived before this call, in arrival order."""
+        q = self._queue
+        return [q.popleft() for _ in range(len(q))]
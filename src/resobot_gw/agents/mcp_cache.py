@@ -0,0 +1,193 @@
+"""Result cache for read-only MCP tool calls.
+
+Perception agents poll the same ResoBotMCP world queries many times a second.
+`ToolResultCache` keeps results per (tool, arguments) for a per-tool TTL, shares
+one in-flight call between concurrent identical requests, and drops entries
+when invalidating bus topics fire (e.g. a world change). Only tools listed in
+`ttls` are cached; every other call, and any error result, passes through.
+
+`CachingMCPServer` wraps a connected server (typically a session borrowed from
+`MCPSessionPool`) so agents use the cache transparently. The cache is keyed by
+tool and arguments only, so one cache should front one backend.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Mapping
+from typing import TYPE_CHECKING, Any, cast
+
+from agents.mcp import MCPServer  # type: ignore[import-not-found]
+
+from resobot_gw.bus import Bus, Event
+from resobot_gw.cache import AsyncTTLCache, CacheStats
+from resobot_gw.obs import span
+
+if TYPE_CHECKING:
+    from agents import AgentBase, RunContextWrapper  # type: ignore[import-not-found]
+    from mcp.types import (  # type: ignore[import-not-found]
+        CallToolResult,
+        GetPromptResult,
+        ListPromptsResult,
+        Tool,
+    )
+
+ToolKey = tuple[str, str]  # (tool name, canonical JSON arguments)
+
+
+class _UncachedError(Exception):
+    """Carries an error result past the cache so it is never stored."""
+
+    def __init__(self, result: CallToolResult) -> None:
+        super().__init__("uncached tool error result")
+        self.result = result
+
+
+def _result_size(value: object) -> int:
+    return len(cast("CallToolResult", value).model_dump_json())
+
+
+class ToolResultCache:
+    """TTL/LRU cache of tool results with coalescing and topic invalidation.
+
+    - ttls: tool name -> seconds; tools not listed are never cached
+    - invalidate_on: bus topic pattern -> tools whose entries it drops
+    - max_entries / max_bytes: LRU caps (bytes measured as result JSON length)
+    """
+
+    def __init__(
+        self,
+        ttls: Mapping[str, float],
+        *,
+        invalidate_on: Mapping[str, Iterable[str]] | None = None,
+        max_entries: int = 512,
+        max_bytes: int | None = 8 * 1024 * 1024,
+    ) -> None:
+        self._ttls = dict(ttls)
+        self._invalidate_on = {p: frozenset(ts) for p, ts in (invalidate_on or {}).items()}
+        self._cache = AsyncTTLCache(
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            sizeof=_result_size,
+        )
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._cache.stats
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def ttl_for(self, tool_name: str) -> float | None:
+        return self._ttls.get(tool_name)
+
+    async def call(
+        self,
+        server: MCPServer,
+        tool_name: str,
+        arguments: dict[str, Any] | None,
+        meta: dict[str, Any] | None = None,
+    ) -> CallToolResult:
+        """Call `tool_name` on `server`, served from cache when allowed."""
+        with span("mcp_call", tool=tool_name):
+            return await self._call(server, tool_name, arguments, meta)
+
+    async def _call(
+        self,
+        server: MCPServer,
+        tool_name: str,
+        arguments: dict[str, Any] | None,
+        meta: dict[str, Any] | None,
+    ) -> CallToolResult:
+        ttl = self._ttls.get(tool_name)
+        if ttl is None:
+            return await server.call_tool(tool_name, arguments, meta)
+        key: ToolKey = (tool_name, json.dumps(arguments or {}, sort_keys=True, default=str))
+
+        async def load() -> CallToolResult:
+            result = await server.call_tool(tool_name, arguments, meta)
+            if result.is_error:
+                raise _UncachedError(result)
+            return result
+
+        try:
+            return cast("CallToolResult", await self._cache.get_or_load(key, load, ttl))
+        except _UncachedError as e:
+            return e.result
+
+    def invalidate(self, tool_names: Iterable[str] | None = None) -> int:
+        """Drop entries for `tool_names` (all tools when None)."""
+        if tool_names is None:
+            n = len(self._cache)
+            self._cache.clear()
+            return n
+        names = frozenset(tool_names)
+        return self._cache.invalidate_where(lambda k: cast("ToolKey", k)[0] in names)
+
+    def bind(self, bus: Bus) -> None:
+        """Subscribe to every `invalidate_on` pattern on `bus`."""
+        for pattern, tools in self._invalidate_on.items():
+
+            def on_event(_: Event, tools: frozenset[str] = tools) -> None:
+                self.invalidate(tools)
+
+            bus.subscribe(pattern, on_event)
+
+    def wrap(self, server: MCPServer) -> CachingMCPServer:
+        return CachingMCPServer(server, self)
+
+
+class CachingMCPServer(MCPServer):
+    """Delegates to a connected server, routing tool calls through a cache."""
+
+    def __init__(self, inner: MCPServer, cache: ToolResultCache) -> None:
+        super().__init__(use_structured_content=inner.use_structured_content)
+        self._inner = inner
+        self._tool_cache = cache
+        # keep the inner server's approval, error, and meta behaviour; these
+        # attributes track the SDK release pinned in pyproject.toml
+        self._needs_approval_policy = inner._needs_approval_policy  # noqa: SLF001
+        self._failure_error_function = inner._failure_error_function  # noqa: SLF001
+        self.tool_meta_resolver = inner.tool_meta_resolver
+        self.custom_data_extractor = inner.custom_data_extractor
+        self.tool_input_guardrails = inner.tool_input_guardrails
+        self.tool_output_guardrails = inner.tool_output_guardrails
+
+    @property
+    def name(self) -> str:
+        return self._inner.name
+
+    @property
+    def inner(self) -> MCPServer:
+        return self._inner
+
+    async def connect(self) -> None:
+        await self._inner.connect()
+
+    async def cleanup(self) -> None:
+        await self._inner.cleanup()
+
+    async def list_tools(
+        self,
+        run_context: RunContextWrapper[Any] | None = None,
+        agent: AgentBase | None = None,
+    ) -> list[Tool]:
+        return await self._inner.list_tools(run_context, agent)
+
+    async def call_tool(
+        self,
+        tool_name: str,
+        arguments: dict[str, Any] | None,
+        meta: dict[str, Any] | None = None,
+    ) -> CallToolResult:
+        return await self._tool_cache.call(self._inner, tool_name, arguments, meta)
+
+    async def list_prompts(self) -> ListPromptsResult:
+        return await self._inner.list_prompts()
+
+    async def get_prompt(
+        self,
+        name: str,
+        arguments: dict[str, Any] | None = None,
+    ) -> GetPromptResult:
+        return await self._inner.get_prompt(name, arguments)
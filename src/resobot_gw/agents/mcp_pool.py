@@ -0,0 +1,217 @@
+"""Pool of warm MCP server sessions shared by concurrent agents.
+
+Spawning an MCP stdio server and completing its handshake costs far more than a
+tool call, and a single pipe serializes every agent behind it. The pool keeps
+`size` connected sessions; agents borrow one per run, so Dialogue, Gaze, and
+Planner proceed in parallel on separate pipes.
+
+Each slot is owned by a keeper task that connects, waits, and cleans up its
+server; MCP clients must be torn down in the task that connected them. Borrowers
+health-check a session (`list_tools`) when its last check is older than
+`check_interval_s`, or after a run raised or was cancelled, and a failed check
+makes the keeper respawn it. A keeper gives up after `ConnectRetry.attempts` consecutive failed
+connects; `start` then raises the last connect error, and borrowers of that
+slot get a RuntimeError.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Self
+
+from resobot_gw.obs import span
+
+if TYPE_CHECKING:
+    from agents.mcp import MCPServer  # type: ignore[import-not-found]
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MCPPoolStats:
+    borrows: int = 0
+    waits: int = 0  # borrows that found no idle session
+    health_checks: int = 0
+    unhealthy: int = 0
+    respawns: int = 0
+    connect_failures: int = 0
+
+
+@dataclass(frozen=True)
+class ConnectRetry:
+    """How a keeper retries a failed connect.
+
+    - delay_s: pause between attempts
+    - attempts: consecutive failures before the slot gives up
+    """
+
+    delay_s: float = 1.0
+    attempts: int = 5
+
+    def __post_init__(self) -> None:
+        if self.attempts < 1:
+            raise ValueError("attempts must be positive")
+
+
+class _Slot:
+    def __init__(self) -> None:
+        self.server: MCPServer | None = None
+        self.ready = asyncio.Event()
+        self.restart = asyncio.Event()
+        self.checked_at = float("-inf")
+        self.task: asyncio.Task[None] | None = None
+        self.error: Exception | None = None  # last connect error once the keeper gave up
+
+
+class MCPSessionPool:
+    """Keeps `size` connected MCP servers built by `factory`.
+
+    Use `async with pool:` (or `start()`/`aclose()`), then borrow with
+    `async with pool.session() as server:`.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], MCPServer],
+        *,
+        size: int = 2,
+        check_interval_s: float = 30.0,
+        check_timeout_s: float = 5.0,
+        retry: ConnectRetry | None = None,
+    ) -> None:
+        if size < 1:
+            raise ValueError("size must be positive")
+        self._factory = factory
+        self._size = size
+        self._check_interval_s = check_interval_s
+        self._check_timeout_s = check_timeout_s
+        self._retry = retry or ConnectRetry()
+        self._slots: list[_Slot] = []
+        self._idle: asyncio.Queue[_Slot] = asyncio.Queue()
+        self._closing = False
+        self.stats = MCPPoolStats()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.aclose()
+
+    async def start(self) -> None:
+        """Spawn every session and wait until all are connected.
+
+        If a session gives up connecting, the pool is closed and its last
+        connect error is raised.
+        """
+        loop = asyncio.get_running_loop()
+        for _ in range(self._size):
+            slot = _Slot()
+            slot.task = loop.create_task(self._keep(slot))
+            self._slots.append(slot)
+            self._idle.put_nowait(slot)
+        await asyncio.gather(*(s.ready.wait() for s in self._slots))
+        failed = next((s.error for s in self._slots if s.error is not None), None)
+        if failed is not None:
+            await self.aclose()
+            raise failed
+
+    async def aclose(self) -> None:
+        self._closing = True
+        for slot in self._slots:
+            slot.restart.set()
+        await asyncio.gather(*(s.task for s in self._slots if s.task is not None))
+        self._slots.clear()
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[MCPServer]:
+        """Borrow a healthy session for the duration of the block.
+
+        Yields:
+            A connected server; it returns to the pool when the block exits.
+
+        """
+        if self._idle.empty():
+            self.stats.waits += 1
+        with span("mcp_borrow"):
+            slot = await self._idle.get()
+        self.stats.borrows += 1
+        try:
+            yield await self._healthy(slot)
+        except BaseException:
+            # the failure (or a cancelled call) may have broken the pipe; verify
+            # before the next borrower
+            slot.checked_at = float("-inf")
+            raise
+        finally:
+            self._idle.put_nowait(slot)
+
+    async def _healthy(self, slot: _Slot) -> MCPServer:
+        loop = asyncio.get_running_loop()
+        while True:
+            await slot.ready.wait()
+            server = slot.server
+            if server is None:
+                if slot.error is not None:
+                    raise RuntimeError("MCP session could not connect") from slot.error
+                raise RuntimeError("MCP session pool is closed")
+            if loop.time() - slot.checked_at < self._check_interval_s:
+                return server
+            if await self._ping(server):
+                slot.checked_at = loop.time()
+                return server
+            slot.ready.clear()
+            slot.restart.set()
+
+    async def _ping(self, server: MCPServer) -> bool:
+        self.stats.health_checks += 1
+        try:
+            await asyncio.wait_for(server.list_tools(), self._check_timeout_s)
+        except Exception:
+            logger.exception("MCP session %s failed its health check", server.name)
+            self.stats.unhealthy += 1
+            return False
+        return True
+
+    async def _keep(self, slot: _Slot) -> None:
+        loop = asyncio.get_running_loop()
+        first = True
+        failures = 0
+        while not self._closing:
+            server = self._factory()
+            try:
+                await server.connect()
+            except Exception as e:
+                self.stats.connect_failures += 1
+                failures += 1
+                if failures >= self._retry.attempts:
+                    logger.exception("MCP session connect failed %d times; giving up", failures)
+                    slot.error = e
+                    break
+                logger.exception("MCP session connect failed; retrying")
+                await asyncio.sleep(self._retry.delay_s)
+                continue
+            failures = 0
+            if not first:
+                self.stats.respawns += 1
+            first = False
+            slot.server = server
+            slot.checked_at = loop.time()
+            slot.ready.set()
+            await slot.restart.wait()
+            slot.ready.clear()
+            slot.restart.clear()
+            try:
+                await server.cleanup()
+            except Exception:
+                logger.exception("MCP session cleanup failed")
+        slot.server = None
+        slot.ready.set()  # release borrowers still waiting; they see the pool closed
@@ -0,0 +1,97 @@
+"""Response cache for agent runs.
+
+Proposers such as TurnTaker and DialogueReflex often ask the same question
+about the same world snapshot within one tick. `ModelResponseCache` keys a run
+by (model, instructions, normalized input, reasoning effort, output type),
+keeps final outputs for a short TTL under LRU caps, and coalesces identical
+concurrent runs from different agents into one model call.
+
+It wraps whatever executes the run (normally `OpenAIAgentsRunner`), so the
+Agents SDK stays the only path to the model. Agents with dynamic instructions
+are never cached.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel
+
+from resobot_gw.cache import AsyncTTLCache, CacheStats
+
+if TYPE_CHECKING:
+    from agents import Agent  # type: ignore[import-not-found]
+
+# (model, instructions, normalized input, reasoning effort, output type)
+ResponseKey = tuple[str, str, str, str, str]
+
+
+def normalize_input(run_input: str) -> str:
+    """Collapse whitespace so formatting noise does not split cache entries."""
+    return " ".join(run_input.split())
+
+
+def _output_size(value: object) -> int:
+    if isinstance(value, BaseModel):
+        return len(value.model_dump_json())
+    if isinstance(value, str):
+        return len(value)
+    return len(json.dumps(value, default=str))
+
+
+class ModelResponseCache:
+    """TTL/LRU cache of agent final outputs with request coalescing."""
+
+    def __init__(
+        self,
+        *,
+        ttl_s: float = 1.0,
+        max_entries: int = 256,
+        max_bytes: int | None = 4 * 1024 * 1024,
+    ) -> None:
+        self._ttl_s = ttl_s
+        self._cache = AsyncTTLCache(
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            sizeof=_output_size,
+        )
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._cache.stats
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def key_for(self, agent: Agent[Any], run_input: str) -> ResponseKey | None:
+        """Cache key for running `agent` on `run_input`; None if uncacheable."""
+        if not isinstance(agent.instructions, str | None):
+            return None  # dynamic instructions may differ per run
+        reasoning = agent.model_settings.reasoning
+        effort = "" if reasoning is None or reasoning.effort is None else str(reasoning.effort)
+        output = getattr(agent.output_type, "__qualname__", repr(agent.output_type))
+        return (
+            str(agent.model),
+            agent.instructions or "",
+            normalize_input(run_input),
+            effort,
+            output,
+        )
+
+    async def run(
+        self,
+        agent: Agent[Any],
+        run_input: str,
+        call: Callable[[], Awaitable[object]],
+    ) -> object:
+        """Return the cached output for this run, or `call()` it (once)."""
+        key = self.key_for(agent, run_input)
+        if key is None:
+            return await call()
+        return await self._cache.get_or_load(key, call, self._ttl_s)
+
+    def clear(self) -> None:
+        """Drop everything, e.g. when the world changes."""
+        self._cache.clear()
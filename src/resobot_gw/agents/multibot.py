@@ -0,0 +1,154 @@
+"""Multi-bot arbitration with isolated per-bot lock tables.
+
+Each bot owns an `Arbiter` and its `LockTable`, so resource namespaces never
+mix. `MultiBotArbiter.tick` arbitrates every bot in one batched pass against a
+single clock reading. Given an executor and enough bots, the pass is split into
+shards that run in parallel. Each bot's lock table and `ArbiterConfig` travel
+with its shard; workers arbitrate on a throwaway `Arbiter` built from them, and
+only the updated table, preemptions, and search fallbacks come back into the
+bot's own arbiter, so worker processes stay stateless. Conditional rules must
+therefore be picklable (module-level functions or classes such as
+`SpeedClamp`). Holders displaced in the latest tick are reported per bot by
+`pop_preempted`.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import Self
+
+from .orchestrator import (
+    Arbiter,
+    Arbitration,
+    ConditionalRules,
+    Intent,
+    LockTable,
+    Preemption,
+    walking_grab_rules,
+)
+
+
+@dataclass(frozen=True)
+class ArbiterConfig:
+    """Arbiter settings, shipped to workers alongside a bot's lock table."""
+
+    strategy: Arbitration = Arbitration.greedy
+    search_budget_us: int = 200
+    rules: ConditionalRules = field(default_factory=walking_grab_rules)
+
+    @classmethod
+    def of(cls, arbiter: Arbiter) -> Self:
+        return cls(arbiter.strategy, arbiter.search_budget_us, arbiter.rules)
+
+    def build(self, now_ms_fn: Callable[[], int], locks: LockTable | None = None) -> Arbiter:
+        return Arbiter(
+            now_ms_fn=now_ms_fn,
+            _locks=locks if locks is not None else LockTable(),
+            strategy=self.strategy,
+            search_budget_us=self.search_budget_us,
+            rules=self.rules,
+        )
+
+
+# (bot, settings, lock table, proposals)
+ShardItem = tuple[str, ArbiterConfig, LockTable, list[Intent]]
+# (bot, updated lock table, committed, preemptions, search fallbacks)
+ShardResult = tuple[str, LockTable, list[Intent], list[Preemption], int]
+
+
+def _no_clock() -> int:
+    raise RuntimeError("shard arbiters run at an explicit time")
+
+
+def tick_shard(now_ms: int, shard: list[ShardItem]) -> list[ShardResult]:
+    """Arbitrate one shard of bots; top-level so it can run in a worker process."""
+    out: list[ShardResult] = []
+    for bot, config, table, proposals in shard:
+        arb = config.build(_no_clock, table)
+        committed = arb.tick_at(now_ms, proposals)
+        out.append((bot, arb.locks, committed, arb.pop_preempted(), arb.search_fallbacks))
+    return out
+
+
+@dataclass
+class MultiBotArbiter:
+    """Arbitrates many bots per pass, optionally sharded over an executor.
+
+    - executor: e.g. a `ProcessPoolExecutor`; None keeps everything in-process
+    - parallel_min_bots: below this many bots a pass stays in-process
+    - shards: number of shards a parallel pass is split into
+    - config: settings for each bot's arbiter when it is created (e.g. the
+      optimal strategy); an arbiter changed afterwards keeps its own
+    """
+
+    now_ms_fn: Callable[[], int] = field(
+        default=lambda: int(time.monotonic() * 1000),
+    )  # injection for testing
+    executor: Executor | None = None
+    parallel_min_bots: int = 64
+    shards: int = 4
+    config: ArbiterConfig = field(default_factory=ArbiterConfig)
+    _arbiters: dict[str, Arbiter] = field(default_factory=dict)
+
+    @property
+    def bots(self) -> list[str]:
+        return list(self._arbiters)
+
+    def arbiter(self, bot: str) -> Arbiter:
+        """Return the bot's arbiter, creating an empty one on first use."""
+        if not bot:
+            raise ValueError("bot must be non-empty")
+        arb = self._arbiters.get(bot)
+        if arb is None:
+            arb = self.config.build(self.now_ms_fn)
+            self._arbiters[bot] = arb
+        return arb
+
+    def remove(self, bot: str) -> None:
+        self._arbiters.pop(bot, None)
+
+    def pop_preempted(self) -> dict[str, list[Preemption]]:
+        """Each bot's preemptions from its latest arbitration, cleared as returned.
+
+        Bots without any are left out.
+        """
+        out: dict[str, list[Preemption]] = {}
+        for bot, arb in self._arbiters.items():
+            if preempted := arb.pop_preempted():
+                out[bot] = preempted
+        return out
+
+    def next_expiry_ms(self) -> int | None:
+        """Earliest lock expiry across all bots."""
+        expiries = [e for a in self._arbiters.values() if (e := a.next_expiry_ms()) is not None]
+        return min(expiries, default=None)
+
+    def tick(self, proposals: Mapping[str, Iterable[Intent]]) -> dict[str, list[Intent]]:
+        """Arbitrate each bot's proposals; returns committed intents per bot."""
+        now = self.now_ms_fn()
+        if self.executor is None or len(proposals) < max(2, self.parallel_min_bots):
+            return {bot: self.arbiter(bot).tick_at(now, ps) for bot, ps in proposals.items()}
+        return self._tick_sharded(self.executor, now, proposals)
+
+    def _tick_sharded(
+        self,
+        executor: Executor,
+        now: int,
+        proposals: Mapping[str, Iterable[Intent]],
+    ) -> dict[str, list[Intent]]:
+        n = max(1, min(self.shards, len(proposals)))
+        shards: list[list[ShardItem]] = [[] for _ in range(n)]
+        for i, (bot, ps) in enumerate(proposals.items()):
+            arb = self.arbiter(bot)
+            shards[i % n].append((bot, ArbiterConfig.of(arb), arb.locks, list(ps)))
+
+        committed: dict[str, list[Intent]] = {}
+        for result in executor.map(tick_shard, [now] * n, shards):
+            for bot, table, intents, preempted, fallbacks in result:
+                # Tables come back as copies from worker processes; adopt them.
+                self._arbiters[bot].adopt(table, preempted, fallbacks)
+                committed[bot] = intents
+        return committed
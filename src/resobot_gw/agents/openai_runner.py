@@ -3,27 +3,191 @@
 Imports the Agents SDK statically to comply with the "no dynamic import" rule.
 This module requires `openai-agents` to be installed; otherwise import will fail
 immediately, which is desired per policy.
+
+`OpenAIAgentsRunner.proposers()` builds one SDK agent per `AgentSpec` (model,
+instructions, reasoning effort) whose structured output is a `ProposalBatch`;
+each is wrapped in an `OpenAIProposer` so the coordinator runs them
+concurrently. Per-agent semaphores bound in-flight runs of one agent, and a
+shared token bucket bounds model calls across all of them.
+
+`OpenAIStreamingProposer` streams a speaking agent's text instead and pushes
+a provisional `say` per completed sentence (see `speech.say_intents`).
 """
 
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
-from dataclasses import dataclass
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
 
 # Import Agents SDK at module import time (no dynamic import per policy)
-from agents import Agent, Runner  # type: ignore[import-not-found]
+from agents import (  # type: ignore[import-not-found]
+    Agent,
+    ModelSettings,
+    RunContextWrapper,
+    RunHooks,
+    Runner,
+    RunResult,
+    RunResultStreaming,
+    TResponseInputItem,
+)
 from agents.mcp import (  # type: ignore[import-not-found]
     MCPServer,
     MCPServerStdio,
     MCPServerStdioParams,
 )
+from pydantic import BaseModel, Field
+
+from resobot_gw.obs import record, span
+from resobot_gw.ratelimit import TokenBucket
 
+from .coordinator import AgentSpec, AsyncProposer, StreamingProposer
 from .interface import AgentRunner
+from .mcp_cache import ToolResultCache
+from .mcp_pool import MCPSessionPool
+from .model_cache import ModelResponseCache
+from .orchestrator import Intent, Resource
+from .speech import SayOptions, say_intents
 
 logger = logging.getLogger(__name__)
 
 
+class IntentDraft(BaseModel):
+    """One intent as emitted by a model (structured output)."""
+
+    kind: str
+    resources: list[Resource]
+    score: float = Field(ge=0.0, le=1.0)
+    hold_ms: int = Field(ge=0)
+    # JSON object; a plain string keeps the output schema strict
+    params_json: str = "{}"
+
+
+class ProposalBatch(BaseModel):
+    intents: list[IntentDraft]
+
+
+def build_agent(spec: AgentSpec, *, structured: bool = True) -> Agent[Any]:
+    """SDK agent for `spec`, answering with a `ProposalBatch` (or plain text)."""
+    return Agent(
+        name=spec.name,
+        instructions=spec.instructions,
+        model=spec.model,
+        model_settings=ModelSettings(reasoning={"effort": spec.reasoning.value}),
+        output_type=ProposalBatch if structured else None,
+    )
+
+
+def to_intents(spec: AgentSpec, batch: ProposalBatch) -> list[Intent]:
+    """Convert a model's drafts into intents; malformed params become empty."""
+    out: list[Intent] = []
+    for d in batch.intents:
+        try:
+            params = json.loads(d.params_json)
+        except json.JSONDecodeError:
+            logger.warning("%s: ignoring malformed params %r", spec.name, d.params_json)
+            params = {}
+        out.append(
+            Intent(
+                agent=spec.name,
+                kind=d.kind,
+                params=params if isinstance(params, dict) else {},
+                resources=tuple(d.resources),
+                score=d.score,
+                hold_ms=d.hold_ms,
+                tier=spec.tier,
+            ),
+        )
+    return out
+
+
+class ModelCallLimiter(RunHooks[Any]):
+    """Run hooks that take a bucket token before every model call."""
+
+    def __init__(self, bucket: TokenBucket) -> None:
+        self.bucket = bucket
+
+    async def on_llm_start(
+        self,
+        context: RunContextWrapper[Any],
+        agent: Agent[Any],
+        system_prompt: str | None,
+        input_items: list[TResponseInputItem],
+    ) -> None:
+        del context, agent, system_prompt, input_items
+        await self.bucket.acquire()
+
+
+# Runs an agent on one input and returns its final output.
+AgentRunFn = Callable[[Agent[Any], str], Awaitable[object]]
+# Runs an agent on one input, streaming its output text deltas.
+TextStreamFn = Callable[[Agent[Any], str], AsyncIterator[str]]
+
+
+def default_observation(spec: AgentSpec) -> str:
+    return f"Propose intents for {spec.name} for the current tick."
+
+
+@dataclass
+class OpenAIProposer(AsyncProposer):
+    """Runs one SDK agent per tick and proposes its structured output.
+
+    - run: executes the agent (normally `OpenAIAgentsRunner.run_agent`)
+    - observe: builds the agent's input for this tick
+    - max_concurrent: in-flight runs allowed for this agent (carried runs count)
+    """
+
+    run: AgentRunFn = field(kw_only=True)
+    observe: Callable[[AgentSpec], str] = default_observation
+    max_concurrent: int = 1
+    agent: Agent[Any] = field(init=False, repr=False)
+    _slots: asyncio.Semaphore = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.max_concurrent < 1:
+            raise ValueError("max_concurrent must be positive")
+        self.agent = build_agent(self.spec)
+        self._slots = asyncio.Semaphore(self.max_concurrent)
+
+    async def propose(self) -> Iterable[Intent]:
+        async with self._slots:
+            output = await self.run(self.agent, self.observe(self.spec))
+        if not isinstance(output, ProposalBatch):
+            logger.warning("%s: unexpected output %r", self.spec.name, type(output))
+            return ()
+        return to_intents(self.spec, output)
+
+
+@dataclass
+class OpenAIStreamingProposer(StreamingProposer):
+    """Speaks one agent's streamed replies, sentence by sentence.
+
+    - prompts: inputs to reply to (e.g. heard utterances), one run each
+    - stream_text: streams the agent's text (normally `OpenAIAgentsRunner.stream_agent_text`)
+    - say: intent options; defaults to the spec's tier
+    """
+
+    prompts: Callable[[], AsyncIterator[str]] = field(kw_only=True)
+    stream_text: TextStreamFn = field(kw_only=True)
+    say: SayOptions | None = None
+    agent: Agent[Any] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.agent = build_agent(self.spec, structured=False)
+        if self.say is None:
+            self.say = SayOptions(tier=self.spec.tier)
+
+    async def stream(self) -> AsyncIterator[Intent]:
+        async for prompt in self.prompts():
+            chunks = self.stream_text(self.agent, prompt)
+            async for intent in say_intents(self.spec.name, chunks, self.say):
+                yield intent
+
+
 @dataclass
 class OpenAIAgentsRunner(AgentRunner):
     """Minimal adapter that runs a simple agent.
@@ -37,22 +201,106 @@ class OpenAIAgentsRunner(AgentRunner):
     poll_interval_s: float = 0.5
     mcp_stdio_command: str | None = None
     mcp_stdio_args: tuple[str, ...] = ()
+    # warm MCP sessions kept for concurrent agent runs
+    mcp_pool_size: int = 3
+    # optional result cache for read-only MCP tools, shared by all sessions
+    tool_cache: ToolResultCache | None = None
+    # agents exposed through `proposers()`
+    specs: Sequence[AgentSpec] = ()
+    max_concurrent_per_agent: int = 1
+    # global cap on model calls across agents (None = unlimited)
+    model_calls_per_s: float | None = None
+    model_call_burst: int = 4
+    observe: Callable[[AgentSpec], str] = default_observation
+    # optional cache/coalescer for identical runs across agents
+    response_cache: ModelResponseCache | None = None
+    _hooks: ModelCallLimiter | None = field(init=False, default=None, repr=False)
+    _pool: MCPSessionPool | None = field(init=False, default=None, repr=False)
+    _ready: asyncio.Event = field(init=False, default_factory=asyncio.Event, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.model_calls_per_s is not None:
+            bucket = TokenBucket(self.model_calls_per_s, burst=self.model_call_burst)
+            self._hooks = ModelCallLimiter(bucket)
+
+    def proposers(self) -> list[OpenAIProposer]:
+        """One concurrent proposer per spec, all running through this runner."""
+        return [
+            OpenAIProposer(
+                spec,
+                run=self.run_agent,
+                observe=self.observe,
+                max_concurrent=self.max_concurrent_per_agent,
+            )
+            for spec in self.specs
+        ]
+
+    def streaming_proposer(
+        self,
+        spec: AgentSpec,
+        prompts: Callable[[], AsyncIterator[str]],
+    ) -> OpenAIStreamingProposer:
+        """Streaming `say` proposer for `spec`, running through this runner."""
+        return OpenAIStreamingProposer(spec, prompts=prompts, stream_text=self.stream_agent_text)
+
+    async def stream_agent_text(
+        self,
+        agent: Agent[Any],
+        run_input: str,
+    ) -> AsyncIterator[str]:  # pragma: no cover - requires network to exercise
+        """Stream `agent`'s text once MCP is up, under the global model-call limit.
+
+        Yields:
+            Output text deltas.
+
+        """
+        await self._ready.wait()
+        deltas = stream_with_mcp(self._pool, agent, run_input, self.tool_cache, self._hooks)
+        async for delta in deltas:
+            yield delta
+
+    async def run_agent(
+        self,
+        agent: Agent[Any],
+        run_input: str,
+    ) -> object:  # pragma: no cover - requires network to exercise
+        """Run `agent` once MCP is up, under the global model-call limit.
+
+        Identical runs are served from `response_cache` when one is set.
+        """
+
+        async def call() -> object:
+            await self._ready.wait()
+            result = await run_with_mcp(self._pool, agent, run_input, self.tool_cache, self._hooks)
+            return result.final_output
+
+        if self.response_cache is None:
+            return await call()
+        return await self.response_cache.run(agent, run_input, call)
+
+    def mcp_factory(self) -> Callable[[], MCPServer] | None:
+        """Factory for MCP stdio servers, or None when MCP is not configured."""
+        if not self.mcp_stdio_command:
+            return None
+        params: MCPServerStdioParams = {"command": self.mcp_stdio_command}
+        if self.mcp_stdio_args:
+            params["args"] = list(self.mcp_stdio_args)
+        return lambda: MCPServerStdio(params=params)
 
     async def run(self) -> None:  # pragma: no cover - requires network to exercise
-        mcp_servers: list[MCPServer] = []
-        if self.mcp_stdio_command:
-            params: MCPServerStdioParams = {"command": self.mcp_stdio_command}
-            if self.mcp_stdio_args:
-                params["args"] = list(self.mcp_stdio_args)
-            mcp_servers = [MCPServerStdio(params=params)]
+        factory = self.mcp_factory()
+        if factory is None:
+            await self._serve(None)
+            return
+        async with MCPSessionPool(factory, size=self.mcp_pool_size) as pool:
+            await self._serve(pool)
 
+    async def _serve(self, pool: MCPSessionPool | None) -> None:  # pragma: no cover - network
+        self._pool = pool
+        self._ready.set()
         if self.bootstrap_hello:
-            agent = Agent(
-                name="Gateway",
-                instructions="You only respond in haikus.",
-                mcp_servers=mcp_servers,
-            )
-            result = await Runner.run(agent, "Hello from ResoBotGW")
+            agent = Agent(name="Gateway", instructions="You only respond in haikus.")
+            result = await run_with_mcp(pool, agent, "Hello from ResoBotGW", self.tool_cache)
             logger.info("Bootstrap result: %s", getattr(result, "final_output", "<no output>"))
 
         logger.info("OpenAI Agents runner active; idling until cancellation")
@@ -62,3 +310,67 @@ class OpenAIAgentsRunner(AgentRunner):
         except asyncio.CancelledError:
             logger.info("OpenAI Agents runner cancelled; shutting down")
             raise
+
+
+async def run_with_mcp(
+    pool: MCPSessionPool | None,
+    agent: Agent,
+    run_input: str,
+    cache: ToolResultCache | None = None,
+    hooks: RunHooks[Any] | None = None,
+) -> RunResult:  # pragma: no cover - requires network to exercise
+    """Run `agent` on a borrowed MCP session (or without MCP when pool is None).
+
+    With `cache`, the session's tool calls go through it.
+    """
+    with span("model_run", agent=agent.name):
+        if pool is None:
+            return await Runner.run(agent, run_input, hooks=hooks)
+        async with pool.session() as session:
+            server = session if cache is None else cache.wrap(session)
+            return await Runner.run(agent.clone(mcp_servers=[server]), run_input, hooks=hooks)
+
+
+async def stream_with_mcp(
+    pool: MCPSessionPool | None,
+    agent: Agent,
+    run_input: str,
+    cache: ToolResultCache | None = None,
+    hooks: RunHooks[Any] | None = None,
+) -> AsyncIterator[str]:  # pragma: no cover - requires network to exercise
+    """Like `run_with_mcp`, but streams; the session is held until the end.
+
+    Yields:
+        Output text deltas as they arrive.
+
+    """
+    if pool is None:
+        result = Runner.run_streamed(agent, run_input, hooks=hooks)
+        async for delta in _text_deltas(agent.name, result):
+            yield delta
+        return
+    async with pool.session() as session:
+        server = session if cache is None else cache.wrap(session)
+        result = Runner.run_streamed(agent.clone(mcp_servers=[server]), run_input, hooks=hooks)
+        async for delta in _text_deltas(agent.name, result):
+            yield delta
+
+
+async def _text_deltas(
+    name: str,
+    result: RunResultStreaming,
+) -> AsyncIterator[str]:  # pragma: no cover - requires network to exercise
+    start = time.perf_counter()
+    first = True
+    try:
+        async for event in result.stream_events():
+            if (
+                event.type == "raw_response_event"
+                and event.data.type == "response.output_text.delta"
+            ):
+                if first:
+                    record("model_first_token", time.perf_counter() - start, agent=name)
+                    first = False
+                yield event.data.delta
+    finally:
+        result.cancel()  # no-op once complete; stops the run if we stop early
@@ -2,14 +2,40 @@
 
 Implements resources, intents, a compatibility matrix, and an Arbiter that
 greedily commits compatible proposals with simple preemption and lock expiry.
+
+Resource sets are packed into integer bitmasks when an `Intent` is built, and
+the compatibility matrix is compiled into per-mask conflict tables, so the
+commit check in `Arbiter.tick` is a single AND against an accumulated mask.
+
+△ cells carry rule functions (`ConditionalRules`): when an intent pairs with
+a committed or lock-holding intent on a △ cell, the pair's rule may rewrite
+either intent's params (e.g. clamp walking speed during a grab, AC-2) or veto
+the newcomer. Rules are compiled into per-mask and per-pair tables, so the
+tick pays one AND unless a rule actually applies.
+
+`Arbitration.optimal` replaces the greedy pass with a per-tier weighted
+set packing: a DP over the 7-bit blocked-resource space picks the compatible
+subset with the highest total score, under a time budget that falls back to
+greedy.
+
+`Intent` is slotted, interns its kind, and precomputes an integer sort key
+(tier, then score descending), so ordering a tick's proposals builds no
+per-intent key tuples and the tick loop allocates only for what it commits.
 """
 
 from __future__ import annotations
 
+import heapq
+import struct
+import sys
 import time
-from collections.abc import Callable, Iterable, Sequence
-from dataclasses import dataclass, field
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass, field, replace
 from enum import Enum, StrEnum
+from itertools import groupby
+from operator import attrgetter
+
+from resobot_gw.bus import monotonic_ms
 
 
 class Resource(StrEnum):
@@ -31,9 +57,15 @@ class Tier(int, Enum):
     planner = 3
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Intent:
-    """A proposed action from an Agent requiring resources for a short duration."""
+    """A proposed action from an Agent requiring resources for a short duration.
+
+    - params: treat as read-only once proposed
+    - renews: a follow-up that extends locks its agent already holds on
+      `resources` (see `Arbiter.renew`); acquired normally if it holds none
+    - created_ms: `monotonic_ms()` at construction, for end-to-end latency
+    """
 
     agent: str
     kind: str
@@ -42,6 +74,65 @@ class Intent:
     score: float
     hold_ms: int
     tier: Tier
+    renews: bool = False
+    created_ms: float = field(default_factory=monotonic_ms, repr=False, compare=False)
+    # Derived bitmasks (see `resource_mask`) and arbitration order (see
+    # `sort_key`); computed once at construction.
+    mask: int = field(init=False, repr=False, compare=False)
+    conflicts: int = field(init=False, repr=False, compare=False)
+    order: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        mask = resource_mask(self.resources)
+        object.__setattr__(self, "kind", sys.intern(str(self.kind)))
+        object.__setattr__(self, "mask", mask)
+        object.__setattr__(self, "conflicts", _CONFLICTS[mask])
+        object.__setattr__(self, "order", sort_key(self.tier, self.score))
+
+
+_F64 = struct.Struct("<d")
+_U64 = struct.Struct("<Q")
+_SIGN = 1 << 63
+_LOW64 = (1 << 64) - 1
+
+
+def sort_key(tier: Tier, score: float) -> int:
+    """Integer ordering tier ascending, then score descending.
+
+    The score's IEEE-754 bits are mapped to an unsigned integer with the same
+    order as the floats, inverted, and placed below the tier.
+    """
+    (bits,) = _U64.unpack(_F64.pack(score + 0.0))  # + 0.0 folds -0.0 into 0.0
+    ordered = bits ^ _LOW64 if bits & _SIGN else bits | _SIGN
+    return (tier << 64) | (_LOW64 - ordered)
+
+
+_ORDER = attrgetter("order")
+_TIER = attrgetter("tier")
+
+
+# One bit per resource, in declaration order.
+_BIT: dict[Resource, int] = {r: 1 << i for i, r in enumerate(Resource)}
+_MASK_SPACE = 1 << len(_BIT)
+
+
+def resource_mask(resources: Iterable[Resource]) -> int:
+    """Pack resources into an integer bitmask (one bit per `Resource`)."""
+    mask = 0
+    for r in resources:
+        mask |= _BIT[r]
+    return mask
+
+
+def resources_of(mask: int) -> tuple[Resource, ...]:
+    """Unpack a bitmask into resources, in declaration order."""
+    return _RESOURCES_OF[mask]
+
+
+# Every mask's resource tuple, built once so unpacking allocates nothing.
+_RESOURCES_OF: tuple[tuple[Resource, ...], ...] = tuple(
+    tuple(r for r, bit in _BIT.items() if mask & bit) for mask in range(_MASK_SPACE)
+)
 
 
 # Compatibility matrix (True = allowed) based on the spec's table.
@@ -70,76 +161,594 @@ _ban(Resource.hands_l, Resource.hands_l)
 _ban(Resource.hands_r, Resource.hands_r)
 _ban(Resource.ui, Resource.ui)
 
+# △ cells: allowed with constraints (e.g. grab while walking). Compiled
+# separately so callers can tell them apart from plain ○; the constraints
+# themselves are `ConditionalRules`.
+_CONDITIONAL: frozenset[tuple[Resource, Resource]] = frozenset(
+    {
+        (Resource.locomotion, Resource.hands_l),
+        (Resource.hands_l, Resource.locomotion),
+        (Resource.locomotion, Resource.hands_r),
+        (Resource.hands_r, Resource.locomotion),
+    },
+)
+
+
+def _compile(cell: Callable[[Resource, Resource], bool]) -> tuple[int, ...]:
+    """Compile a pairwise predicate into a table indexed by resource mask.
+
+    Entry `m` is the mask of every resource `c` such that `cell(r, c)` holds for
+    some resource `r` in `m`. With 7 resources the table has 128 entries.
+    """
+    per_resource = {r: resource_mask(c for c in _R if cell(r, c)) for r in _R}
+    table: list[int] = []
+    for mask in range(_MASK_SPACE):
+        acc = 0
+        for r, bit in _BIT.items():
+            if mask & bit:
+                acc |= per_resource[r]
+        table.append(acc)
+    return tuple(table)
+
+
+_CONFLICTS = _compile(lambda a, b: not _ALLOWED.get((a, b), True))
+_CONDITIONALS = _compile(lambda a, b: (a, b) in _CONDITIONAL)
+
 
 def resources_compatible(a: Sequence[Resource], b: Sequence[Resource]) -> bool:
-    for ra in a:
-        for rb in b:
-            if not _ALLOWED.get((ra, rb), True):
-                return False
-    return True
+    return not _CONFLICTS[resource_mask(a)] & resource_mask(b)
 
 
-@dataclass
-class _Lock:
+def resources_conditional(a: Sequence[Resource], b: Sequence[Resource]) -> bool:
+    """True if any resource pair across `a` and `b` is a △ (constrained) cell."""
+    return bool(_CONDITIONALS[resource_mask(a)] & resource_mask(b))
+
+
+# A △ rule gets (newcomer, partner) for one △ resource pair, where the partner
+# was committed earlier in the tick or holds a lock. It returns both intents,
+# params possibly rewritten, or None to veto the newcomer.
+ConditionalRule = Callable[[Intent, Intent], tuple[Intent, Intent] | None]
+
+_N = len(_R)
+_INDEX: dict[Resource, int] = {r: i for i, r in enumerate(_R)}
+
+
+class ConditionalRules:
+    """Rules for △ cells keyed by (newcomer resource, partner resource).
+
+    Compiled at construction: `partners[mask]` is the mask of resources that
+    have a rule against some resource in `mask`, and `rule(a, b)` is a flat
+    table lookup. Register both orders of a pair to cover either arrival order.
+    """
+
+    __slots__ = ("_pairs", "_table", "partners")
+
+    def __init__(
+        self,
+        rules: Mapping[tuple[Resource, Resource], ConditionalRule] | None = None,
+    ) -> None:
+        pairs = dict(rules or {})
+        for pair in pairs:
+            if pair not in _CONDITIONAL:
+                msg = f"{pair} is not a conditional (△) cell"
+                raise ValueError(msg)
+        table: list[ConditionalRule | None] = [None] * (_N * _N)
+        for (a, b), rule in pairs.items():
+            table[_INDEX[a] * _N + _INDEX[b]] = rule
+        self._pairs = pairs
+        self._table = tuple(table)
+        self.partners: tuple[int, ...] = _compile(lambda a, b: (a, b) in pairs)
+
+    def __bool__(self) -> bool:
+        return bool(self._pairs)
+
+    def rule(self, a: Resource, b: Resource) -> ConditionalRule | None:
+        return self._table[_INDEX[a] * _N + _INDEX[b]]
+
+
+@dataclass(frozen=True, slots=True)
+class SpeedClamp:
+    """Rule capping `params[key]` of whichever intent holds locomotion.
+
+    An intent without the key is left as is: it walks at whatever its executor
+    defaults to. A class rather than a closure so rule sets pickle (see
+    `MultiBotArbiter` shards).
+    """
+
+    max_speed: float
+    key: str = "speed"
+
+    def __call__(self, a: Intent, b: Intent) -> tuple[Intent, Intent]:
+        return self._clamp(a), self._clamp(b)
+
+    def _clamp(self, intent: Intent) -> Intent:
+        if not intent.mask & _BIT[Resource.locomotion]:
+            return intent
+        speed = intent.params.get(self.key)
+        if not isinstance(speed, int | float) or speed <= self.max_speed:
+            return intent
+        return replace(intent, params={**intent.params, self.key: self.max_speed})
+
+
+def clamp_speed(max_speed: float, key: str = "speed") -> ConditionalRule:
+    """Rule capping locomotion speed while a △ partner is active."""
+    return SpeedClamp(max_speed, key)
+
+
+def walking_grab_rules(max_speed: float = 0.5) -> ConditionalRules:
+    """AC-2: grabbing while walking commits both, walking at reduced speed."""
+    rule = clamp_speed(max_speed)
+    return ConditionalRules(dict.fromkeys(_CONDITIONAL, rule))
+
+
+@dataclass(slots=True)
+class Lock:
     holder: str
     tier: Tier
     until_ms: int
+    # the committed intent holding the lock (for △ rules); None if unknown
+    intent: Intent | None = field(default=None, repr=False, compare=False)
+
+
+@dataclass(frozen=True)
+class Preemption:
+    """Locks taken from `holder` by a higher-tier intent from agent `by`."""
+
+    holder: str
+    tier: Tier
+    resources: tuple[Resource, ...]
+    by: str
+
+
+class LockTable:
+    """Per-resource locks with expiries indexed by a min-heap.
+
+    Released, preempted, or replaced locks are not removed from the heap; their
+    entries are skipped lazily when they surface, so `expire` only touches locks
+    that actually ended. The heap is rebuilt when stale entries dominate.
+    """
+
+    def __init__(self) -> None:
+        self._live: dict[Resource, Lock] = {}
+        self._heap: list[tuple[int, int, Resource, Lock]] = []
+        self._seq = 0
+        self._held = 0
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    @property
+    def held_mask(self) -> int:
+        """Bitmask of resources with a live lock."""
+        return self._held
+
+    def get(self, resource: Resource) -> Lock | None:
+        return self._live.get(resource)
+
+    def items(self) -> list[tuple[Resource, Lock]]:
+        return list(self._live.items())
+
+    def acquire(self, resources: Iterable[Resource], lock: Lock) -> None:
+        """Install `lock` on each resource, replacing any current holder."""
+        for r in resources:
+            self._live[r] = lock
+            self._held |= _BIT[r]
+            self._push(r, lock)
+        if len(self._heap) > 2 * len(self._live) + 16:
+            self._compact()
+
+    def release(self, resource: Resource) -> Lock | None:
+        lock = self._live.pop(resource, None)
+        if lock is not None:
+            self._held &= ~_BIT[resource]
+        return lock
+
+    def expire(self, now_ms: int) -> list[tuple[Resource, Lock]]:
+        """Drop and return locks whose `until_ms` is at or before `now_ms`."""
+        expired: list[tuple[Resource, Lock]] = []
+        heap = self._heap
+        while heap and heap[0][0] <= now_ms:
+            until, _, r, lock = heapq.heappop(heap)
+            if self._is_live(until, r, lock):
+                del self._live[r]
+                self._held &= ~_BIT[r]
+                expired.append((r, lock))
+        return expired
+
+    def next_expiry_ms(self) -> int | None:
+        """Earliest `until_ms` among live locks, or None when nothing is held."""
+        heap = self._heap
+        while heap:
+            until, _, r, lock = heap[0]
+            if self._is_live(until, r, lock):
+                return until
+            heapq.heappop(heap)
+        return None
+
+    def _is_live(self, until: int, resource: Resource, lock: Lock) -> bool:
+        return self._live.get(resource) is lock and lock.until_ms == until
+
+    def _push(self, resource: Resource, lock: Lock) -> None:
+        self._seq += 1
+        heapq.heappush(self._heap, (lock.until_ms, self._seq, resource, lock))
+
+    def _compact(self) -> None:
+        self._heap = []
+        for r, lock in self._live.items():
+            self._push(r, lock)
+
+
+class Arbitration(StrEnum):
+    """How a tick picks among compatible proposals of the same tier."""
+
+    greedy = "greedy"  # by score, first come first served
+    optimal = "optimal"  # max total score per tier (bounded search)
+
+
+# chosen intents as a linked list: (intent, previous chain)
+_Chain = tuple[Intent, "_Chain"] | None
+
+
+def _dominated(intent: Intent, singles: dict[int, Intent]) -> bool:
+    """True if single-resource intents can jointly replace `intent` at no loss.
+
+    They must cover every resource of `intent`, not conflict with each other,
+    and together score at least as much.
+    """
+    total = 0.0
+    for r in resources_of(intent.mask):
+        bit = _BIT[r]
+        single = singles.get(bit)
+        if single is None or single.conflicts & (intent.mask ^ bit):
+            return False
+        total += single.score
+    return total >= intent.score
+
+
+def _packing_items(candidates: Sequence[Intent]) -> list[Intent]:
+    """Intents worth searching over, from candidates in arbitration order.
+
+    Every resource conflicts with itself, so at most one intent per resource
+    mask can be chosen and only the best-scoring one (the first) matters;
+    multi-resource masks that the single-resource ones beat are dropped.
+    """
+    best_per_mask: dict[int, Intent] = {}
+    for intent in candidates:
+        if intent.mask:
+            best_per_mask.setdefault(intent.mask, intent)
+    singles = {m: i for m, i in best_per_mask.items() if not m & (m - 1)}
+    return [i for m, i in best_per_mask.items() if m in singles or not _dominated(i, singles)]
+
+
+def _best_packing(candidates: Sequence[Intent], deadline: float) -> set[int] | None:
+    """Ids of the max-total-score compatible subset, or None past `deadline`.
+
+    The DP state is the union of chosen conflict masks; two partial packings
+    with the same state are interchangeable, so only the higher-scoring one
+    is kept (at most 128 states).
+    """
+    items = _packing_items(candidates)
+    if len(items) < 2:
+        return {id(i) for i in items}
+    # best total and its chain per reachable state; since every conflict mask
+    # covers its own resources, states added while scanning for an intent
+    # already exclude it, so the list can grow during the scan
+    total: list[float] = [0.0] * _MASK_SPACE
+    chains: list[_Chain] = [None] * _MASK_SPACE
+    seen = [False] * _MASK_SPACE
+    seen[0] = True
+    reached = [0]
+    for n, intent in enumerate(items):
+        if not n & 7 and time.perf_counter() > deadline:
+            return None
+        mask, conflicts, score = intent.mask, intent.conflicts, intent.score
+        for state in reached:
+            if mask & state:
+                continue
+            nxt = state | conflicts
+            t = total[state] + score
+            if not seen[nxt]:
+                seen[nxt] = True
+                reached.append(nxt)  # noqa: B909 - see above
+            elif t <= total[nxt]:
+                continue
+            total[nxt] = t
+            chains[nxt] = (intent, chains[state])
+    chain = chains[max(reached, key=total.__getitem__)]
+    chosen: set[int] = set()
+    while chain is not None:
+        intent, chain = chain
+        chosen.add(id(intent))
+    return chosen
 
 
 @dataclass
 class Arbiter:
-    """Greedy arbiter with simple preemption and time-based locks."""
+    """Arbiter with simple preemption and time-based locks.
+
+    - strategy: greedy (default) or optimal per-tier packing
+    - search_budget_us: per-tick time limit for the optimal search itself
+      (not the lock checks); tiers it cannot finish are arbitrated greedily
+      and counted in `search_fallbacks`
+    - rules: △-cell constraints applied to every commit, renewals and
+      `submit_urgent` included; a partner from an earlier tick whose params a
+      rule rewrites is re-published in the tick's commits
+
+    Preemptions are kept for the latest `tick_at`/`submit_urgent` call only
+    (see `pop_preempted`), so an arbiter nobody drains stays bounded.
+    """
 
     now_ms_fn: Callable[[], int] = field(
         default=lambda: int(time.monotonic() * 1000),
     )  # injection for testing
-    _locks: dict[Resource, _Lock] = field(default_factory=dict)
+    _locks: LockTable = field(default_factory=LockTable)
+    _preempted: list[Preemption] = field(default_factory=list)
+    strategy: Arbitration = Arbitration.greedy
+    search_budget_us: int = 200
+    search_fallbacks: int = field(default=0, init=False)
+    rules: ConditionalRules = field(default_factory=walking_grab_rules)
+
+    @property
+    def locks(self) -> LockTable:
+        return self._locks
+
+    def adopt(self, locks: LockTable, preempted: Iterable[Preemption], fallbacks: int = 0) -> None:
+        """Take over the outcome of a tick run on a copy of this arbiter.
+
+        Used when a worker process arbitrated with this arbiter's settings: its
+        lock table and preemptions replace ours, as that tick's would, and its
+        search fallbacks are added to ours.
+        """
+        self._locks = locks
+        self._preempted = list(preempted)
+        self.search_fallbacks += fallbacks
+
+    def pop_preempted(self) -> list[Preemption]:
+        """Return and clear the latest arbitration's preemptions.
+
+        Each `tick_at`/`submit_urgent` call starts a fresh record, so drain
+        after every call whose displaced holders need telling.
+        """
+        out, self._preempted = self._preempted, []
+        return out
+
+    def next_expiry_ms(self) -> int | None:
+        """When the next lock expires (in `now_ms_fn` time), for tick scheduling."""
+        return self._locks.next_expiry_ms()
 
     def _expire(self, now_ms: int) -> None:
-        for r, lk in list(self._locks.items()):
-            if lk.until_ms <= now_ms:
-                del self._locks[r]
+        self._locks.expire(now_ms)
 
-    def _can_acquire(self, intent: Intent, now_ms: int) -> bool:
-        # Check conflicting locks; allow preemption if higher priority
-        for r in intent.resources:
+    def _can_acquire(self, intent: Intent) -> bool:
+        # Check conflicting locks; allow preemption if higher priority.
+        # Expired locks are already gone, so only held resources can block.
+        held = intent.conflicts & self._locks.held_mask
+        if not held:
+            return True
+        for r in resources_of(held):
             lk = self._locks.get(r)
             if lk is None:
                 continue
-            if lk.until_ms <= now_ms:
-                continue
             if intent.tier < lk.tier:
                 # preempt allowed
                 continue
             return False
         return True
 
+    def _preempt(self, intent: Intent) -> None:
+        # Release conflicting locks (all lower tier once _can_acquire passed),
+        # recording one Preemption per displaced lock.
+        held = intent.conflicts & self._locks.held_mask
+        if not held:
+            return
+        taken: dict[int, tuple[Lock, list[Resource]]] = {}
+        for r in resources_of(held):
+            lk = self._locks.release(r)
+            if lk is not None:
+                taken.setdefault(id(lk), (lk, []))[1].append(r)
+        self._preempted.extend(
+            Preemption(holder=lk.holder, tier=lk.tier, resources=tuple(rs), by=intent.agent)
+            for lk, rs in taken.values()
+        )
+
     def _acquire(self, intent: Intent, now_ms: int) -> None:
         until = now_ms + max(1, intent.hold_ms)
+        lock = Lock(holder=intent.agent, tier=intent.tier, until_ms=until, intent=intent)
+        self._locks.acquire(intent.resources, lock)
+
+    def _held(self, intent: Intent) -> list[Lock] | None:
+        """The locks `intent.agent` holds on each resource of `intent`, if all are."""
+        held: list[Lock] = []
         for r in intent.resources:
-            self._locks[r] = _Lock(holder=intent.agent, tier=intent.tier, until_ms=until)
+            lk = self._locks.get(r)
+            if lk is None or lk.holder != intent.agent:
+                return None
+            held.append(lk)
+        return held or None
 
-    def tick(self, proposals: Iterable[Intent]) -> list[Intent]:
+    def _renew(self, intent: Intent, held: list[Lock], now_ms: int) -> None:
+        hold = max(1, intent.hold_ms)
+        for r, lk in zip(intent.resources, held, strict=True):
+            # queue behind the time already granted (e.g. the previous sentence)
+            until = max(lk.until_ms, now_ms) + hold
+            renewed = Lock(holder=lk.holder, tier=lk.tier, until_ms=until, intent=intent)
+            self._locks.acquire((r,), renewed)
+
+    def _renew_ruled(
+        self,
+        intent: Intent,
+        held: list[Lock],
+        now: int,
+        blocked: int,
+        out: list[Intent],
+    ) -> int:
+        """Renew a held follow-up under the △ rules; returns the new `blocked`."""
+        if self.rules.partners[intent.mask] & (blocked | self._locks.held_mask):
+            admitted = self._apply_rules(intent, out)
+            if admitted is None:
+                return blocked
+            intent = admitted
+        self._renew(intent, held, now)
+        out.append(intent)
+        return blocked | intent.conflicts
+
+    def renew(self, intent: Intent) -> bool:
+        """Extend the locks `intent.agent` holds on every resource of `intent`.
+
+        Each lock is pushed out by `hold_ms` past its current expiry (or now, if
+        later), keeping its tier; the locks then carry `intent`. Returns False,
+        changing nothing, when any of the resources is free or held by another
+        agent.
+        """
         now = self.now_ms_fn()
         self._expire(now)
+        held = self._held(intent)
+        if held is None:
+            return False
+        self._renew(intent, held, now)
+        return True
+
+    def tick(self, proposals: Iterable[Intent]) -> list[Intent]:
+        return self.tick_at(self.now_ms_fn(), proposals)
+
+    def tick_at(self, now: int, proposals: Iterable[Intent]) -> list[Intent]:
+        """Arbitrate `proposals` at an explicit time (shared clock for batches)."""
+        self._preempted.clear()
+        self._expire(now)
         # order: tier asc (higher prio first), then score desc
-        ordered = sorted(proposals, key=lambda i: (i.tier, -i.score))
+        ordered = sorted(proposals, key=_ORDER)
+        if self.strategy is Arbitration.optimal:
+            return self._tick_optimal(now, ordered)
 
         committed: list[Intent] = []
+        # union of conflict masks of committed intents (the table is symmetric)
+        blocked = 0
         for intent in ordered:
+            # follow-ups extend their own agent's locks, even ones taken this tick
+            if intent.renews and (held := self._held(intent)) is not None:
+                blocked = self._renew_ruled(intent, held, now, blocked, committed)
+                continue
             # filter by compatibility with already committed intents
-            if any(
-                not resources_compatible(intent.resources, c.resources) for c in committed
-            ):
+            if intent.mask & blocked:
                 continue
             # check locks (with preemption)
-            if not self._can_acquire(intent, now):
+            if not self._can_acquire(intent):
                 continue
+            # △ constraints against this tick's commits and held locks
+            # (`blocked` covers every committed resource: each conflicts with itself)
+            if self.rules.partners[intent.mask] & (blocked | self._locks.held_mask):
+                admitted = self._apply_rules(intent, committed)
+                if admitted is None:
+                    continue
+                intent = admitted  # noqa: PLW2901 - commit the rewritten intent
             # preempt conflicting locks explicitly
-            for r in intent.resources:
-                lk = self._locks.get(r)
-                if lk and lk.until_ms > now and intent.tier < lk.tier:
-                    del self._locks[r]
+            self._preempt(intent)
             self._acquire(intent, now)
             committed.append(intent)
+            blocked |= intent.conflicts
         return committed
+
+    def _partner(self, resource: Resource, committed: list[Intent]) -> tuple[Intent, int] | None:
+        """Intent on `resource` from this tick (with its index) or its lock (-1)."""
+        bit = _BIT[resource]
+        for i, other in enumerate(committed):
+            if other.mask & bit:
+                return other, i
+        lk = self._locks.get(resource)
+        if lk is None or lk.intent is None:
+            return None
+        return lk.intent, -1
+
+    def _apply_rules(self, intent: Intent, committed: list[Intent]) -> Intent | None:
+        """Run △ rules for `intent`; returns it (maybe rewritten) or None if vetoed.
+
+        A partner whose params a rule changes gets its lock's intent updated;
+        it replaces its entry in `committed`, or is appended if it committed in
+        an earlier tick. Partners the rule returns unchanged are not re-published.
+        """
+        for a in intent.resources:
+            # resources the newcomer takes itself have no partner (their locks are preempted)
+            for b in resources_of(self.rules.partners[_BIT[a]] & ~intent.mask):
+                rule = self.rules.rule(a, b)
+                found = self._partner(b, committed) if rule is not None else None
+                if rule is None or found is None:
+                    continue
+                other, i = found
+                result = rule(intent, other)
+                if result is None:
+                    return None
+                new, new_other = result
+                if new.mask != intent.mask or new_other.mask != other.mask:
+                    msg = "conditional rules may rewrite params, not resources"
+                    raise ValueError(msg)
+                intent = new
+                if new_other is other or new_other.params == other.params:
+                    continue
+                for r in other.resources:
+                    lk = self._locks.get(r)
+                    if lk is not None and lk.intent is other:
+                        lk.intent = new_other
+                if i >= 0:
+                    committed[i] = new_other
+                else:
+                    committed.append(new_other)
+        return intent
+
+    def _tick_optimal(self, now: int, ordered: list[Intent]) -> list[Intent]:
+        budget_s = self.search_budget_us / 1e6
+        committed: list[Intent] = []
+        blocked = 0
+        for _, group in groupby(ordered, key=_TIER):
+            # what this tier may take, given higher tiers and held locks; within
+            # a tier only the masks can conflict, which the packing accounts for
+            eligible: list[Intent] = []
+            wanted = 0
+            contended = False
+            for intent in group:
+                if intent.renews and (held := self._held(intent)) is not None:
+                    blocked = self._renew_ruled(intent, held, now, blocked, committed)
+                elif not intent.mask & blocked and self._can_acquire(intent):
+                    eligible.append(intent)
+                    contended = contended or bool(intent.mask & wanted)
+                    wanted |= intent.conflicts
+            chosen = None  # no contention: greedy already takes everything
+            if contended:
+                started = time.perf_counter()
+                chosen = _best_packing(eligible, started + budget_s)
+                budget_s -= time.perf_counter() - started
+                self.search_fallbacks += chosen is None
+            # chosen intents first; then anything still compatible (resource-free
+            # intents, or the whole tier greedily without a search result)
+            rest: list[Intent] = []
+            for intent in eligible:
+                if chosen is None or id(intent) in chosen:
+                    blocked = self._commit_if_free(intent, now, blocked, committed)
+                else:
+                    rest.append(intent)
+            for intent in rest:
+                blocked = self._commit_if_free(intent, now, blocked, committed)
+        return committed
+
+    def _commit_if_free(self, intent: Intent, now: int, blocked: int, out: list[Intent]) -> int:
+        if intent.mask & blocked:
+            return blocked
+        if self.rules.partners[intent.mask] & (blocked | self._locks.held_mask):
+            admitted = self._apply_rules(intent, out)
+            if admitted is None:
+                return blocked
+            intent = admitted
+        self._preempt(intent)
+        self._acquire(intent, now)
+        out.append(intent)
+        return blocked | intent.conflicts
+
+    def submit_urgent(self, intent: Intent) -> bool:
+        """Arbitrate one intent now, without waiting for the next tick.
+
+        A one-proposal `tick`: checked against the live lock table, which also
+        holds everything committed by earlier ticks, preempting lower tiers and
+        applying the △ rules. Returns True if committed; `Coordinator` uses
+        `tick` directly to publish a rewritten intent and partners. See
+        `pop_preempted` for displaced holders.
+        """
+        return bool(self.tick((intent,)))
@@ -0,0 +1,100 @@
+"""Incremental `say` intents from streamed model text.
+
+Waiting for a full model response before speaking misses DialogueReflex's
+latency target. `say_intents` consumes text chunks as they stream in and
+yields a provisional `say` as soon as the first sentence is complete; each
+later sentence becomes a follow-up `say` that renews the same agent's
+`speech` lock (`Intent.renews`), so the utterance continues without
+re-contending for the resource.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import AsyncIterable, AsyncIterator
+from dataclasses import dataclass
+
+from .orchestrator import Intent, Resource, Tier
+
+# ASCII terminators need trailing whitespace ("3.5", "e.g.x" stay intact);
+# CJK terminators end a sentence on their own.
+_SENTENCE_END = re.compile(r"[.!?]+[\"')\]]*\s+|[\u3002\uff01\uff1f]+[\u300d\u300f\uff09]*\s*")
+
+
+class SentenceSplitter:
+    """Accumulates streamed text and releases complete sentences."""
+
+    def __init__(self) -> None:
+        self._buf = ""
+
+    def feed(self, chunk: str) -> list[str]:
+        self._buf += chunk
+        out: list[str] = []
+        start = 0
+        for m in _SENTENCE_END.finditer(self._buf):
+            sentence = self._buf[start : m.end()].strip()
+            if sentence:
+                out.append(sentence)
+            start = m.end()
+        self._buf = self._buf[start:]
+        return out
+
+    def flush(self) -> str | None:
+        """Return any trailing partial sentence and reset."""
+        rest, self._buf = self._buf.strip(), ""
+        return rest or None
+
+
+@dataclass(frozen=True)
+class SayOptions:
+    """How streamed sentences become `say` intents.
+
+    - ms_per_char: speaking-time estimate used for each sentence's hold
+    """
+
+    tier: Tier = Tier.activity
+    score: float = 1.0
+    ms_per_char: int = 60
+    min_hold_ms: int = 300
+    kind: str = "say"
+
+    def hold_ms(self, text: str) -> int:
+        return max(self.min_hold_ms, len(text) * self.ms_per_char)
+
+
+async def say_intents(
+    agent: str,
+    chunks: AsyncIterable[str],
+    options: SayOptions | None = None,
+) -> AsyncIterator[Intent]:
+    """Yield one `say` per completed sentence of `chunks`.
+
+    Yields:
+        The first sentence as a fresh intent, later ones as lock renewals.
+
+    """
+    opts = options or SayOptions()
+    splitter = SentenceSplitter()
+    first = True
+
+    def make(text: str) -> Intent:
+        nonlocal first
+        intent = Intent(
+            agent=agent,
+            kind=opts.kind,
+            params={"text": text},
+            resources=(Resource.speech,),
+            score=opts.score,
+            hold_ms=opts.hold_ms(text),
+            tier=opts.tier,
+            renews=not first,
+        )
+        first = False
+        return intent
+
+    async for chunk in chunks:
+        for sentence in splitter.feed(chunk):
+            yield make(sentence)
+    rest = splitter.flush()
+    if rest is not None:
+        yield make(rest)
@@ -1,13 +1,40 @@
-"""In-memory synchronous message bus for internal events.
+"""In-memory message buses for internal events.
 
-Simple, typed, and non-null. Suitable for initial orchestration.
+`Bus` is synchronous: subscribers run inline on the publisher's stack. Simple,
+typed, and non-null; suitable for initial orchestration and tests.
+
+`AsyncBus` decouples subscribers from publishers: each subscription owns a
+bounded `asyncio.Queue` drained by its own consumer task, with a configurable
+overflow policy. Publishing only enqueues, so a slow subscriber never stalls the
+publisher (e.g. the arbitration tick) or other subscribers.
+
+Both buses route through a `TopicIndex`: topics are dot-separated levels
+(`resobot.alice.commit`) and subscriptions may use MQTT-style wildcards, `*`
+for exactly one level and a trailing `#` for zero or more levels
+(`resobot.*.commit`, `resobot.#`). Patterns live in a trie, and each concrete
+topic's resolved subscriber tuple is cached until subscriptions change, so
+publishing to a hot topic is one dict lookup however many patterns exist.
 """
 
 from __future__ import annotations
 
-from collections import defaultdict
-from collections.abc import Callable
-from dataclasses import dataclass
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
+from enum import StrEnum
+from operator import itemgetter
+from typing import Self, cast
+
+logger = logging.getLogger(__name__)
+
+
+def monotonic_ms() -> float:
+    """Process-wide monotonic clock in milliseconds (event and intent stamps)."""
+    return time.monotonic() * 1000
 
 
 @dataclass(frozen=True)
@@ -16,27 +43,384 @@ class Event:
 
     - topic: domain-specific channel name
     - payload: immutable message data (recommend dataclasses/tuples)
+    - ts_ms: `monotonic_ms()` when the event was created
     """
 
     topic: str
     payload: object
+    ts_ms: float = field(default_factory=monotonic_ms, compare=False)
 
 
 Subscriber = Callable[[Event], None]
+AsyncSubscriber = Callable[[Event], Awaitable[None]]
+
+
+class Publisher(ABC):
+    """Anything events can be published to without blocking the caller."""
+
+    @abstractmethod
+    def publish(self, event: Event) -> None:
+        raise NotImplementedError
+
 
+TOPIC_SEP = "."
+WILDCARD_ONE = "*"
+WILDCARD_MANY = "#"
 
-class Bus:
-    """Synchronous pub/sub bus with per-topic subscribers."""
+
+def split_pattern(pattern: str) -> list[str]:
+    """Split a subscription pattern into levels, validating wildcards."""
+    levels = pattern.split(TOPIC_SEP)
+    if not pattern or not all(levels):
+        msg = f"invalid topic pattern: {pattern!r}"
+        raise ValueError(msg)
+    last = len(levels) - 1
+    for i, lv in enumerate(levels):
+        if WILDCARD_MANY in lv and (lv != WILDCARD_MANY or i != last):
+            msg = f"'#' must be the whole last level: {pattern!r}"
+            raise ValueError(msg)
+        if WILDCARD_ONE in lv and lv != WILDCARD_ONE:
+            msg = f"'*' must be a whole level: {pattern!r}"
+            raise ValueError(msg)
+    return levels
+
+
+class _Node:
+    __slots__ = ("children", "subs")
 
     def __init__(self) -> None:
-        self._subs: dict[str, list[Subscriber]] = defaultdict(list)
+        self.children: dict[str, _Node] = {}
+        # (subscription order, subscriber)
+        self.subs: list[tuple[int, Subscriber]] = []
+
+
+class TopicIndex:
+    """Trie of subscription patterns with a per-topic match cache.
+
+    - max_cached: resolved topics kept before the cache is reset
+    """
+
+    def __init__(self, *, max_cached: int = 65536) -> None:
+        self._root = _Node()
+        self._cache: dict[str, tuple[Subscriber, ...]] = {}
+        self._max_cached = max_cached
+        self._seq = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, pattern: str, subscriber: Subscriber) -> None:
+        node = self._root
+        for lv in split_pattern(pattern):
+            node = node.children.setdefault(lv, _Node())
+        self._seq += 1
+        node.subs.append((self._seq, subscriber))
+        self._size += 1
+        self._cache.clear()
+
+    def remove(self, pattern: str, subscriber: Subscriber) -> bool:
+        """Remove one registration of `subscriber` under `pattern`."""
+        path: list[tuple[_Node, str]] = []
+        node = self._root
+        for lv in split_pattern(pattern):
+            child = node.children.get(lv)
+            if child is None:
+                return False
+            path.append((node, lv))
+            node = child
+        for i, (_, fn) in enumerate(node.subs):
+            if fn == subscriber:
+                del node.subs[i]
+                break
+        else:
+            return False
+        # prune emptied branches
+        for parent, lv in reversed(path):
+            child = parent.children[lv]
+            if child.subs or child.children:
+                break
+            del parent.children[lv]
+        self._size -= 1
+        self._cache.clear()
+        return True
+
+    def match(self, topic: str) -> tuple[Subscriber, ...]:
+        """Subscribers whose pattern matches `topic`, in subscription order."""
+        hit = self._cache.get(topic)
+        if hit is not None:
+            return hit
+        found: list[tuple[int, Subscriber]] = []
+        _collect(self._root, topic.split(TOPIC_SEP), 0, found)
+        found.sort(key=itemgetter(0))
+        resolved = tuple(fn for _, fn in found)
+        if len(self._cache) >= self._max_cached:
+            self._cache.clear()
+        self._cache[topic] = resolved
+        return resolved
+
+
+def _collect(node: _Node, levels: list[str], i: int, out: list[tuple[int, Subscriber]]) -> None:
+    many = node.children.get(WILDCARD_MANY)
+    if many is not None:
+        out.extend(many.subs)
+    if i == len(levels):
+        out.extend(node.subs)
+        return
+    exact = node.children.get(levels[i])
+    if exact is not None:
+        _collect(exact, levels, i + 1, out)
+    one = node.children.get(WILDCARD_ONE)
+    if one is not None:
+        _collect(one, levels, i + 1, out)
+
+
+class Bus(Publisher):
+    """Synchronous pub/sub bus with wildcard topic subscriptions."""
+
+    def __init__(self) -> None:
+        self._index = TopicIndex()
 
     def subscribe(self, topic: str, subscriber: Subscriber) -> None:
         if not topic:
             raise ValueError("topic must be non-empty")
-        self._subs[topic].append(subscriber)
+        self._index.add(topic, subscriber)
+
+    def unsubscribe(self, topic: str, subscriber: Subscriber) -> bool:
+        return self._index.remove(topic, subscriber)
 
     def publish(self, event: Event) -> None:
-        subs = list(self._subs.get(event.topic, ()))
-        for fn in subs:
+        # match() returns an immutable tuple, so (un)subscribing from within a
+        # subscriber takes effect on the next publish.
+        for fn in self._index.match(event.topic):
             fn(event)
+
+
+class Overflow(StrEnum):
+    """What a full subscription queue does with a new event.
+
+    - drop_oldest: discard the oldest queued event to make room
+    - drop_newest: discard the new event
+    - block: keep every event; `publish` spills past the queue bound and
+      `publish_async` waits for room (backpressure for async producers)
+    - coalesce: keep only the latest queued event per key; when full with a new
+      key, discard the oldest key
+    """
+
+    drop_oldest = "drop_oldest"
+    drop_newest = "drop_newest"
+    block = "block"
+    coalesce = "coalesce"
+
+
+@dataclass(frozen=True)
+class QueuePolicy:
+    """Per-subscription queue bound and overflow behaviour.
+
+    - key: coalescing key for `Overflow.coalesce` (defaults to the event topic)
+    """
+
+    maxsize: int = 1024
+    overflow: Overflow = Overflow.drop_oldest
+    key: Callable[[Event], Hashable] | None = None
+
+    def __post_init__(self) -> None:
+        if self.maxsize < 1:
+            raise ValueError("maxsize must be positive")
+
+
+@dataclass(frozen=True)
+class SubscriptionStats:
+    """Snapshot of one subscription's queue and counters."""
+
+    topic: str
+    name: str
+    overflow: Overflow
+    maxsize: int
+    depth: int = 0
+    delivered: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    errors: int = 0
+
+
+class _Subscription:
+    def __init__(self, topic: str, fn: AsyncSubscriber, name: str, policy: QueuePolicy) -> None:
+        self.fn = fn
+        self.overflow = policy.overflow
+        self.key = policy.key
+        self.queue: asyncio.Queue[Event | Hashable] = asyncio.Queue(policy.maxsize)
+        self.spill: deque[Event] = deque()  # Overflow.block only
+        self.latest: dict[Hashable, Event] = {}  # Overflow.coalesce only
+        self.space = asyncio.Event()
+        self.space.set()
+        self.topic = topic
+        self.name = name
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.task: asyncio.Task[None] | None = None
+
+    @property
+    def depth(self) -> int:
+        return self.queue.qsize() + len(self.spill)
+
+    def __call__(self, event: Event) -> None:
+        self.offer(event)
+
+    def offer(self, event: Event) -> None:
+        q = self.queue
+        match self.overflow:
+            case Overflow.coalesce:
+                self._offer_coalesced(event)
+            case Overflow.block:
+                if self.spill or q.full():
+                    self.spill.append(event)
+                else:
+                    q.put_nowait(event)
+            case Overflow.drop_newest:
+                if q.full():
+                    self.dropped += 1
+                else:
+                    q.put_nowait(event)
+            case Overflow.drop_oldest:
+                if q.full():
+                    q.get_nowait()
+                    q.task_done()
+                    self.dropped += 1
+                q.put_nowait(event)
+        if self.depth >= q.maxsize:
+            self.space.clear()
+
+    def _offer_coalesced(self, event: Event) -> None:
+        k = self.key(event) if self.key is not None else event.topic
+        if k in self.latest:
+            self.latest[k] = event
+            self.coalesced += 1
+            return
+        if self.queue.full():
+            old = self.queue.get_nowait()
+            self.queue.task_done()
+            del self.latest[old]
+            self.dropped += 1
+        self.latest[k] = event
+        self.queue.put_nowait(k)
+
+    async def wait_for_space(self) -> None:
+        while self.depth >= self.queue.maxsize:
+            self.space.clear()
+            await self.space.wait()
+
+    async def consume(self) -> None:
+        q = self.queue
+        while True:
+            item = await q.get()
+            if self.spill:
+                q.put_nowait(self.spill.popleft())
+            if self.overflow is Overflow.coalesce:
+                event = self.latest.pop(item)
+            else:
+                event = cast("Event", item)
+            if self.depth < q.maxsize:
+                self.space.set()
+            try:
+                await self.fn(event)
+            except Exception:
+                logger.exception("Subscriber %s failed on %s", self.name, event)
+                self.errors += 1
+            else:
+                self.delivered += 1
+            finally:
+                q.task_done()
+
+    def snapshot(self) -> SubscriptionStats:
+        return SubscriptionStats(
+            topic=self.topic,
+            name=self.name,
+            overflow=self.overflow,
+            maxsize=self.queue.maxsize,
+            depth=self.depth,
+            delivered=self.delivered,
+            dropped=self.dropped,
+            coalesced=self.coalesced,
+            errors=self.errors,
+        )
+
+
+class AsyncBus(Publisher):
+    """Async pub/sub bus with a bounded queue and consumer task per subscriber.
+
+    Subscribe from within a running event loop. `publish` never waits; use
+    `publish_async` to apply backpressure from `Overflow.block` subscribers.
+    Close with `aclose()` or use as an async context manager.
+    """
+
+    def __init__(self) -> None:
+        self._index = TopicIndex()
+        self._subs: list[_Subscription] = []
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.aclose()
+
+    def subscribe(
+        self,
+        topic: str,
+        subscriber: AsyncSubscriber,
+        policy: QueuePolicy | None = None,
+        *,
+        name: str | None = None,
+    ) -> None:
+        if not topic:
+            raise ValueError("topic must be non-empty")
+        sub = _Subscription(
+            topic,
+            subscriber,
+            name or getattr(subscriber, "__qualname__", repr(subscriber)),
+            policy or QueuePolicy(),
+        )
+        self._index.add(topic, sub)
+        sub.task = asyncio.get_running_loop().create_task(sub.consume())
+        self._subs.append(sub)
+
+    def unsubscribe(self, topic: str, subscriber: AsyncSubscriber) -> bool:
+        """Remove the subscription and cancel its consumer; queued events are lost."""
+        sub = next((s for s in self._subs if s.topic == topic and s.fn == subscriber), None)
+        if sub is None:
+            return False
+        self._index.remove(topic, sub)
+        self._subs.remove(sub)
+        if sub.task is not None:
+            sub.task.cancel()
+        return True
+
+    def publish(self, event: Event) -> None:
+        for sub in self._index.match(event.topic):
+            sub(event)
+
+    async def publish_async(self, event: Event) -> None:
+        """Publish, first waiting for room in any full `Overflow.block` queue."""
+        for sub in self._index.match(event.topic):
+            if isinstance(sub, _Subscription) and sub.overflow is Overflow.block:
+                await sub.wait_for_space()
+            sub(event)
+
+    async def drain(self) -> None:
+        """Wait until every queued event has been handled."""
+        for sub in list(self._subs):
+            await sub.queue.join()
+
+    def stats(self) -> list[SubscriptionStats]:
+        return [sub.snapshot() for sub in self._subs]
+
+    async def aclose(self) -> None:
+        """Cancel consumer tasks; queued events are discarded."""
+        tasks = [s.task for s in self._subs if s.task is not None]
+        self._index = TopicIndex()
+        self._subs.clear()
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,166 @@
+"""Async TTL/LRU cache with request coalescing.
+
+Entries expire after a per-entry TTL and are evicted least-recently-used once
+either the entry cap or the byte cap (as measured by `sizeof`) is exceeded.
+Concurrent `get_or_load` calls for a key that is not cached share a single
+in-flight load task; cancelling one caller does not cancel the load for the
+others. A load that raises is not cached and its error reaches every waiter.
+Invalidating a key also detaches its in-flight load, so a result fetched before
+the change is returned to its waiters but never stored.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+
+Loader = Callable[[], Awaitable[object]]
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0  # loads actually started
+    coalesced: int = 0  # callers that joined an in-flight load
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses + self.coalesced
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass(slots=True)
+class _Entry:
+    value: object
+    expires_at: float
+    size: int
+
+
+class AsyncTTLCache:
+    """Maps hashable keys to values loaded on demand.
+
+    - max_entries: entry cap (LRU beyond it)
+    - max_bytes: cap on the summed `sizeof` of cached values (None = unbounded)
+    - sizeof: size estimate for a value; defaults to `sys.getsizeof`
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 1024,
+        max_bytes: int | None = None,
+        sizeof: Callable[[object], int] = sys.getsizeof,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Future[object]] = {}
+        self._bytes = 0
+        self.stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: Hashable) -> tuple[bool, object]:
+        """Return `(True, value)` for a live entry, else `(False, None)`."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        if entry.expires_at <= self._clock():
+            self._drop(key)
+            self.stats.expirations += 1
+            return False, None
+        self._entries.move_to_end(key)
+        return True, entry.value
+
+    def put(self, key: Hashable, value: object, ttl_s: float) -> None:
+        if ttl_s <= 0:
+            return
+        size = self._sizeof(value)
+        if self._max_bytes is not None and size > self._max_bytes:
+            return  # would evict everything and still not fit
+        if key in self._entries:
+            self._drop(key)
+        self._entries[key] = _Entry(value, self._clock() + ttl_s, size)
+        self._bytes += size
+        self._evict()
+
+    async def get_or_load(self, key: Hashable, loader: Loader, ttl_s: float) -> object:
+        """Return the cached value for `key`, loading (once) when missing."""
+        found, value = self.get(key)
+        if found:
+            self.stats.hits += 1
+            return value
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.stats.coalesced += 1
+            return await asyncio.shield(pending)
+
+        self.stats.misses += 1
+        task = asyncio.ensure_future(loader())
+        self._inflight[key] = task
+        task.add_done_callback(lambda t: self._settle(key, t, ttl_s))
+        return await asyncio.shield(task)
+
+    def invalidate(self, key: Hashable) -> bool:
+        """Drop `key`; a load already in flight for it will not be cached."""
+        self._inflight.pop(key, None)
+        if key not in self._entries:
+            return False
+        self._drop(key)
+        self.stats.invalidations += 1
+        return True
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Drop every entry whose key satisfies `predicate`; returns the count."""
+        for k in [k for k in self._inflight if predicate(k)]:
+            del self._inflight[k]
+        doomed = [k for k in self._entries if predicate(k)]
+        for k in doomed:
+            self._drop(k)
+        self.stats.invalidations += len(doomed)
+        return len(doomed)
+
+    def clear(self) -> None:
+        self.stats.invalidations += len(self._entries)
+        self._inflight.clear()
+        self._entries.clear()
+        self._bytes = 0
+
+    def _settle(self, key: Hashable, task: asyncio.Future[object], ttl_s: float) -> None:
+        # not current when invalidated mid-load: the result may predate the change
+        current = self._inflight.get(key) is task
+        if current:
+            del self._inflight[key]
+        if task.cancelled() or task.exception() is not None:  # marks a failure retrieved
+            return
+        if current:
+            self.put(key, task.result(), ttl_s)
+
+    def _drop(self, key: Hashable) -> None:
+        self._bytes -= self._entries.pop(key).size
+
+    def _evict(self) -> None:
+        over_bytes = self._max_bytes
+        while len(self._entries) > self._max_entries or (
+            over_bytes is not None and self._bytes > over_bytes
+        ):
+            key = next(iter(self._entries))
+            self._drop(key)
+            self.stats.evictions += 1
@@ -0,0 +1,335 @@
+"""Seeded synthetic workloads and benchmarks for the orchestration core.
+
+`generate` turns a `WorkloadSpec` (proposer count, tier mix, hold times,
+resource distribution) into a fixed script of intents per tick and proposer,
+so the same seed always yields the same workload. `run_bench` replays the
+script through `Arbiter.tick`, `Coordinator.tick_async`, or `Bus.publish`
+with a `ManualClock` injected as `Arbiter.now_ms_fn`, advancing one tick
+period per tick, and reports ticks/sec, per-tick latency percentiles, and
+bytes allocated per tick (a second, tracemalloc-instrumented pass) as a
+JSON-ready dict. `resobot-gw bench` is the command-line front end.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import platform
+import random
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from dataclasses import asdict, dataclass, field
+from enum import StrEnum
+
+from . import __version__
+from .agents.coordinator import AgentSpec, AsyncProposer, Coordinator, ReasoningEffort
+from .agents.orchestrator import Arbiter, Intent, Resource, Tier
+from .bus import Bus, Event
+
+DEFAULT_TIER_MIX: Mapping[Tier, float] = {
+    Tier.reflex: 0.3,
+    Tier.safety: 0.05,
+    Tier.activity: 0.45,
+    Tier.planner: 0.2,
+}
+# roughly how often each resource shows up in the taxonomy's intents
+DEFAULT_RESOURCE_MIX: Mapping[Resource, float] = {
+    Resource.speech: 3.0,
+    Resource.head: 3.0,
+    Resource.locomotion: 2.0,
+    Resource.hands_l: 1.0,
+    Resource.hands_r: 1.0,
+    Resource.ui: 1.0,
+    Resource.sensors: 0.5,
+}
+
+
+@dataclass(frozen=True)
+class WorkloadSpec:
+    """Shape of a synthetic workload.
+
+    - propose_rate: chance a proposer proposes in a given tick
+    - tier_mix / resource_mix: relative weights (need not sum to 1)
+    - hold_ms: inclusive (min, max) hold time, drawn uniformly
+    - max_resources: each intent needs 1..max_resources distinct resources
+    - warmup_ticks: leading ticks run but not measured
+    """
+
+    seed: int = 1234
+    proposers: int = 32
+    ticks: int = 1000
+    tick_ms: int = 50
+    propose_rate: float = 0.8
+    tier_mix: Mapping[Tier, float] = field(default_factory=lambda: dict(DEFAULT_TIER_MIX))
+    resource_mix: Mapping[Resource, float] = field(
+        default_factory=lambda: dict(DEFAULT_RESOURCE_MIX),
+    )
+    hold_ms: tuple[int, int] = (50, 500)
+    max_resources: int = 3
+    warmup_ticks: int = 50
+
+    def __post_init__(self) -> None:
+        if self.proposers < 1 or self.ticks < 1 or self.tick_ms < 1:
+            raise ValueError("proposers, ticks and tick_ms must be positive")
+        if not 0.0 <= self.propose_rate <= 1.0:
+            raise ValueError("propose_rate must be within [0, 1]")
+        lo, hi = self.hold_ms
+        if not 0 <= lo <= hi:
+            raise ValueError("hold_ms must be an ordered (min, max) pair")
+        if self.max_resources < 1:
+            raise ValueError("max_resources must be positive")
+        for name, mix in (("tier_mix", self.tier_mix), ("resource_mix", self.resource_mix)):
+            if any(w < 0 for w in mix.values()) or not any(w > 0 for w in mix.values()):
+                msg = f"{name} needs non-negative weights with a positive total"
+                raise ValueError(msg)
+
+    def to_json(self) -> dict[str, object]:
+        out = asdict(self)
+        out["tier_mix"] = {t.name: w for t, w in self.tier_mix.items()}
+        out["resource_mix"] = {str(r): w for r, w in self.resource_mix.items()}
+        out["hold_ms"] = list(self.hold_ms)
+        return out
+
+
+@dataclass(frozen=True)
+class Workload:
+    """Pre-generated intents: `script[tick][proposer]`."""
+
+    spec: WorkloadSpec
+    script: tuple[tuple[tuple[Intent, ...], ...], ...]
+
+    def tick(self, i: int) -> list[Intent]:
+        return [intent for batch in self.script[i] for intent in batch]
+
+
+def generate(spec: WorkloadSpec) -> Workload:
+    """Build the deterministic intent script for `spec`."""
+    rng = random.Random(spec.seed)  # noqa: S311 - reproducible, not secret
+    tiers = [t for t, w in spec.tier_mix.items() if w > 0]
+    tier_w = [spec.tier_mix[t] for t in tiers]
+    resources = [r for r, w in spec.resource_mix.items() if w > 0]
+    res_w = [spec.resource_mix[r] for r in resources]
+    width = min(spec.max_resources, len(resources))
+    lo, hi = spec.hold_ms
+
+    def draw_resources() -> tuple[Resource, ...]:
+        picked: list[Resource] = []
+        for _ in range(rng.randint(1, width)):
+            while (r := rng.choices(resources, res_w)[0]) in picked:
+                pass
+            picked.append(r)
+        return tuple(picked)
+
+    def draw(agent: str) -> tuple[Intent, ...]:
+        if rng.random() >= spec.propose_rate:
+            return ()
+        intent = Intent(
+            agent=agent,
+            kind="act",
+            params={},
+            resources=draw_resources(),
+            score=rng.random(),
+            hold_ms=rng.randint(lo, hi),
+            tier=rng.choices(tiers, tier_w)[0],
+        )
+        return (intent,)
+
+    agents = [f"p{i}" for i in range(spec.proposers)]
+    script = tuple(tuple(draw(a) for a in agents) for _ in range(spec.ticks))
+    return Workload(spec, script)
+
+
+class ManualClock:
+    """Millisecond clock advanced explicitly (inject as `now_ms_fn`)."""
+
+    def __init__(self, start_ms: int = 0) -> None:
+        self.now_ms = start_ms
+
+    def __call__(self) -> int:
+        return self.now_ms
+
+    def advance(self, ms: int) -> None:
+        self.now_ms += ms
+
+
+class BenchTarget(StrEnum):
+    arbiter = "arbiter"
+    coordinator = "coordinator"
+    bus = "bus"
+
+
+SyncStep = Callable[[int], int]
+AsyncStep = Callable[[int], Awaitable[int]]
+
+
+def _arbiter_step(workload: Workload) -> SyncStep:
+    clock = ManualClock()
+    arbiter = Arbiter(now_ms_fn=clock)
+    tick_ms = workload.spec.tick_ms
+
+    def step(i: int) -> int:
+        clock.advance(tick_ms)
+        return len(arbiter.tick(workload.tick(i)))
+
+    return step
+
+
+def _bench_bus() -> Bus:
+    bus = Bus()
+    sink: list[Event] = []
+    for pattern in ("resobot.bench.commit", "resobot.*.commit", "resobot.#", "*.*.action.done"):
+        bus.subscribe(pattern, sink.append)
+    bus.subscribe("resobot.#", lambda _: sink.clear())
+    return bus
+
+
+def _bus_step(workload: Workload) -> SyncStep:
+    bus = _bench_bus()
+
+    def step(i: int) -> int:
+        intents = workload.tick(i)
+        bus.publish(Event("resobot.bench.commit", intents))
+        for intent in intents:
+            bus.publish(Event("resobot.bench.action.done", intent))
+        return len(intents)
+
+    return step
+
+
+@dataclass
+class ScriptedProposer(AsyncProposer):
+    """Returns its column of a workload script for the current tick."""
+
+    workload: Workload = field(kw_only=True)
+    index: int = field(kw_only=True)
+    tick: int = 0
+
+    async def propose(self) -> Iterable[Intent]:
+        return self.workload.script[self.tick][self.index]
+
+
+def _coordinator_step(workload: Workload) -> AsyncStep:
+    clock = ManualClock()
+    coord = Coordinator(arbiter=Arbiter(now_ms_fn=clock), bus=_bench_bus())
+    proposers = [
+        ScriptedProposer(
+            AgentSpec(name=f"p{i}", model="-", instructions="", reasoning=ReasoningEffort.low),
+            workload=workload,
+            index=i,
+        )
+        for i in range(workload.spec.proposers)
+    ]
+    tick_ms = workload.spec.tick_ms
+
+    async def step(i: int) -> int:
+        clock.advance(tick_ms)
+        for p in proposers:
+            p.tick = i
+        return len(await coord.tick_async(proposers))
+
+    return step
+
+
+def percentile(ordered: list[int], q: float) -> int:
+    """Nearest-rank `q`-quantile of an ascending, non-empty list."""
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))]
+
+
+@dataclass
+class _Samples:
+    tick_ns: list[int] = field(default_factory=list)
+    alloc_bytes: list[int] = field(default_factory=list)
+    commits: int = 0
+    wall_s: float = 0.0
+
+
+def _run_sync(make: Callable[[Workload], SyncStep], workload: Workload, out: _Samples) -> None:
+    warmup = min(workload.spec.warmup_ticks, workload.spec.ticks - 1)
+    step = make(workload)
+    for i in range(warmup):
+        step(i)
+    start = time.perf_counter()
+    for i in range(warmup, workload.spec.ticks):
+        t0 = time.perf_counter_ns()
+        out.commits += step(i)
+        out.tick_ns.append(time.perf_counter_ns() - t0)
+    out.wall_s = time.perf_counter() - start
+    # second pass on fresh state: tracing slows ticks, so it is not timed
+    step = make(workload)
+    tracemalloc.start()
+    try:
+        for i in range(workload.spec.ticks):
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            step(i)
+            if i >= warmup:
+                out.alloc_bytes.append(tracemalloc.get_traced_memory()[1] - base)
+    finally:
+        tracemalloc.stop()
+
+
+async def _run_async(
+    make: Callable[[Workload], AsyncStep],
+    workload: Workload,
+    out: _Samples,
+) -> None:
+    warmup = min(workload.spec.warmup_ticks, workload.spec.ticks - 1)
+    step = make(workload)
+    for i in range(warmup):
+        await step(i)
+    start = time.perf_counter()
+    for i in range(warmup, workload.spec.ticks):
+        t0 = time.perf_counter_ns()
+        out.commits += await step(i)
+        out.tick_ns.append(time.perf_counter_ns() - t0)
+    out.wall_s = time.perf_counter() - start
+    step = make(workload)
+    tracemalloc.start()
+    try:
+        for i in range(workload.spec.ticks):
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            await step(i)
+            if i >= warmup:
+                out.alloc_bytes.append(tracemalloc.get_traced_memory()[1] - base)
+    finally:
+        tracemalloc.stop()
+
+
+def run_bench(target: BenchTarget, workload: Workload) -> dict[str, object]:
+    """Drive `target` through `workload`; returns a JSON-ready result.
+
+    `items_per_tick` counts commits (arbiter, coordinator) or intents
+    published (bus).
+    """
+    samples = _Samples()
+    match target:
+        case BenchTarget.arbiter:
+            _run_sync(_arbiter_step, workload, samples)
+        case BenchTarget.bus:
+            _run_sync(_bus_step, workload, samples)
+        case BenchTarget.coordinator:
+            asyncio.run(_run_async(_coordinator_step, workload, samples))
+    ticks = len(samples.tick_ns)
+    ordered = sorted(samples.tick_ns)
+    allocs = sorted(samples.alloc_bytes)
+    return {
+        "target": str(target),
+        "version": __version__,
+        "python": platform.python_version(),
+        "workload": workload.spec.to_json(),
+        "ticks": ticks,
+        "ticks_per_s": round(ticks / samples.wall_s, 1) if samples.wall_s > 0 else 0.0,
+        "tick_us": {
+            "p50": round(percentile(ordered, 0.5) / 1e3, 3),
+            "p95": round(percentile(ordered, 0.95) / 1e3, 3),
+            "p99": round(percentile(ordered, 0.99) / 1e3, 3),
+            "max": round(ordered[-1] / 1e3, 3),
+        },
+        "alloc_bytes_per_tick": {
+            "mean": round(sum(allocs) / len(allocs), 1),
+            "p95": percentile(allocs, 0.95),
+        },
+        "items_per_tick": round(samples.commits / ticks, 3),
+    }
@@ -0,0 +1,695 @@
+"""Episodic memory: an append-only memory-mapped store with a vector index.
+
+`MemoryStore` subscribes to commit events (payload: list of intents) and
+`action.done` events (payload: `ActionDone`) and appends one compact `Episode`
+per intent: wall-clock time, stage, outcome, and a short text (agent, kind,
+params, detail) truncated to `text_bytes`. Episodes and their embeddings live
+in two files of fixed-size rows, `<path>` and `<path>.vec`, each mapped into
+memory: opening an existing store maps it rather than parsing it, and appends
+write into the mapping, growing the file in chunks. A row's vector is written
+before its episode, so after a crash the shorter file decides the row count.
+
+Embeddings come from a pluggable `Embedder`; `HashingEmbedder` is a
+deterministic feature-hashing stand-in for tests and offline runs.
+`VectorIndex` is an inverted-file (IVF) approximate index over the mapped
+vectors: past `exact_below` rows, k-means centroids partition them and a query
+only scores the rows of its `nprobe` nearest partitions, which keeps top-k
+retrieval under a millisecond for proposers. Smaller stores are searched
+exactly. Clustering runs on a background thread, so appends (bus subscribers)
+never wait for it; the current partitions serve queries until the new ones
+are installed. A store keeps its centroids in `<path>.ivf` and each row's
+partition in `<path>.asg`, both tagged with the row count they were trained
+on, so reopening maps the index instead of re-clustering.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import mmap
+import os
+import re
+import struct
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from types import TracebackType
+from typing import Self
+
+import numpy as np
+
+from .agents.orchestrator import Intent
+from .bus import Bus, Event
+from .slo import ActionDone, Stage
+
+logger = logging.getLogger(__name__)
+
+TEXT_BYTES = 240
+
+# magic, row size in bytes, row count, tag; rows start at _HEADER_SIZE
+_HEADER = struct.Struct("<8sIQQ")
+_HEADER_SIZE = 64
+_U64 = struct.Struct("<Q")
+_COUNT_AT = 12
+_TAG_AT = 20
+_EPISODES_MAGIC = b"RBGWMEM1"
+_VECTORS_MAGIC = b"RBGWVEC1"
+_CENTROIDS_MAGIC = b"RBGWIVF1"
+_ASSIGN_MAGIC = b"RBGWASG1"
+_ASSIGN = np.dtype("<i4")
+_STAGES = tuple(Stage)
+_WORD = re.compile(r"\w+")
+
+
+def wall_ms() -> float:
+    """Wall-clock milliseconds (episodes outlive the process's monotonic clock)."""
+    return time.time() * 1000
+
+
+class Embedder(ABC):
+    """Turns episode text and queries into `dim`-sized float32 vectors."""
+
+    dim: int
+
+    @abstractmethod
+    def embed(self, text: str) -> np.ndarray:
+        raise NotImplementedError
+
+
+@dataclass(frozen=True)
+class HashingEmbedder(Embedder):
+    """Deterministic bag-of-words feature hashing, L2-normalised.
+
+    Texts sharing words land close together; no model or network needed.
+    """
+
+    dim: int = 64
+
+    def embed(self, text: str) -> np.ndarray:
+        vec = np.zeros(self.dim, dtype=np.float32)
+        for word in _WORD.findall(text.lower()):
+            h = zlib.crc32(word.encode())
+            vec[h % self.dim] += 1.0 if h & 0x8000_0000 else -1.0
+        norm = float(np.linalg.norm(vec))
+        return vec / norm if norm else vec
+
+
+@dataclass(frozen=True)
+class Episode:
+    """One remembered commit or completed action."""
+
+    ts_ms: float
+    stage: Stage
+    ok: bool
+    text: str
+
+
+@dataclass(frozen=True)
+class Recall:
+    """A search hit: store row, cosine similarity, and the episode."""
+
+    row: int
+    score: float
+    episode: Episode
+
+
+def episode_text(intent: Intent, detail: str = "") -> str:
+    params = " ".join(f"{k}={v}" for k, v in intent.params.items())
+    return " ".join(part for part in (intent.agent, intent.kind, params, detail) if part)
+
+
+class _MappedRows:
+    """A file of fixed-size numpy rows behind a small header, mapped read/write.
+
+    The header's `tag` is free for the owner (0 in a fresh file). Growing
+    unmaps the file before resizing it (Windows cannot resize a mapped file),
+    so `rows` views must not outlive a `reserve`; other threads read through
+    `snapshot`, which copies under the same lock.
+    """
+
+    def __init__(self, path: Path, dtype: np.dtype, magic: bytes, chunk: int) -> None:
+        self.path = path
+        self.dtype = dtype
+        self._chunk = chunk
+        self._lock = threading.Lock()
+        fresh = not path.exists() or path.stat().st_size < _HEADER_SIZE
+        self._file = path.open("w+b" if fresh else "r+b")
+        if fresh:
+            self._file.write(_HEADER.pack(magic, dtype.itemsize, 0, 0).ljust(_HEADER_SIZE, b"\0"))
+            self._file.truncate(_HEADER_SIZE + chunk * dtype.itemsize)
+            self._file.flush()
+        self._map()
+        found, itemsize, self.count, self.tag = _HEADER.unpack_from(self._mm)
+        if found != magic or itemsize != dtype.itemsize:
+            self.close()
+            msg = f"{path} is not a store with {dtype.itemsize}-byte rows"
+            raise ValueError(msg)
+        self.count = min(self.count, self.capacity)
+
+    def _map(self) -> None:
+        self._mm = mmap.mmap(self._file.fileno(), 0)
+        self.capacity = (len(self._mm) - _HEADER_SIZE) // self.dtype.itemsize
+        self.rows: np.ndarray = np.ndarray(
+            (self.capacity,),
+            dtype=self.dtype,
+            buffer=self._mm,
+            offset=_HEADER_SIZE,
+        )
+
+    def reserve(self, row: int) -> None:
+        """Grow the file, a whole number of chunks at once, until `row` fits."""
+        if row < self.capacity:
+            return
+        chunks = (row - self.capacity) // self._chunk + 1
+        size = _HEADER_SIZE + (self.capacity + chunks * self._chunk) * self.dtype.itemsize
+        with self._lock:
+            # not flushed: dirty pages stay in the page cache across the remap
+            self.rows = np.empty(0, dtype=self.dtype)
+            self._mm.close()
+            os.ftruncate(self._file.fileno(), size)
+            self._map()
+
+    def snapshot(self, n: int) -> np.ndarray:
+        """A copy of the first `n` rows, safe to take from another thread."""
+        with self._lock:
+            return np.array(self.rows[:n])
+
+    def commit(self, count: int) -> None:
+        self.count = count
+        _U64.pack_into(self._mm, _COUNT_AT, count)
+
+    def set_tag(self, tag: int) -> None:
+        self.tag = tag
+        _U64.pack_into(self._mm, _TAG_AT, tag)
+
+    @property
+    def closed(self) -> bool:
+        return self._mm.closed
+
+    def flush(self) -> None:
+        self._mm.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._mm.closed:
+                return
+            self.rows = np.empty(0, dtype=self.dtype)
+            self._mm.flush()
+            self._mm.close()
+            self._file.close()
+
+
+class _Partition:
+    """One IVF list: its rows and a contiguous copy of their vectors.
+
+    Partitions loaded from a saved index gather their vectors on first probe.
+    """
+
+    __slots__ = ("rows", "size", "vecs")
+
+    def __init__(self, rows: np.ndarray, vecs: np.ndarray | None = None) -> None:
+        self.rows = rows
+        self.vecs = vecs
+        self.size = len(rows)
+
+    @classmethod
+    def gather(cls, rows: np.ndarray, vectors: np.ndarray) -> Self:
+        """A partition of `rows` with their vectors, and room for a quarter more."""
+        cap = len(rows) + len(rows) // 4 + 16
+        part = cls(np.resize(rows, cap), np.empty((cap, vectors.shape[1]), dtype=vectors.dtype))
+        part.vecs[: len(rows)] = vectors[rows]
+        part.size = len(rows)
+        return part
+
+    def add(self, row: int, vec: np.ndarray) -> None:
+        if self.size == len(self.rows):
+            cap = max(16, 2 * self.size)
+            self.rows = np.resize(self.rows, cap)
+            if self.vecs is not None:
+                self.vecs = np.resize(self.vecs, (cap, self.vecs.shape[1]))
+        self.rows[self.size] = row
+        if self.vecs is not None:
+            self.vecs[self.size] = vec
+        self.size += 1
+
+    def extend(self, rows: np.ndarray, vectors: np.ndarray) -> None:
+        """Append `rows`, whose vectors are `vectors[rows]`."""
+        end = self.size + len(rows)
+        if end > len(self.rows):
+            cap = max(16, 2 * end)
+            self.rows = np.resize(self.rows, cap)
+            if self.vecs is not None:
+                self.vecs = np.resize(self.vecs, (cap, self.vecs.shape[1]))
+        self.rows[self.size : end] = rows
+        if self.vecs is not None:
+            self.vecs[self.size : end] = vectors[rows]
+        self.size = end
+
+    def block(self, vectors: np.ndarray) -> np.ndarray:
+        """The partition's vectors, gathered from `vectors` on first use."""
+        if self.vecs is None:
+            self.vecs = np.empty((len(self.rows), vectors.shape[1]), dtype=vectors.dtype)
+            self.vecs[: self.size] = vectors[self.rows[: self.size]]
+        return self.vecs[: self.size]
+
+
+def _label(vectors: np.ndarray, centroids: np.ndarray, block: int = 4096) -> np.ndarray:
+    """Nearest centroid per row, in blocks (short GIL holds for a background thread)."""
+    out = np.empty(len(vectors), dtype=_ASSIGN)
+    for i in range(0, len(vectors), block):
+        out[i : i + block] = np.argmax(vectors[i : i + block] @ centroids.T, axis=1)
+    return out
+
+
+def _split(labels: np.ndarray, k: int) -> list[np.ndarray]:
+    """Row numbers grouped by label, one array per label in `range(k)`."""
+    order = np.argsort(labels, kind="stable")
+    return np.split(order, np.cumsum(np.bincount(labels, minlength=k))[:-1])
+
+
+@dataclass(frozen=True)
+class _Fitted:
+    """k-means output for the first `n` rows: centroids, labels, and partitions."""
+
+    n: int
+    centroids: np.ndarray
+    assign: np.ndarray
+    parts: list[_Partition]
+
+
+def _head(vectors: np.ndarray, n: int) -> np.ndarray:
+    return vectors[:n]
+
+
+class _Training:
+    """A k-means run over the first `n` rows, loaded by `load(n)`, on a background thread."""
+
+    def __init__(
+        self,
+        fit: Callable[[np.ndarray], _Fitted],
+        load: Callable[[int], np.ndarray],
+        n: int,
+    ) -> None:
+        self.n = n
+        self.result: _Fitted | None = None
+        self.thread = threading.Thread(
+            target=self._run,
+            args=(fit, load),
+            name="memory-index-train",
+            daemon=True,
+        )
+        self.thread.start()
+
+    def _run(self, fit: Callable[[np.ndarray], _Fitted], load: Callable[[int], np.ndarray]) -> None:
+        try:
+            self.result = fit(load(self.n))
+        except Exception:
+            logger.exception("memory index training over %d rows failed", self.n)
+
+
+@dataclass
+class VectorIndex:
+    """IVF approximate nearest-neighbour index over unit vectors (cosine).
+
+    Each partition keeps its own contiguous vector block, so a query scores
+    `nprobe` blocks without gathering rows from the store.
+
+    - exact_below: search exactly until this many vectors exist
+    - nprobe: partitions scored per query
+    - retrain_growth: re-cluster when the row count grows by this factor
+
+    Re-clustering runs on a background thread and is installed by the next
+    `add` or `search` once done (or by `wait`). Only the owning thread may call
+    the other methods.
+    """
+
+    exact_below: int = 4096
+    nprobe: int = 8
+    retrain_growth: float = 4.0
+    kmeans_iters: int = 8
+    seed: int = 0
+    _centroids: np.ndarray | None = field(default=None, init=False, repr=False)
+    _parts: list[_Partition] = field(default_factory=list, init=False, repr=False)
+    _trained_at: int = field(default=0, init=False, repr=False)
+    _job: _Training | None = field(default=None, init=False, repr=False)
+    _ivf_path: Path | None = field(default=None, init=False, repr=False)
+    _assign: _MappedRows | None = field(default=None, init=False, repr=False)
+    _load: Callable[[int], np.ndarray] | None = field(default=None, init=False, repr=False)
+
+    @property
+    def partitions(self) -> int:
+        return len(self._parts)
+
+    @property
+    def training(self) -> bool:
+        """Whether a background re-clustering has not been installed yet."""
+        return self._job is not None
+
+    def open(
+        self,
+        path: Path,
+        vectors: np.ndarray,
+        chunk: int = 4096,
+        load: Callable[[int], np.ndarray] | None = None,
+    ) -> None:
+        """Persist the index next to `path`, loading what an earlier run saved.
+
+        `vectors` holds every stored row. Saved partitions are used when the
+        centroid and assignment files agree; rows added since are assigned
+        now. Otherwise a store past `exact_below` is re-clustered in the
+        background. `load(n)` copies the first `n` rows for background
+        clustering; without it, clustering reads the `vectors` passed in.
+        """
+        self._load = load
+        self._ivf_path = path.with_name(path.name + ".ivf")
+        self._assign = _MappedRows(
+            path.with_name(path.name + ".asg"),
+            _ASSIGN,
+            _ASSIGN_MAGIC,
+            chunk,
+        )
+        n = len(vectors)
+        saved = self._read_centroids(vectors.shape[1])
+        if saved is not None and 0 < saved[1] == self._assign.tag <= n:
+            centroids, trained_at = saved
+            m = min(self._assign.count, n)
+            self._parts = [
+                _Partition(rows) for rows in _split(self._assign.rows[:m], len(centroids))
+            ]
+            self._centroids = centroids
+            self._trained_at = trained_at
+            self._place_from(vectors, m)
+            self._assign.set_tag(trained_at)
+        elif n >= self.exact_below:
+            logger.info("memory index: no saved partitions for %d rows, clustering", n)
+            self._train_async(vectors, n)
+
+    def add(self, vectors: np.ndarray, row: int) -> None:
+        """Index `vectors[row]`; `vectors` holds every row stored so far."""
+        self._install_done(vectors[:row])
+        if self._centroids is not None:
+            self._place(vectors, row)
+        n = row + 1
+        if (
+            self._job is None
+            and n >= self.exact_below
+            and n >= self._trained_at * self.retrain_growth
+        ):
+            self._train_async(vectors, n)
+
+    def train(self, vectors: np.ndarray) -> None:
+        """Cluster `vectors` (all rows) in the calling thread and install the result."""
+        if self._job is not None:
+            self._job.thread.join()  # superseded; also frees the staged centroid file
+            self._job = None
+        if len(vectors) >= self.exact_below:
+            self._install(self._prepare(vectors), vectors)
+
+    def wait(self, vectors: np.ndarray) -> None:
+        """Finish and install a background re-clustering; `vectors` holds every row."""
+        if self._job is not None:
+            self._job.thread.join()
+            self._install_done(vectors)
+
+    def search(self, vectors: np.ndarray, query: np.ndarray, k: int) -> list[tuple[int, float]]:
+        """Top-`k` (row, cosine) pairs among `vectors`, best first."""
+        self._install_done(vectors)
+        if self._centroids is None:
+            rows = np.arange(len(vectors))
+            scores = vectors @ query
+        else:
+            near = self._centroids @ query
+            probe = np.argpartition(-near, min(self.nprobe, len(near)) - 1)[: self.nprobe]
+            parts = [self._parts[p] for p in probe.tolist()]
+            rows = np.concatenate([p.rows[: p.size] for p in parts])
+            scores = np.concatenate([p.block(vectors) @ query for p in parts])
+        if len(rows) > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+            rows, scores = rows[top], scores[top]
+        order = np.argsort(-scores, kind="stable")
+        return list(zip(rows[order].tolist(), scores[order].tolist(), strict=True))
+
+    def flush(self) -> None:
+        if self._assign is not None:
+            self._assign.flush()
+
+    def close(self) -> None:
+        """Stop using the saved files; an unfinished re-clustering is discarded."""
+        if self._job is not None:
+            self._job.thread.join()
+            self._job = None
+        if self._assign is not None:
+            self._assign.close()
+
+    def _train_async(self, vectors: np.ndarray, n: int) -> None:
+        load = self._load or partial(_head, vectors)
+        self._job = _Training(self._prepare, load, n)
+
+    def _prepare(self, vectors: np.ndarray) -> _Fitted:
+        """`_fit`, then stage the centroid file for `_install` to move into place."""
+        fitted = self._fit(vectors)
+        if self._ivf_path is not None:
+            self._write_centroids(fitted.centroids, fitted.n)
+        return fitted
+
+    def _fit(self, vectors: np.ndarray) -> _Fitted:
+        """k-means over a sample of `vectors`, then label every row; touches no state."""
+        n = len(vectors)
+        rng = np.random.default_rng(self.seed)
+        k = min(1024, max(16, math.isqrt(n)))
+        sample = vectors[np.sort(rng.choice(n, size=min(n, k * 32), replace=False))]
+        centroids = sample[rng.choice(len(sample), size=k, replace=False)].copy()
+        for _ in range(self.kmeans_iters):
+            assign = np.argmax(sample @ centroids.T, axis=1)
+            order = np.argsort(assign, kind="stable")
+            counts = np.bincount(assign, minlength=k)
+            used = np.flatnonzero(counts)
+            sums = np.zeros_like(centroids)
+            sums[used] = np.add.reduceat(sample[order], (np.cumsum(counts) - counts)[used])
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            # empty clusters keep their previous centroid
+            centroids = np.where(norms > 0, sums / np.maximum(norms, 1e-12), centroids)
+        centroids = centroids.astype(np.float32)
+        labels = _label(vectors, centroids)
+        parts = [_Partition.gather(rows, vectors) for rows in _split(labels, k)]
+        return _Fitted(n, centroids, labels, parts)
+
+    def _install_done(self, vectors: np.ndarray) -> None:
+        job = self._job
+        if job is None or job.thread.is_alive():
+            return
+        self._job = None
+        if job.result is not None:
+            self._install(job.result, vectors)
+
+    def _install(self, fitted: _Fitted, vectors: np.ndarray) -> None:
+        """Swap in `fitted`, then assign rows stored since it started (`vectors` holds all)."""
+        if fitted.n < self._trained_at:
+            return  # superseded by a newer clustering
+        assign = self._assign
+        if assign is not None and self._ivf_path is not None:
+            assign.set_tag(0)  # invalid until the assignments match the new centroids
+            self._staged_centroids().replace(self._ivf_path)
+            assign.reserve(fitted.n - 1)
+            assign.rows[: fitted.n] = fitted.assign
+            assign.commit(fitted.n)
+        self._parts = fitted.parts
+        self._centroids = fitted.centroids
+        self._trained_at = fitted.n
+        self._place_from(vectors, fitted.n)
+        if assign is not None:
+            assign.set_tag(fitted.n)
+        logger.debug("memory index: %d vectors in %d partitions", fitted.n, len(self._parts))
+
+    def _place(self, vectors: np.ndarray, row: int) -> None:
+        if self._centroids is None:
+            return
+        vec = vectors[row]
+        part = int(np.argmax(self._centroids @ vec))
+        self._parts[part].add(row, vec)
+        if self._assign is not None:
+            self._assign.reserve(row)
+            self._assign.rows[row] = part
+            self._assign.commit(row + 1)
+
+    def _place_from(self, vectors: np.ndarray, start: int) -> None:
+        """Assign rows `start:` of `vectors` in bulk (e.g. those added while training)."""
+        if self._centroids is None or start >= len(vectors):
+            return
+        labels = _label(vectors[start:], self._centroids)
+        for part, rows in zip(self._parts, _split(labels, len(self._parts)), strict=True):
+            if len(rows):
+                part.extend(rows + start, vectors)
+        if self._assign is not None:
+            self._assign.reserve(len(vectors) - 1)
+            self._assign.rows[start : len(vectors)] = labels
+            self._assign.commit(len(vectors))
+
+    def _read_centroids(self, dim: int) -> tuple[np.ndarray, int] | None:
+        path = self._ivf_path
+        if path is None or not path.exists():
+            return None
+        try:
+            saved = _MappedRows(path, np.dtype(("<f4", (dim,))), _CENTROIDS_MAGIC, 1)
+        except ValueError:
+            logger.warning("memory index: ignoring %s", path)
+            return None
+        centroids, tag = np.array(saved.rows[: saved.count]), saved.tag
+        saved.close()
+        return (centroids, tag) if len(centroids) else None
+
+    def _staged_centroids(self) -> Path:
+        path = self._ivf_path
+        if path is None:
+            msg = "memory index is not saved to files"
+            raise RuntimeError(msg)
+        return path.with_name(path.name + ".tmp")
+
+    def _write_centroids(self, centroids: np.ndarray, trained_at: int) -> None:
+        tmp = self._staged_centroids()
+        tmp.unlink(missing_ok=True)
+        k = len(centroids)
+        out = _MappedRows(tmp, np.dtype(("<f4", (centroids.shape[1],))), _CENTROIDS_MAGIC, k)
+        out.rows[:k] = centroids
+        out.commit(k)
+        out.set_tag(trained_at)
+        out.close()
+
+
+@dataclass(eq=False)
+class MemoryStore:
+    """Append-only episodic memory searchable by text similarity.
+
+    - path: episode file; vectors go to `<path>.vec`, the index to
+      `<path>.ivf` and `<path>.asg`
+    - text_bytes: episode text is truncated to this many UTF-8 bytes
+    - chunk: rows the files grow by when full
+    - clock: episode timestamps (wall clock by default)
+    """
+
+    path: Path
+    embedder: Embedder
+    text_bytes: int = TEXT_BYTES
+    chunk: int = 4096
+    index: VectorIndex = field(default_factory=VectorIndex)
+    clock: Callable[[], float] = wall_ms
+    _episodes: _MappedRows = field(init=False, repr=False)
+    _vectors: _MappedRows = field(init=False, repr=False)
+    _count: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.path = Path(self.path)
+        episode = np.dtype(
+            [("ts_ms", "<f8"), ("stage", "u1"), ("ok", "u1"), ("text", f"S{self.text_bytes}")],
+        )
+        self._episodes = _MappedRows(self.path, episode, _EPISODES_MAGIC, self.chunk)
+        vector = np.dtype(("<f4", (self.embedder.dim,)))
+        vec_path = self.path.with_name(self.path.name + ".vec")
+        try:
+            self._vectors = _MappedRows(vec_path, vector, _VECTORS_MAGIC, self.chunk)
+        except ValueError:
+            self._episodes.close()
+            raise
+        self._count = min(self._episodes.count, self._vectors.count)
+        try:
+            self.index.open(
+                self.path,
+                self._vectors.rows[: self._count],
+                self.chunk,
+                self._vectors.snapshot,
+            )
+        except ValueError:
+            self._vectors.close()
+            self._episodes.close()
+            raise
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def append(self, text: str, *, stage: Stage = Stage.commit, ok: bool = True) -> int:
+        """Store one episode and index its embedding; returns its row."""
+        row = self._count
+        self._vectors.reserve(row)
+        self._episodes.reserve(row)
+        raw = text.encode()[: self.text_bytes].decode(errors="ignore").encode()
+        self._vectors.rows[row] = self.embedder.embed(text)
+        self._vectors.commit(row + 1)
+        self._episodes.rows[row] = (self.clock(), _STAGES.index(stage), ok, raw)
+        self._episodes.commit(row + 1)
+        self._count = row + 1
+        self.index.add(self._vectors.rows, row)
+        return row
+
+    def remember(self, intent: Intent, stage: Stage, *, ok: bool = True, detail: str = "") -> int:
+        return self.append(episode_text(intent, detail), stage=stage, ok=ok)
+
+    def episode(self, row: int) -> Episode:
+        if not 0 <= row < self._count:
+            raise IndexError(row)
+        rec = self._episodes.rows[row]
+        return Episode(
+            ts_ms=float(rec["ts_ms"]),
+            stage=_STAGES[int(rec["stage"])],
+            ok=bool(rec["ok"]),
+            text=bytes(rec["text"]).decode(errors="replace"),
+        )
+
+    def search(self, query: str, k: int = 5) -> list[Recall]:
+        """Episodes most similar to `query`, best first (approximate past `exact_below`)."""
+        if not self._count or k < 1:
+            return []
+        hits = self.index.search(self._vectors.rows[: self._count], self.embedder.embed(query), k)
+        return [Recall(row, score, self.episode(row)) for row, score in hits]
+
+    def on_commit(self, event: Event) -> None:
+        """Bus subscriber for commit events (payload: list of intents)."""
+        committed = event.payload if isinstance(event.payload, list) else ()
+        for intent in committed:
+            if isinstance(intent, Intent):
+                self.remember(intent, Stage.commit)
+
+    def on_done(self, event: Event) -> None:
+        """Bus subscriber for `action.done` events (payload: `ActionDone`)."""
+        done = event.payload
+        if isinstance(done, ActionDone):
+            self.remember(done.intent, Stage.done, ok=done.ok, detail=done.detail)
+        else:
+            logger.debug("ignoring non-ActionDone payload on %s", event.topic)
+
+    def bind(self, bus: Bus, commit: str = "commit", done: str = "action.done") -> None:
+        """Subscribe to commit and done topics (patterns such as `resobot.*.commit`)."""
+        bus.subscribe(commit, self.on_commit)
+        bus.subscribe(done, self.on_done)
+
+    def wait_index(self) -> None:
+        """Block until a background index re-clustering is installed."""
+        self.index.wait(self._vectors.rows[: self._count])
+
+    def flush(self) -> None:
+        self._vectors.flush()
+        self._episodes.flush()
+        self.index.flush()
+
+    def close(self) -> None:
+        """Close the files, first installing (and saving) any pending re-clustering."""
+        if not self._vectors.closed:
+            self.wait_index()
+        self.index.close()
+        self._vectors.close()
+        self._episodes.close()
@@ -1,16 +1,34 @@
-"""Observability helpers: correlation ID in logs.
+"""Observability helpers: correlation ID in logs, spans, and latency histograms.
 
 Adds a logging Filter that injects a correlation ID from a contextvar.
+
+`span(name, **labels)` times a block (proposal gathering, arbitration, bus
+publish, model and MCP calls) into a log-linear `Histogram` keyed by span name
+and labels such as `agent` or `kind`. Spans nest through a contextvar and log
+their parent and the current correlation ID at DEBUG. Metrics are off until
+`enable_metrics()`; while off, `span` returns a shared no-op context manager,
+so instrumented code pays one global lookup.
+
+Aggregates are exported as periodic log summaries (`log_summaries`) and, when
+requested, as Prometheus text on a tiny HTTP endpoint (`serve_prometheus`).
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 import uuid
-from contextvars import ContextVar
+from bisect import bisect_left
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import Self
 
 correlation_id: ContextVar[str] = ContextVar("correlation_id", default="-")
 
+logger = logging.getLogger(__name__)
+
 
 class CorrelationFilter(logging.Filter):
     def filter(self, record: logging.LogRecord) -> bool:  # pragma: no cover - trivial
@@ -22,3 +40,228 @@ def new_correlation_id() -> str:
     cid = uuid.uuid4().hex[:12]
     correlation_id.set(cid)
     return cid
+
+
+# Log-linear bucket upper bounds (seconds): 4 per doubling from 100 us to ~26 s,
+# so any quantile is within one bucket (~19%) of the true value.
+BUCKET_BOUNDS: tuple[float, ...] = tuple(1e-4 * 2 ** (i / 4) for i in range(73))
+
+
+@dataclass
+class Histogram:
+    """Fixed-bucket latency histogram (seconds)."""
+
+    counts: list[int] = field(default_factory=lambda: [0] * (len(BUCKET_BOUNDS) + 1))
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q: float) -> float:
+        """Approximate `q`-quantile, interpolated within its bucket."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, c in enumerate(self.counts):
+            if c and seen + c >= rank:
+                lo = BUCKET_BOUNDS[i - 1] if i else 0.0
+                hi = BUCKET_BOUNDS[i] if i < len(BUCKET_BOUNDS) else self.max
+                return min(self.max, lo + (hi - lo) * (rank - seen) / c)
+            seen += c
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+Labels = tuple[tuple[str, str], ...]
+
+
+class Metrics:
+    """Histograms keyed by (span name, sorted labels)."""
+
+    def __init__(self) -> None:
+        self._hists: dict[tuple[str, Labels], Histogram] = {}
+
+    def histogram(self, name: str, labels: Labels = ()) -> Histogram:
+        key = (name, labels)
+        h = self._hists.get(key)
+        if h is None:
+            h = self._hists[key] = Histogram()
+        return h
+
+    def observe(self, name: str, seconds: float, **labels: str) -> None:
+        self.histogram(name, tuple(sorted(labels.items()))).observe(seconds)
+
+    def items(self) -> list[tuple[str, Labels, Histogram]]:
+        return [(n, ls, h) for (n, ls), h in sorted(self._hists.items())]
+
+    def summary(self) -> list[str]:
+        """One line per series: count and p50/p95/p99/max in milliseconds."""
+        lines = []
+        for name, labels, h in self.items():
+            tags = "".join(f" {k}={v}" for k, v in labels)
+            lines.append(
+                f"{name}{tags} n={h.count} p50={h.quantile(0.5) * 1e3:.2f}ms"
+                f" p95={h.quantile(0.95) * 1e3:.2f}ms p99={h.quantile(0.99) * 1e3:.2f}ms"
+                f" max={h.max * 1e3:.2f}ms",
+            )
+        return lines
+
+    def render_prometheus(self, metric: str = "resobot_span_seconds") -> str:
+        """Prometheus text exposition of every series as one histogram family."""
+        out = [f"# TYPE {metric} histogram"]
+        for name, labels, h in self.items():
+            base = ",".join(
+                [f'span="{_escape(name)}"', *(f'{k}="{_escape(v)}"' for k, v in labels)],
+            )
+            cumulative = 0
+            for bound, c in zip(BUCKET_BOUNDS, h.counts, strict=False):
+                cumulative += c
+                out.append(f'{metric}_bucket{{{base},le="{bound:.6g}"}} {cumulative}')
+            out.extend(
+                (
+                    f'{metric}_bucket{{{base},le="+Inf"}} {h.count}',
+                    f"{metric}_sum{{{base}}} {h.total:.9g}",
+                    f"{metric}_count{{{base}}} {h.count}",
+                ),
+            )
+        return "\n".join(out) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+_metrics: Metrics | None = None
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+def enable_metrics() -> Metrics:
+    """Start recording spans (idempotent); returns the registry."""
+    global _metrics  # noqa: PLW0603 - process-wide switch
+    if _metrics is None:
+        _metrics = Metrics()
+    return _metrics
+
+
+def disable_metrics() -> None:
+    global _metrics  # noqa: PLW0603 - process-wide switch
+    _metrics = None
+
+
+def metrics() -> Metrics | None:
+    return _metrics
+
+
+class Span:
+    """Times a block into the span histogram for its name and labels."""
+
+    __slots__ = ("_start", "_token", "labels", "metrics", "name", "parent")
+
+    def __init__(self, metrics: Metrics, name: str, labels: dict[str, str]) -> None:
+        self.metrics = metrics
+        self.name = name
+        self.labels = labels
+        self.parent: Span | None = None
+        self._start = 0.0
+        self._token: Token[Span | None] | None = None
+
+    def __enter__(self) -> Self:
+        self.parent = _current_span.get()
+        self._token = _current_span.set(self)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        elapsed = time.perf_counter() - self._start
+        if self._token is not None:
+            _current_span.reset(self._token)
+        self.metrics.observe(self.name, elapsed, **self.labels)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "span %s %s %.3fms parent=%s cid=%s",
+                self.name,
+                self.labels,
+                elapsed * 1e3,
+                self.parent.name if self.parent else "-",
+                correlation_id.get(),
+            )
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+
+_NOOP = _NoopSpan()
+
+
+def span(name: str, **labels: str) -> Span | _NoopSpan:
+    """Context manager timing a block; a shared no-op while metrics are off."""
+    m = _metrics
+    if m is None:
+        return _NOOP
+    return Span(m, name, labels)
+
+
+def record(name: str, seconds: float, **labels: str) -> None:
+    """Record an externally measured duration (no-op while metrics are off)."""
+    m = _metrics
+    if m is not None:
+        m.observe(name, seconds, **labels)
+
+
+async def log_summaries(registry: Metrics, interval_s: float = 60.0) -> None:
+    """Log `registry.summary()` every `interval_s` until cancelled."""
+    while True:
+        await asyncio.sleep(interval_s)
+        for line in registry.summary():
+            logger.info("latency %s", line)
+
+
+async def serve_prometheus(
+    registry: Metrics,
+    host: str = "127.0.0.1",
+    port: int = 9464,
+) -> None:
+    """Serve `registry` as Prometheus text on every HTTP GET until cancelled."""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            await reader.readuntil(b"\r\n\r\n")
+            body = registry.render_prometheus().encode()
+            head = (
+                "HTTP/1.1 200 OK\r\n"
+                "Content-Type: text/plain; version=0.0.4\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n"
+            )
+            writer.write(head.encode() + body)
+            await writer.drain()
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, host, port)
+    logger.info("Prometheus metrics on http://%s:%d/metrics", host, port)
+    async with server:
+        await server.serve_forever()
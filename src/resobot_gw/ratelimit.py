@@ -0,0 +1,71 @@
+"""Async token-bucket rate limiting.
+
+Used to cap the gateway's aggregate model-call rate across concurrent agents.
+Waiters are served in arrival order, so one chatty agent cannot starve others.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+
+@dataclass
+class RateLimitStats:
+    acquired: int = 0
+    waited: int = 0  # acquisitions that had to sleep
+    waited_s: float = 0.0
+
+
+class TokenBucket:
+    """Allows `rate_per_s` acquisitions per second with bursts up to `burst`."""
+
+    def __init__(
+        self,
+        rate_per_s: float,
+        *,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate_per_s <= 0:
+            raise ValueError("rate_per_s must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self._rate = rate_per_s
+        self._burst = float(burst)
+        self._clock = clock
+        self._tokens = float(burst)
+        self._stamp = clock()
+        self._turn = asyncio.Lock()
+        self.stats = RateLimitStats()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self._burst, self._tokens + (now - self._stamp) * self._rate)
+        self._stamp = now
+
+    def try_acquire(self) -> bool:
+        """Take a token without waiting; False when the bucket is empty."""
+        if self._turn.locked():
+            return False  # others are queued ahead
+        self._refill()
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        self.stats.acquired += 1
+        return True
+
+    async def acquire(self) -> None:
+        """Wait for a token (first come, first served)."""
+        async with self._turn:
+            self._refill()
+            if self._tokens < 1:
+                delay = (1 - self._tokens) / self._rate
+                self.stats.waited += 1
+                self.stats.waited_s += delay
+                await asyncio.sleep(delay)
+                self._refill()
+            self._tokens -= 1
+            self.stats.acquired += 1
@@ -0,0 +1,314 @@
+"""Record/replay of proposal and commit streams.
+
+`LogWriter` is a `TickRecorder`: attached to a `Coordinator`, it appends each
+tick boundary (arbiter clock, every proposal, and which of them committed) to
+a compact binary log. `replay` feeds a log back through a fresh `Coordinator`
+and `Arbiter` whose clock is pinned to the recorded times, either as fast as
+possible or paced like the original, and reports any tick whose commits differ
+from the recording, so a log is both a regression oracle and a benchmark
+workload. The log does not carry arbiter settings (strategy, search budget,
+△ rules); replay with the recording arbiter's `ArbiterConfig`.
+
+Log layout (little-endian): the magic `RBGWLOG1`, then frames, each starting
+with a type byte. A string frame interns an agent name or intent kind as a
+u32 id before its first use. A tick frame holds the clock, the proposals
+(ids, tier, resources by `Resource` index, score, hold, creation stamp, and
+JSON params), and the committed proposals as indices. Frames are only
+appended; a truncated trailing frame (e.g. after a crash) is ignored.
+
+Commits are matched to proposals by origin (agent, kind, creation stamp,
+resources), so a proposal whose params a △ rule rewrote still counts as that
+proposal; the rewrite itself is re-derived on replay, and partners re-published
+from earlier ticks are not logged.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import struct
+import time
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO, Self
+
+from .agents.coordinator import Coordinator, Proposer, TickRecorder
+from .agents.multibot import ArbiterConfig
+from .agents.orchestrator import Intent, Resource, Tier
+from .bus import Bus, Publisher
+from .loadgen import ManualClock, percentile
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"RBGWLOG1"
+_STR = 1
+_TICK = 2
+
+_RESOURCES = tuple(Resource)
+_RESOURCE_INDEX = {r: i for i, r in enumerate(_RESOURCES)}
+
+_FRAME_TYPE = struct.Struct("<B")
+_STR_HEAD = struct.Struct("<IH")  # id, byte length
+_TICK_HEAD = struct.Struct("<qII")  # now_ms, proposals, commits
+# agent id, kind id, tier, renews, score, hold_ms, created_ms, resources, params bytes
+_PROPOSAL = struct.Struct("<IIBBdidBI")
+
+
+def _origin(intent: Intent) -> tuple[str, str, float, tuple[Resource, ...]]:
+    return intent.agent, intent.kind, intent.created_ms, intent.resources
+
+
+def commit_indices(proposals: Sequence[Intent], committed: Sequence[Intent]) -> tuple[int, ...]:
+    """Proposal index of each commit; commits not from `proposals` are dropped."""
+    position = {_origin(p): i for i, p in enumerate(proposals)}
+    return tuple(i for c in committed if (i := position.get(_origin(c))) is not None)
+
+
+class LogFormatError(ValueError):
+    """The stream is not a replay log."""
+
+
+@dataclass(frozen=True)
+class RecordedTick:
+    """One tick boundary: arbiter clock, proposals, committed proposal indices."""
+
+    now_ms: int
+    proposals: tuple[Intent, ...]
+    committed: tuple[int, ...]
+
+    def commits(self) -> list[Intent]:
+        return [self.proposals[i] for i in self.committed]
+
+
+class LogWriter(TickRecorder):
+    """Appends ticks to a binary replay log."""
+
+    def __init__(self, stream: BinaryIO) -> None:
+        self._stream = stream
+        self._ids: dict[str, int] = {}
+        self.ticks = 0
+        stream.write(MAGIC)
+
+    @classmethod
+    def open(cls, path: str | Path) -> Self:
+        return cls(Path(path).open("wb"))
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _intern(self, text: str, out: bytearray) -> int:
+        i = self._ids.get(text)
+        if i is None:
+            i = self._ids[text] = len(self._ids)
+            raw = text.encode()
+            out += _FRAME_TYPE.pack(_STR)
+            out += _STR_HEAD.pack(i, len(raw))
+            out += raw
+        return i
+
+    def record_tick(
+        self,
+        now_ms: int,
+        proposals: Sequence[Intent],
+        committed: Sequence[Intent],
+    ) -> None:
+        out = bytearray()
+        indices = commit_indices(proposals, committed)
+        body = bytearray(_TICK_HEAD.pack(now_ms, len(proposals), len(indices)))
+        for p in proposals:
+            params = json.dumps(p.params, default=str).encode() if p.params else b""
+            body += _PROPOSAL.pack(
+                self._intern(p.agent, out),
+                self._intern(p.kind, out),
+                p.tier.value,
+                p.renews,
+                p.score,
+                p.hold_ms,
+                p.created_ms,
+                len(p.resources),
+                len(params),
+            )
+            body += bytes(_RESOURCE_INDEX[r] for r in p.resources)
+            body += params
+        body += struct.pack(f"<{len(indices)}I", *indices)
+        out += _FRAME_TYPE.pack(_TICK)
+        out += body
+        self._stream.write(out)
+        self.ticks += 1
+
+    def flush(self) -> None:
+        self._stream.flush()
+
+    def close(self) -> None:
+        self._stream.close()
+
+
+class _Cursor:
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.pos = 0
+
+    def take(self, n: int) -> bytes:
+        end = self.pos + n
+        if end > len(self.data):
+            raise EOFError
+        chunk = self.data[self.pos : end]
+        self.pos = end
+        return chunk
+
+    def unpack(self, fmt: struct.Struct) -> tuple[int | float, ...]:
+        return fmt.unpack(self.take(fmt.size))
+
+
+_TIERS = {t.value: t for t in Tier}
+
+
+def _read_proposal(cur: _Cursor, names: dict[int, str]) -> Intent:
+    agent, kind, tier, renews, score, hold, created, n_res, n_params = cur.unpack(_PROPOSAL)
+    resources = tuple(_RESOURCES[b] for b in cur.take(int(n_res)))
+    raw = cur.take(int(n_params))
+    return Intent(
+        agent=names[int(agent)],
+        kind=names[int(kind)],
+        params=json.loads(raw) if raw else {},
+        resources=resources,
+        score=float(score),
+        hold_ms=int(hold),
+        tier=_TIERS[int(tier)],
+        renews=bool(renews),
+        created_ms=float(created),
+    )
+
+
+def _read_tick(cur: _Cursor, names: dict[int, str]) -> RecordedTick:
+    now, n_proposals, n_commits = cur.unpack(_TICK_HEAD)
+    proposals = tuple(_read_proposal(cur, names) for _ in range(int(n_proposals)))
+    committed = struct.unpack(f"<{int(n_commits)}I", cur.take(4 * int(n_commits)))
+    return RecordedTick(int(now), proposals, committed)
+
+
+def read_log(data: bytes) -> Iterator[RecordedTick]:
+    """Decode a replay log.
+
+    Yields:
+        Recorded ticks in order, stopping quietly at a truncated trailing frame.
+
+    """
+    if not data.startswith(MAGIC):
+        raise LogFormatError("not a replay log (bad magic)")
+    cur = _Cursor(data)
+    cur.pos = len(MAGIC)
+    names: dict[int, str] = {}
+    while cur.pos < len(data):
+        start = cur.pos
+        try:
+            (kind,) = cur.unpack(_FRAME_TYPE)
+            if kind == _STR:
+                i, n = cur.unpack(_STR_HEAD)
+                names[int(i)] = cur.take(int(n)).decode()
+                continue
+            if kind != _TICK:
+                msg = f"unknown frame type {kind} at byte {start}"
+                raise LogFormatError(msg)
+            tick = _read_tick(cur, names)
+        except EOFError:
+            logger.warning("replay log truncated at byte %d", start)
+            return
+        yield tick
+
+
+def load_log(path: str | Path) -> list[RecordedTick]:
+    return list(read_log(Path(path).read_bytes()))
+
+
+class _Recorded(Proposer):
+    def __init__(self) -> None:
+        self.proposals: Sequence[Intent] = ()
+
+    def propose(self) -> Iterable[Intent]:
+        return self.proposals
+
+
+@dataclass
+class ReplayResult:
+    """Replay outcome: timing and ticks whose commits diverged."""
+
+    ticks: int = 0
+    proposals: int = 0
+    commits: int = 0
+    mismatched_ticks: list[int] = field(default_factory=list)
+    wall_s: float = 0.0
+    tick_ns: list[int] = field(default_factory=list, repr=False)
+
+    @property
+    def matches(self) -> bool:
+        return not self.mismatched_ticks
+
+    def to_json(self) -> dict[str, object]:
+        ordered = sorted(self.tick_ns) or [0]
+        return {
+            "ticks": self.ticks,
+            "proposals": self.proposals,
+            "commits": self.commits,
+            "mismatched_ticks": self.mismatched_ticks[:100],
+            "mismatches": len(self.mismatched_ticks),
+            "ticks_per_s": round(self.ticks / self.wall_s, 1) if self.wall_s > 0 else 0.0,
+            "tick_us": {
+                "p50": round(percentile(ordered, 0.5) / 1e3, 3),
+                "p95": round(percentile(ordered, 0.95) / 1e3, 3),
+                "p99": round(percentile(ordered, 0.99) / 1e3, 3),
+                "max": round(ordered[-1] / 1e3, 3),
+            },
+        }
+
+
+def replay(
+    ticks: Iterable[RecordedTick],
+    *,
+    realtime: bool = False,
+    bus: Publisher | None = None,
+    sleep: Callable[[float], None] = time.sleep,
+    config: ArbiterConfig | None = None,
+) -> ReplayResult:
+    """Feed recorded ticks through a fresh Coordinator/Arbiter and compare commits.
+
+    The arbiter is built from `config` (default settings if None), so pass
+    `ArbiterConfig.of(arbiter)` for a recording made with any other. Its clock
+    is set to each tick's recorded time. With `realtime`, ticks are paced by
+    their recorded spacing; otherwise they run back to back.
+    """
+    clock = ManualClock()
+    arbiter = (config or ArbiterConfig()).build(clock)
+    coord = Coordinator(arbiter=arbiter, bus=bus or Bus())
+    source = _Recorded()
+    result = ReplayResult()
+    first_ms: int | None = None
+    started = time.perf_counter()
+    for tick in ticks:
+        if realtime:
+            first_ms = tick.now_ms if first_ms is None else first_ms
+            ahead = (tick.now_ms - first_ms) / 1000 - (time.perf_counter() - started)
+            if ahead > 0:
+                sleep(ahead)
+        clock.now_ms = tick.now_ms
+        source.proposals = tick.proposals
+        t0 = time.perf_counter_ns()
+        committed = coord.tick([source])
+        result.tick_ns.append(time.perf_counter_ns() - t0)
+        if commit_indices(tick.proposals, committed) != tick.committed:
+            result.mismatched_ticks.append(result.ticks)
+        result.ticks += 1
+        result.proposals += len(tick.proposals)
+        result.commits += len(committed)
+    result.wall_s = time.perf_counter() - started
+    return result
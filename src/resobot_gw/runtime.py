@@ -8,12 +8,25 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from dataclasses import dataclass
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
 
+from .agents.coordinator import AsyncProposer, Coordinator, StreamingProposer
 from .agents.interface import AgentRunner
 from .agents.runner import create_default_runner
+from .bus import AsyncBus, Bus, Overflow, QueuePolicy
 from .config import Config
-from .obs import CorrelationFilter, new_correlation_id
+from .obs import (
+    CorrelationFilter,
+    enable_metrics,
+    log_summaries,
+    new_correlation_id,
+    serve_prometheus,
+)
+from .replay import LogWriter
+from .scheduler import TickScheduler
+from .slo import LatencyTracker
 
 logger = logging.getLogger(__name__)
 
@@ -23,9 +36,32 @@ class GatewayRuntime:
     """Gateway runtime orchestrating Agents and IO bridges.
 
     For now, this is a skeleton that validates configuration and wires the
-    OpenAI client when not in dry-run mode.
+    OpenAI client when not in dry-run mode. When a `coordinator` is given, a
+    `TickScheduler` drives its ticks over `proposers` alongside the runner,
+    and `streams` are pumped into its inbox.
+
+    Setting `metrics_log_interval_s` or `metrics_port` enables span metrics,
+    logged periodically and/or served as Prometheus text. Intent latency is
+    tracked on the coordinator's `Bus` by `latency` (a default `LatencyTracker`
+    when None), bound for the run; its per-agent quantiles are logged at
+    shutdown. With `record_path`,
+    every coordinator tick is appended to a replay log there; it is a
+    configuration error without a coordinator. Events on
+    `wake_topics` of the coordinator's `Bus` or `AsyncBus` wake an idle
+    scheduler; any other publisher is a TypeError.
     """
 
+    coordinator: Coordinator | None = None
+    proposers: Sequence[AsyncProposer] = ()
+    streams: Sequence[StreamingProposer] = ()
+    tick_hz: float = 20.0
+    metrics_log_interval_s: float | None = None
+    metrics_port: int | None = None
+    latency: LatencyTracker | None = None
+    record_path: Path | None = None
+    wake_topics: Sequence[str] = ("world.#",)
+    _writer: LogWriter | None = field(default=None, init=False, repr=False)
+
     async def run(self, *, dry_run: bool = False, runner: AgentRunner | None = None) -> int:
         """Run the gateway runtime asynchronously.
 
@@ -37,6 +73,7 @@ class GatewayRuntime:
         logger.info("Starting ResoBotGW cid=%s dry_run=%s", cid, dry_run)
 
         try:
+            self._validate()
             if dry_run:
                 logger.debug("Dry-run: skipping external service initialization")
                 return 0
@@ -48,7 +85,29 @@ class GatewayRuntime:
             agent_runner = runner or create_default_runner()
 
             # Run until cancelled
-            await agent_runner.run()
+            if self.coordinator is None and not self._metrics_enabled:
+                await agent_runner.run()
+                return 0
+            scheduler = None
+            if self.coordinator is not None:
+                scheduler = TickScheduler.for_coordinator(
+                    self.coordinator,
+                    self.proposers,
+                    rate_hz=self.tick_hz,
+                )
+                self._start_recording(self.coordinator)
+                self._subscribe_wakeups(self.coordinator, scheduler)
+                self._bind_latency(self.coordinator)
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    tg.create_task(agent_runner.run())
+                    if self.coordinator is not None and scheduler is not None:
+                        tg.create_task(scheduler.run())
+                        for stream in self.streams:
+                            tg.create_task(self.coordinator.pump(stream))
+                    self._start_metrics(tg)
+            finally:
+                self._finish(scheduler)
             return 0
         except ValueError as cfg_err:
             logger.error("Configuration error: %s", cfg_err)
@@ -60,6 +119,74 @@ class GatewayRuntime:
             logger.exception("Unexpected error")
             return 3
 
+    def _validate(self) -> None:
+        if self.record_path is not None and self.coordinator is None:
+            msg = f"no coordinator to record to {self.record_path}"
+            raise ValueError(msg)
+        if self.coordinator is not None and self.wake_topics:
+            bus = self.coordinator.bus
+            if not isinstance(bus, Bus | AsyncBus):
+                msg = f"cannot subscribe wakeups on {type(bus).__name__}; use a Bus or AsyncBus"
+                raise TypeError(msg)
+
+    def _start_recording(self, coordinator: Coordinator) -> None:
+        if self.record_path is not None:
+            self._writer = coordinator.recorder = LogWriter.open(self.record_path)
+
+    def _subscribe_wakeups(self, coordinator: Coordinator, scheduler: TickScheduler) -> None:
+        bus = coordinator.bus
+        for topic in self.wake_topics:
+            if isinstance(bus, Bus):
+                bus.subscribe(topic, scheduler.on_event)
+            elif isinstance(bus, AsyncBus):
+                # a wakeup is idempotent: one queued event is enough
+                policy = QueuePolicy(maxsize=1, overflow=Overflow.drop_newest)
+                bus.subscribe(topic, scheduler.on_event_async, policy, name="scheduler.wake")
+
+    def _unsubscribe_wakeups(self, coordinator: Coordinator, scheduler: TickScheduler) -> None:
+        bus = coordinator.bus
+        for topic in self.wake_topics:
+            if isinstance(bus, Bus):
+                bus.unsubscribe(topic, scheduler.on_event)
+            elif isinstance(bus, AsyncBus):
+                bus.unsubscribe(topic, scheduler.on_event_async)
+
+    def _bind_latency(self, coordinator: Coordinator) -> None:
+        if isinstance(coordinator.bus, Bus):
+            if self.latency is None:
+                self.latency = LatencyTracker(coordinator.bus)
+            self.latency.bind(coordinator.bus, commit=coordinator.topic_commit)
+
+    def _finish(self, scheduler: TickScheduler | None) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            logger.info("Recorded %d ticks to %s", self._writer.ticks, self.record_path)
+            self._writer = None
+        if scheduler is not None:
+            scheduler.stop()
+            coordinator = self.coordinator
+            if coordinator is not None:
+                self._unsubscribe_wakeups(coordinator, scheduler)
+                if self.latency is not None and isinstance(coordinator.bus, Bus):
+                    self.latency.unbind(coordinator.bus, commit=coordinator.topic_commit)
+            logger.info("Tick metrics: %s", scheduler.metrics)
+        if self.latency is not None:
+            for summary in self.latency.summaries():
+                logger.info("Intent latency: %s", summary)
+
+    @property
+    def _metrics_enabled(self) -> bool:
+        return self.metrics_log_interval_s is not None or self.metrics_port is not None
+
+    def _start_metrics(self, tg: asyncio.TaskGroup) -> None:
+        if not self._metrics_enabled:
+            return
+        registry = enable_metrics()
+        if self.metrics_log_interval_s is not None:
+            tg.create_task(log_summaries(registry, self.metrics_log_interval_s))
+        if self.metrics_port is not None:
+            tg.create_task(serve_prometheus(registry, port=self.metrics_port))
+
     def start(self, *, dry_run: bool = False, runner: AgentRunner | None = None) -> int:
         """Sync entrypoint that runs the async runtime with asyncio.run()."""
         return asyncio.run(self.run(dry_run=dry_run, runner=runner))
@@ -0,0 +1,208 @@
+"""Real-time tick scheduler for the gateway.
+
+Drives an async tick function on a fixed-rate grid while there is work, and
+sleeps while idle until something can change: an explicit `wake()` (a proposal
+or bus event arrived), the next lock expiry, or an optional poll interval.
+Ticks are scheduled against absolute grid times so drift does not accumulate;
+overruns skip missed slots instead of bursting to catch up.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+
+from .agents.coordinator import AsyncProposer, Coordinator
+from .bus import Event
+from .obs import record
+
+# Returns True when the tick found work (keep ticking at the target rate).
+TickFn = Callable[[], Awaitable[bool]]
+# Seconds until the next time-driven change (e.g. lock expiry), or None.
+DelayFn = Callable[[], float | None]
+
+
+@dataclass
+class TickMetrics:
+    """Tick duration, start jitter, and scheduling counters (seconds)."""
+
+    ticks: int = 0
+    overruns: int = 0
+    idle_waits: int = 0
+    wakeups: int = 0
+    last_duration_s: float = 0.0
+    max_duration_s: float = 0.0
+    total_duration_s: float = 0.0
+    last_jitter_s: float = 0.0
+    max_jitter_s: float = 0.0
+
+    @property
+    def mean_duration_s(self) -> float:
+        return self.total_duration_s / self.ticks if self.ticks else 0.0
+
+    def record(self, duration_s: float, jitter_s: float) -> None:
+        self.ticks += 1
+        self.last_duration_s = duration_s
+        self.max_duration_s = max(self.max_duration_s, duration_s)
+        self.total_duration_s += duration_s
+        self.last_jitter_s = jitter_s
+        self.max_jitter_s = max(self.max_jitter_s, jitter_s)
+
+
+class TickScheduler:
+    """Runs `tick` at up to `rate_hz`, idling between bursts of work.
+
+    - next_change_s: when idle, sleep no longer than this (e.g. next lock expiry)
+    - idle_poll_s: upper bound on idle sleeps for pull-based proposers (None = none)
+    - on_stop: called once when the scheduler stops or `run` exits
+    """
+
+    def __init__(
+        self,
+        tick: TickFn,
+        *,
+        rate_hz: float = 20.0,
+        next_change_s: DelayFn | None = None,
+        idle_poll_s: float | None = None,
+        on_stop: Callable[[], None] | None = None,
+    ) -> None:
+        if rate_hz <= 0:
+            raise ValueError("rate_hz must be positive")
+        self._tick = tick
+        self._period = 1.0 / rate_hz
+        self._next_change_s = next_change_s
+        self._idle_poll_s = idle_poll_s
+        self._on_stop = on_stop
+        self._wake = asyncio.Event()
+        self._stopped = False
+        self.metrics = TickMetrics()
+
+    @classmethod
+    def for_coordinator(
+        cls,
+        coordinator: Coordinator,
+        proposers: Sequence[AsyncProposer],
+        *,
+        rate_hz: float = 20.0,
+        idle_poll_s: float | None = 1.0,
+    ) -> TickScheduler:
+        """Tick `coordinator` over `proposers` and its inbox.
+
+        A tick counts as busy if it saw any proposals, committed anything, or
+        left carried proposals in flight. Submitting to the inbox, from any
+        thread, wakes the scheduler (after any `on_submit` already installed,
+        which is restored when the scheduler stops); idle waits also end at the
+        next lock expiry. Call from the event loop the scheduler will run on.
+        """
+        arbiter = coordinator.arbiter
+        inbox = coordinator.inbox
+
+        async def tick() -> bool:
+            committed = await coordinator.tick_async(proposers)
+            return (
+                bool(committed)
+                or coordinator.last_proposals > 0
+                or coordinator.in_flight > 0
+                or len(inbox) > 0
+            )
+
+        def next_change_s() -> float | None:
+            expiry = arbiter.next_expiry_ms()
+            if expiry is None:
+                return None
+            return max(0.0, (expiry - arbiter.now_ms_fn()) / 1000)
+
+        loop = asyncio.get_running_loop()
+        previous = inbox.on_submit
+
+        def on_submit() -> None:
+            if previous is not None:
+                previous()
+            loop.call_soon_threadsafe(sched.wake)
+
+        def detach() -> None:
+            if inbox.on_submit is on_submit:
+                inbox.on_submit = previous
+
+        sched = cls(
+            tick,
+            rate_hz=rate_hz,
+            next_change_s=next_change_s,
+            idle_poll_s=idle_poll_s,
+            on_stop=detach,
+        )
+        inbox.on_submit = on_submit
+        return sched
+
+    def wake(self) -> None:
+        """Request a tick as soon as the rate allows (call from the loop thread)."""
+        self._wake.set()
+
+    def on_event(self, _: Event) -> None:
+        """Bus subscriber that wakes the scheduler."""
+        self.wake()
+
+    async def on_event_async(self, _: Event) -> None:
+        """`AsyncBus` subscriber that wakes the scheduler."""
+        self.wake()
+
+    def stop(self) -> None:
+        self._stopped = True
+        self._wake.set()
+        self._release()
+
+    def _release(self) -> None:
+        hook, self._on_stop = self._on_stop, None
+        if hook is not None:
+            hook()
+
+    async def run(self) -> None:
+        try:
+            await self._run()
+        finally:
+            self._release()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        period = self._period
+        next_at = loop.time()
+        while not self._stopped:
+            await self._sleep(next_at - loop.time())
+            if self._stopped:
+                break
+            start = loop.time()
+            self._wake.clear()
+            busy = await self._tick()
+            end = loop.time()
+            self.metrics.record(end - start, max(0.0, start - next_at))
+            record("tick", end - start)
+
+            next_at += period
+            if end > next_at:
+                # skip missed slots rather than bursting to catch up
+                self.metrics.overruns += 1
+                next_at += math.ceil((end - next_at) / period) * period
+            if busy or self._stopped:
+                continue
+            await self._idle()
+            # resume on the grid, but never faster than the target rate
+            next_at = max(loop.time(), start + period)
+
+    async def _idle(self) -> None:
+        self.metrics.idle_waits += 1
+        timeout = self._idle_poll_s
+        if self._next_change_s is not None:
+            change = self._next_change_s()
+            if change is not None:
+                timeout = change if timeout is None else min(timeout, change)
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout)
+        except TimeoutError:
+            return
+        self.metrics.wakeups += 1
+
+    async def _sleep(self, delay_s: float) -> None:
+        if delay_s > 0:
+            await asyncio.sleep(delay_s)
@@ -0,0 +1,218 @@
+"""End-to-end intent latency against the spec's per-agent P95 targets.
+
+Every `Intent` carries `created_ms` and every bus `Event` its `ts_ms`, both on
+the `monotonic_ms` clock. `LatencyTracker` subscribes to commit events (payload:
+list of intents) and `action.done` events (payload: `ActionDone`) and measures
+intent creation -> commit and intent creation -> done per agent, over a rolling
+time window. Quantiles are only computed by `check` (run from `observe` at
+most every `check_interval_ms`) and `summaries`, so recording a sample stays
+O(1). Whenever a check finds an agent's P95 for either stage across its target
+(AC-1), an `SloBreach` is published on the breach topic; returning under target
+publishes one on the recovery topic. Samples are also recorded as the
+`intent_latency` span histogram when metrics are enabled.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from collections import deque
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from enum import StrEnum
+
+from .agents.orchestrator import Intent
+from .bus import Bus, Event, Publisher, monotonic_ms
+from .obs import record
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of the taxonomy's P95 targets (ms). Agents without a fixed
+# target (Planner, ActivityHost, perception/memory) are not listed.
+SPEC_P95_MS: Mapping[str, float] = {
+    "DialogueReflex": 600,
+    "GazeReflex": 150,
+    "Navigation": 350,
+    "Manipulation": 600,
+    "Emote": 400,
+    "FocusSynth": 200,
+    "TurnTaker": 700,
+    "Safety": 50,
+}
+
+
+class Stage(StrEnum):
+    """Point in an intent's life its latency is measured to."""
+
+    commit = "commit"
+    done = "done"
+
+
+@dataclass(frozen=True)
+class ActionDone:
+    """`action.done` payload: the executed intent and its outcome."""
+
+    intent: Intent
+    ok: bool = True
+    detail: str = ""
+
+
+@dataclass(frozen=True)
+class LatencySummary:
+    """Rolling-window quantiles (ms) for one agent and stage."""
+
+    agent: str
+    stage: Stage
+    count: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+
+@dataclass(frozen=True)
+class SloBreach:
+    """An agent's P95 crossed its target (or came back under it)."""
+
+    agent: str
+    stage: Stage
+    p95_ms: float
+    target_ms: float
+    count: int
+
+
+class LatencyWindow:
+    """Latency samples from the last `window_ms`, capped at `max_samples`."""
+
+    def __init__(self, window_ms: float, max_samples: int) -> None:
+        self._window_ms = window_ms
+        self._samples: deque[tuple[float, float]] = deque(maxlen=max_samples)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def add(self, at_ms: float, latency_ms: float) -> None:
+        self._samples.append((at_ms, latency_ms))
+
+    def trim(self, now_ms: float) -> None:
+        horizon = now_ms - self._window_ms
+        samples = self._samples
+        while samples and samples[0][0] < horizon:
+            samples.popleft()
+
+    def quantiles(self, *qs: float) -> tuple[float, ...]:
+        """Nearest-rank quantiles of the retained samples (0.0 when empty)."""
+        values = sorted(ms for _, ms in self._samples)
+        if not values:
+            return (0.0,) * len(qs)
+        n = len(values)
+        return tuple(values[min(n - 1, max(0, math.ceil(q * n) - 1))] for q in qs)
+
+
+@dataclass
+class LatencyTracker:
+    """Rolling per-agent latency quantiles with SLO breach events.
+
+    - targets: agent name -> P95 target in ms
+    - window_s / max_samples: rolling window per agent and stage
+    - min_samples: samples needed before a window can breach
+    - check_interval_ms: least time between breach checks run by `observe`
+    """
+
+    publisher: Publisher
+    targets: Mapping[str, float] = field(default_factory=lambda: dict(SPEC_P95_MS))
+    window_s: float = 60.0
+    max_samples: int = 1024
+    min_samples: int = 20
+    topic_breach: str = "slo.breach"
+    topic_recovered: str = "slo.recovered"
+    clock: Callable[[], float] = monotonic_ms
+    check_interval_ms: float = 1000.0
+    _windows: dict[tuple[str, Stage], LatencyWindow] = field(default_factory=dict)
+    _breached: set[tuple[str, Stage]] = field(default_factory=set)
+    _dirty: set[tuple[str, Stage]] = field(default_factory=set)
+    _checked_ms: float = -math.inf
+
+    @property
+    def breached(self) -> frozenset[tuple[str, Stage]]:
+        """(agent, stage) pairs currently over target."""
+        return frozenset(self._breached)
+
+    def observe(self, agent: str, stage: Stage, latency_ms: float) -> None:
+        """Add one sample; `check` if the last one is `check_interval_ms` old."""
+        key = (agent, stage)
+        window = self._windows.get(key)
+        if window is None:
+            window = self._windows[key] = LatencyWindow(self.window_s * 1000, self.max_samples)
+        now = self.clock()
+        window.add(now, latency_ms)
+        record("intent_latency", latency_ms / 1000, agent=agent, stage=stage)
+        if agent in self.targets:
+            self._dirty.add(key)
+        if now - self._checked_ms >= self.check_interval_ms:
+            self.check()
+
+    def check(self) -> None:
+        """Publish a breach/recovery for each P95 that crossed its target since the last check."""
+        now = self._checked_ms = self.clock()
+        dirty, self._dirty = self._dirty, set()
+        for key in sorted(dirty):
+            window = self._windows[key]
+            window.trim(now)
+            self._check(key, window, self.targets[key[0]])
+
+    def _check(self, key: tuple[str, Stage], window: LatencyWindow, target: float) -> None:
+        if len(window) < self.min_samples:
+            return
+        (p95,) = window.quantiles(0.95)
+        over = p95 > target
+        if over == (key in self._breached):
+            return
+        breach = SloBreach(
+            agent=key[0],
+            stage=key[1],
+            p95_ms=p95,
+            target_ms=target,
+            count=len(window),
+        )
+        if over:
+            self._breached.add(key)
+            logger.warning("SLO breach %s: p95 %.1fms > %.1fms", key, p95, target)
+            self.publisher.publish(Event(topic=self.topic_breach, payload=breach))
+        else:
+            self._breached.discard(key)
+            logger.info("SLO recovered %s: p95 %.1fms <= %.1fms", key, p95, target)
+            self.publisher.publish(Event(topic=self.topic_recovered, payload=breach))
+
+    def on_commit(self, event: Event) -> None:
+        """Bus subscriber for commit events (payload: list of intents)."""
+        committed = event.payload if isinstance(event.payload, list) else ()
+        for intent in committed:
+            if isinstance(intent, Intent):
+                self.observe(intent.agent, Stage.commit, event.ts_ms - intent.created_ms)
+
+    def on_done(self, event: Event) -> None:
+        """Bus subscriber for `action.done` events (payload: `ActionDone`)."""
+        done = event.payload
+        if isinstance(done, ActionDone):
+            intent = done.intent
+            self.observe(intent.agent, Stage.done, event.ts_ms - intent.created_ms)
+        else:
+            logger.debug("ignoring non-ActionDone payload on %s", event.topic)
+
+    def bind(self, bus: Bus, commit: str = "commit", done: str = "action.done") -> None:
+        """Subscribe to commit and done topics (patterns such as `resobot.*.commit`)."""
+        bus.subscribe(commit, self.on_commit)
+        bus.subscribe(done, self.on_done)
+
+    def unbind(self, bus: Bus, commit: str = "commit", done: str = "action.done") -> None:
+        bus.unsubscribe(commit, self.on_commit)
+        bus.unsubscribe(done, self.on_done)
+
+    def summaries(self) -> list[LatencySummary]:
+        now = self.clock()
+        out: list[LatencySummary] = []
+        for (agent, stage), window in sorted(self._windows.items()):
+            window.trim(now)
+            p50, p95, p99 = window.quantiles(0.5, 0.95, 0.99)
+            out.append(LatencySummary(agent, stage, len(window), p50, p95, p99))
+        return out
@@ -0,0 +1,186 @@
+"""Shared world state (DV) built from bus events.
+
+`WorldState` ingests `WorldUpdate` payloads from the `Bus` and publishes an
+immutable `WorldSnapshot` per version, so proposers read the world without
+querying it themselves. Snapshots share structure: keys are spread over a
+fixed number of buckets, and an update copies only the buckets it touches,
+so taking a snapshot is O(1) and an update costs O(touched keys + bucket size).
+
+A bounded change log answers "what changed since version N" (`diff_since`),
+letting proposers skip reasoning when nothing relevant moved. Only the newest
+`max_versions` versions are retained; older snapshots and log entries are
+compacted away, and a diff from before the retained window returns None (the
+caller should re-read the full snapshot).
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import deque
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
+from .bus import Bus, Event
+
+logger = logging.getLogger(__name__)
+
+_EMPTY: Mapping[str, object] = MappingProxyType({})
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class WorldUpdate:
+    """Event payload: keys to set and keys to remove."""
+
+    changes: Mapping[str, object] = field(default_factory=dict)
+    removed: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class WorldDiff:
+    """Keys changed between `since` and `version` (values as of `version`)."""
+
+    since: int
+    version: int
+    changed: Mapping[str, object]
+    removed: frozenset[str]
+
+    def __bool__(self) -> bool:
+        return bool(self.changed or self.removed)
+
+
+class WorldSnapshot(Mapping[str, object]):
+    """Immutable view of the world at one version."""
+
+    __slots__ = ("_buckets", "_len", "version")
+
+    def __init__(self, version: int, buckets: tuple[Mapping[str, object], ...], n: int) -> None:
+        self.version = version
+        self._buckets = buckets
+        self._len = n
+
+    def _bucket(self, key: str) -> Mapping[str, object]:
+        return self._buckets[hash(key) % len(self._buckets)]
+
+    def __getitem__(self, key: str) -> object:
+        return self._bucket(key)[key]
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and key in self._bucket(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for b in self._buckets:
+            yield from b
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __repr__(self) -> str:
+        return f"WorldSnapshot(version={self.version}, keys={self._len})"
+
+
+class WorldState:
+    """Versioned key/value world store fed by bus events.
+
+    - buckets: structural-sharing granularity (more = cheaper updates)
+    - max_versions: snapshots and change-log entries retained for `at`/`diff_since`
+    """
+
+    def __init__(self, *, buckets: int = 64, max_versions: int = 256) -> None:
+        if buckets < 1 or max_versions < 1:
+            raise ValueError("buckets and max_versions must be positive")
+        self._buckets: tuple[Mapping[str, object], ...] = (_EMPTY,) * buckets
+        self._current = WorldSnapshot(0, self._buckets, 0)
+        self._history: deque[WorldSnapshot] = deque([self._current], maxlen=max_versions)
+        # (version, keys set, keys removed) per version; covers the retained window
+        self._log: deque[tuple[int, frozenset[str], frozenset[str]]] = deque(maxlen=max_versions)
+
+    @property
+    def snapshot(self) -> WorldSnapshot:
+        """Latest snapshot (O(1); safe to hold across updates)."""
+        return self._current
+
+    @property
+    def version(self) -> int:
+        return self._current.version
+
+    @property
+    def oldest_version(self) -> int:
+        return self._history[0].version
+
+    def at(self, version: int) -> WorldSnapshot | None:
+        """Snapshot at `version` if it is still retained."""
+        i = version - self.oldest_version
+        if 0 <= i < len(self._history):
+            return self._history[i]
+        return None
+
+    def apply(self, update: WorldUpdate) -> int:
+        """Apply `update` as a new version (no-op when it changes nothing)."""
+        cur = self._current
+        buckets = list(self._buckets)
+        n = len(buckets)
+        copied: dict[int, dict[str, object]] = {}
+        size = len(cur)
+        set_keys: list[str] = []
+        removed_keys: list[str] = []
+
+        def writable(key: str) -> dict[str, object]:
+            i = hash(key) % n
+            b = copied.get(i)
+            if b is None:
+                b = copied[i] = dict(buckets[i])
+            return b
+
+        for key, value in update.changes.items():
+            b = writable(key)
+            if key in b and b[key] == value:
+                continue
+            size += key not in b
+            b[key] = value
+            set_keys.append(key)
+        for key in update.removed:
+            b = writable(key)
+            if b.pop(key, _MISSING) is not _MISSING:
+                size -= 1
+                removed_keys.append(key)
+        if not set_keys and not removed_keys:
+            return cur.version
+
+        for i, b in copied.items():
+            buckets[i] = MappingProxyType(b)
+        version = cur.version + 1
+        self._buckets = tuple(buckets)
+        self._current = WorldSnapshot(version, self._buckets, size)
+        self._history.append(self._current)
+        self._log.append((version, frozenset(set_keys), frozenset(removed_keys)))
+        return version
+
+    def diff_since(self, version: int) -> WorldDiff | None:
+        """Changes after `version` up to now; None if `version` was compacted away."""
+        cur = self._current
+        if version > cur.version:
+            msg = f"version {version} is in the future (current {cur.version})"
+            raise ValueError(msg)
+        if version < self.oldest_version:
+            return None
+        touched: set[str] = set()
+        for v, set_keys, removed_keys in reversed(self._log):
+            if v <= version:
+                break
+            touched |= set_keys
+            touched |= removed_keys
+        changed = {k: cur[k] for k in touched if k in cur}
+        removed = frozenset(k for k in touched if k not in cur)
+        return WorldDiff(version, cur.version, changed, removed)
+
+    def on_event(self, event: Event) -> None:
+        """Bus subscriber applying `WorldUpdate` payloads."""
+        if isinstance(event.payload, WorldUpdate):
+            self.apply(event.payload)
+        else:
+            logger.debug("ignoring non-world payload on %s", event.topic)
+
+    def bind(self, bus: Bus, pattern: str = "world.#") -> None:
+        bus.subscribe(pattern, self.on_event)
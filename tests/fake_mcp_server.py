@@ -0,0 +1,118 @@
+"""Fake MCP stdio server for offline pool and cache tests.
+
+Speaks the minimal MCP subset the Agents SDK client uses (initialize, ping,
+tools/list, tools/call) as newline-delimited JSON-RPC on stdin/stdout, with no
+dependency on an MCP server library. Requests are handled one at a time, like a
+single real pipe.
+
+Tools:
+- echo{text}: returns the text
+- sleep{ms}: waits `ms` milliseconds, then returns "slept"
+- world_snapshot{}: returns a small JSON world summary with a call counter
+
+Run with `python tests/fake_mcp_server.py [--latency-ms N]`; `--latency-ms` adds
+a fixed delay to every tools/call.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+
+_TOOLS = [
+    {
+        "name": "echo",
+        "description": "Echo the given text.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {"text": {"type": "string"}},
+            "required": ["text"],
+        },
+    },
+    {
+        "name": "sleep",
+        "description": "Sleep for the given milliseconds.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {"ms": {"type": "integer"}},
+            "required": ["ms"],
+        },
+    },
+    {
+        "name": "world_snapshot",
+        "description": "Return a small world summary.",
+        "inputSchema": {"type": "object", "properties": {}},
+    },
+]
+
+
+class FakeServer:
+    def __init__(self, latency_ms: int) -> None:
+        self.latency_ms = latency_ms
+        self.calls = 0
+
+    def handle(self, msg: dict[str, object]) -> dict[str, object] | None:
+        method = msg.get("method")
+        if "id" not in msg:  # notification
+            return None
+        result: dict[str, object]
+        if method == "initialize":
+            params = msg.get("params")
+            version = params.get("protocolVersion") if isinstance(params, dict) else None
+            result = {
+                "protocolVersion": version or "2025-06-18",
+                "capabilities": {"tools": {"listChanged": False}},
+                "serverInfo": {"name": "fake-resobot-mcp", "version": "0.1.0"},
+            }
+        elif method == "ping":
+            result = {}
+        elif method == "tools/list":
+            result = {"tools": _TOOLS}
+        elif method == "tools/call":
+            params = msg.get("params")
+            result = self.call(params if isinstance(params, dict) else {})
+        else:
+            return {
+                "jsonrpc": "2.0",
+                "id": msg["id"],
+                "error": {"code": -32601, "message": f"unknown method {method}"},
+            }
+        return {"jsonrpc": "2.0", "id": msg["id"], "result": result}
+
+    def call(self, params: dict[str, object]) -> dict[str, object]:
+        self.calls += 1
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        name = params.get("name")
+        args = params.get("arguments")
+        args = args if isinstance(args, dict) else {}
+        if name == "echo":
+            text = str(args.get("text", ""))
+        elif name == "sleep":
+            time.sleep(int(args.get("ms", 0)) / 1000)
+            text = "slept"
+        elif name == "world_snapshot":
+            text = json.dumps({"users": ["alice", "bob"], "calls": self.calls})
+        else:
+            return {"content": [{"type": "text", "text": f"unknown tool {name}"}], "isError": True}
+        return {"content": [{"type": "text", "text": text}], "isError": False}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="fake_mcp_server")
+    parser.add_argument("--latency-ms", type=int, default=0)
+    args = parser.parse_args()
+    server = FakeServer(args.latency_ms)
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        reply = server.handle(json.loads(line))
+        if reply is not None:
+            sys.stdout.write(json.dumps(reply) + "\n")
+            sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,19 @@
 from __future__ import annotations
 
-from resobot_gw.bus import Bus, Event
+import asyncio
+from collections.abc import Awaitable, Callable
+
+import pytest
+
+from resobot_gw.bus import (
+    AsyncBus,
+    AsyncSubscriber,
+    Bus,
+    Event,
+    Overflow,
+    QueuePolicy,
+    TopicIndex,
+)
 
 
 def test_bus_publish_subscribe() -> None:
@@ -15,3 +28,166 @@ def test_bus_publish_subscribe() -> None:
 
     assert len(received) == 1
     assert received[0].payload == {"x": 1}
+
+
+def test_bus_wildcard_routing() -> None:
+    bus = Bus()
+    seen: list[str] = []
+    bus.subscribe("resobot.*.commit", lambda ev: seen.append(f"one:{ev.topic}"))
+    bus.subscribe("resobot.#", lambda ev: seen.append(f"all:{ev.topic}"))
+    bus.subscribe("resobot.alice.action.done", lambda ev: seen.append(f"exact:{ev.topic}"))
+
+    bus.publish(Event(topic="resobot.alice.commit", payload=None))
+    bus.publish(Event(topic="resobot.alice.action.done", payload=None))
+    bus.publish(Event(topic="other.alice.commit", payload=None))
+
+    assert seen == [
+        "one:resobot.alice.commit",
+        "all:resobot.alice.commit",
+        "all:resobot.alice.action.done",
+        "exact:resobot.alice.action.done",
+    ]
+
+
+def test_topic_index_cache_invalidated_on_change() -> None:
+    index = TopicIndex()
+
+    def a(_: Event) -> None: ...
+
+    def b(_: Event) -> None: ...
+
+    index.add("x.*", a)
+    assert index.match("x.y") == (a,)
+    index.add("x.#", b)
+    assert index.match("x.y") == (a, b)
+    assert index.match("x") == (b,)
+    assert index.remove("x.*", a)
+    assert not index.remove("x.*", a)
+    assert index.match("x.y") == (b,)
+    assert len(index) == 1
+
+
+@pytest.mark.parametrize("pattern", ["", "a..b", "a.#.b", "a.b*", "#x"])
+def test_topic_index_rejects_bad_patterns(pattern: str) -> None:
+    with pytest.raises(ValueError, match=r"pattern|level"):
+        TopicIndex().add(pattern, lambda _: None)
+
+
+def collect(into: list[object]) -> AsyncSubscriber:
+    async def sub(ev: Event) -> None:
+        await asyncio.sleep(0)
+        into.append(ev.payload)
+
+    return sub
+
+
+def run_async(fn: Callable[[AsyncBus], Awaitable[None]]) -> None:
+    async def main() -> None:
+        async with AsyncBus() as bus:
+            await fn(bus)
+
+    asyncio.run(main())
+
+
+def test_async_bus_slow_subscriber_does_not_block_publish() -> None:
+    fast: list[object] = []
+
+    async def scenario(bus: AsyncBus) -> None:
+        release = asyncio.Event()
+
+        async def slow(_: Event) -> None:
+            await release.wait()
+
+        bus.subscribe("commit", slow, name="slow")
+        bus.subscribe("commit", collect(fast), name="quick")
+        for i in range(3):
+            bus.publish(Event(topic="commit", payload=i))
+        # publish only enqueued; no subscriber ran on the publisher's stack
+        assert {s.name: s.depth for s in bus.stats()} == {"slow": 3, "quick": 3}
+        await asyncio.sleep(0.01)
+        assert fast == [0, 1, 2]
+        assert {s.name: s.depth for s in bus.stats()} == {"slow": 2, "quick": 0}
+        release.set()
+        await bus.drain()
+        assert {s.name: s.delivered for s in bus.stats()} == {"slow": 3, "quick": 3}
+
+    run_async(scenario)
+
+
+@pytest.mark.parametrize(
+    ("overflow", "expected", "dropped"),
+    [
+        (Overflow.drop_oldest, [2, 3], 2),
+        (Overflow.drop_newest, [0, 1], 2),
+        (Overflow.block, [0, 1, 2, 3], 0),
+    ],
+)
+def test_async_bus_overflow_policies(
+    overflow: Overflow,
+    expected: list[int],
+    dropped: int,
+) -> None:
+    got: list[object] = []
+
+    async def scenario(bus: AsyncBus) -> None:
+        bus.subscribe("t", collect(got), QueuePolicy(maxsize=2, overflow=overflow))
+        for i in range(4):
+            bus.publish(Event(topic="t", payload=i))
+        await bus.drain()
+        assert bus.stats()[0].dropped == dropped
+
+    run_async(scenario)
+    assert got == expected
+
+
+def test_async_bus_coalesce_keeps_latest_per_key() -> None:
+    got: list[object] = []
+
+    async def scenario(bus: AsyncBus) -> None:
+        policy = QueuePolicy(maxsize=4, overflow=Overflow.coalesce, key=lambda e: e.payload[0])
+        bus.subscribe("pose", collect(got), policy)
+        for ev in [("alice", 1), ("bob", 1), ("alice", 2), ("alice", 3)]:
+            bus.publish(Event(topic="pose", payload=ev))
+        await bus.drain()
+        assert bus.stats()[0].coalesced == 2
+
+    run_async(scenario)
+    assert got == [("alice", 3), ("bob", 1)]
+
+
+def test_async_bus_publish_async_waits_for_block_queue() -> None:
+    async def scenario(bus: AsyncBus) -> None:
+        release = asyncio.Event()
+
+        async def slow(_: Event) -> None:
+            await release.wait()
+
+        bus.subscribe("t", slow, QueuePolicy(maxsize=1, overflow=Overflow.block))
+        bus.publish(Event(topic="t", payload=0))
+        await asyncio.sleep(0)  # consumer takes event 0 and waits
+        bus.publish(Event(topic="t", payload=1))
+        pending = asyncio.ensure_future(bus.publish_async(Event(topic="t", payload=2)))
+        await asyncio.sleep(0)
+        assert not pending.done()
+        release.set()
+        await pending
+        await bus.drain()
+        assert bus.stats()[0].delivered == 3
+
+    run_async(scenario)
+
+
+def test_async_bus_wildcard_and_unsubscribe() -> None:
+    got: list[object] = []
+
+    async def scenario(bus: AsyncBus) -> None:
+        sub = collect(got)
+        bus.subscribe("resobot.*.commit", sub)
+        bus.publish(Event(topic="resobot.alice.commit", payload=1))
+        await bus.drain()
+        assert bus.unsubscribe("resobot.*.commit", sub)
+        bus.publish(Event(topic="resobot.alice.commit", payload=2))
+        assert bus.stats() == []
+
+    run_async(scenario)
+    assert got == [1]
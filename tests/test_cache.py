@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from resobot_gw.cache import AsyncTTLCache
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.t = 0.0
+
+    def __call__(self) -> float:
+        return self.t
+
+
+def test_ttl_expiry_and_hits() -> None:
+    clock = Clock()
+    cache = AsyncTTLCache(clock=clock)
+    loads = 0
+
+    async def load() -> str:
+        nonlocal loads
+        loads += 1
+        await asyncio.sleep(0)
+        return f"v{loads}"
+
+    async def run() -> list[object]:
+        out = [await cache.get_or_load("k", load, 1.0)]
+        clock.t = 0.5
+        out.append(await cache.get_or_load("k", load, 1.0))
+        clock.t = 1.0
+        out.append(await cache.get_or_load("k", load, 1.0))
+        return out
+
+    assert asyncio.run(run()) == ["v1", "v1", "v2"]
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.expirations) == (1, 2, 1)
+
+
+def test_concurrent_loads_coalesce() -> None:
+    cache = AsyncTTLCache()
+    loads = 0
+
+    async def load() -> int:
+        nonlocal loads
+        loads += 1
+        await asyncio.sleep(0.01)
+        return 42
+
+    async def run() -> list[object]:
+        return list(await asyncio.gather(*(cache.get_or_load("k", load, 5.0) for _ in range(5))))
+
+    assert asyncio.run(run()) == [42] * 5
+    assert loads == 1
+    assert cache.stats.misses == 1
+    assert cache.stats.coalesced == 4
+
+
+def test_failed_load_reaches_all_waiters_and_is_not_cached() -> None:
+    cache = AsyncTTLCache()
+
+    async def load() -> int:
+        await asyncio.sleep(0.01)
+        raise ConnectionError("down")
+
+    async def run() -> list[object]:
+        calls = (cache.get_or_load("k", load, 5.0) for _ in range(3))
+        return list(await asyncio.gather(*calls, return_exceptions=True))
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, ConnectionError) for r in results)
+    assert len(cache) == 0
+
+
+def test_cancelled_caller_does_not_cancel_shared_load() -> None:
+    cache = AsyncTTLCache()
+
+    async def load() -> str:
+        await asyncio.sleep(0.02)
+        return "ok"
+
+    async def run() -> object:
+        first = asyncio.create_task(cache.get_or_load("k", load, 5.0))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(cache.get_or_load("k", load, 5.0))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(run()) == "ok"
+    assert len(cache) == 1
+
+
+def test_lru_eviction_by_entries_and_bytes() -> None:
+    cache = AsyncTTLCache(max_entries=2, max_bytes=10, sizeof=len)
+    cache.put("a", "xxxx", 5.0)
+    cache.put("b", "xxxx", 5.0)
+    assert cache.get("a") == (True, "xxxx")  # a is now most recent
+    cache.put("c", "xx", 5.0)
+    assert cache.get("b") == (False, None)
+    cache.put("d", "xxxxxx", 5.0)  # 4 + 2 + 6 > 10 -> evict a, then fits
+    assert cache.get("a") == (False, None)
+    assert cache.bytes == 8
+    cache.put("huge", "x" * 11, 5.0)  # larger than the cap: never stored
+    assert cache.get("huge") == (False, None)
+    assert cache.stats.evictions == 2
+
+
+def test_invalidate_during_load_skips_store() -> None:
+    cache = AsyncTTLCache()
+
+    async def load() -> str:
+        await asyncio.sleep(0.01)
+        return "stale"
+
+    async def run() -> object:
+        task = asyncio.create_task(cache.get_or_load("k", load, 5.0))
+        await asyncio.sleep(0)
+        cache.invalidate("k")
+        return await task
+
+    assert asyncio.run(run()) == "stale"
+    assert len(cache) == 0
+    cache.put("w:1", 1, 5.0)
+    cache.put("w:2", 2, 5.0)
+    cache.put("x:1", 3, 5.0)
+    assert cache.invalidate_where(lambda k: str(k).startswith("w:")) == 2
+    assert len(cache) == 1
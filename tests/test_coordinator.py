@@ -6,10 +6,11 @@ from resobot_gw.agents.coordinator import (
     AgentSpec,
     AsyncProposer,
     Coordinator,
+    LatePolicy,
     ReasoningEffort,
 )
-from resobot_gw.agents.orchestrator import Arbiter, Intent, Resource, Tier
-from resobot_gw.bus import Bus
+from resobot_gw.agents.orchestrator import Arbiter, Intent, Preemption, Resource, Tier
+from resobot_gw.bus import Bus, Event
 
 
 class DummyProposer(AsyncProposer):
@@ -61,3 +62,130 @@ def test_tick_async_commits() -> None:
     committed = asyncio.run(coord.tick_async([p1, p2]))
     kinds = {c.kind for c in committed}
     assert kinds == {"say", "move"}
+
+
+def mk_spec(name: str, budget_ms: int | None, policy: LatePolicy = LatePolicy.cancel) -> AgentSpec:
+    return AgentSpec(
+        name=name,
+        model="gpt",
+        instructions="",
+        reasoning=ReasoningEffort.low,
+        latency_budget_ms=budget_ms,
+        late_policy=policy,
+    )
+
+
+def mk_intent(agent: str, kind: str, res: Resource, tier: Tier) -> Intent:
+    return Intent(
+        agent=agent,
+        kind=kind,
+        params={},
+        resources=(res,),
+        score=1.0,
+        hold_ms=1,
+        tier=tier,
+    )
+
+
+def test_tick_async_cancels_late_proposer() -> None:
+    coord = Coordinator(arbiter=Arbiter(now_ms_fn=lambda: 1000), bus=Bus())
+    gaze = DummyProposer(
+        mk_spec("gaze", 100),
+        mk_intent("gaze", "look_at", Resource.head, Tier.reflex),
+        delay=0.0,
+    )
+    plan = DummyProposer(
+        mk_spec("plan", 20),
+        mk_intent("plan", "move_to", Resource.locomotion, Tier.planner),
+        delay=5.0,
+    )
+
+    async def run() -> tuple[list[Intent], float]:
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        committed = await coord.tick_async([gaze, plan])
+        return committed, loop.time() - start
+
+    committed, elapsed = asyncio.run(run())
+    assert [c.kind for c in committed] == ["look_at"]
+    assert elapsed < 1.0
+    assert (coord.stats.on_time, coord.stats.cancelled, coord.stats.carried) == (1, 1, 0)
+
+
+def test_tick_async_carries_late_proposer_into_next_tick() -> None:
+    now = 1000
+    coord = Coordinator(arbiter=Arbiter(now_ms_fn=lambda: now), bus=Bus())
+    plan = DummyProposer(
+        mk_spec("plan", 10, LatePolicy.carry),
+        mk_intent("plan", "move_to", Resource.locomotion, Tier.planner),
+        delay=0.05,
+    )
+
+    async def run() -> tuple[list[Intent], list[Intent]]:
+        first = await coord.tick_async([plan])
+        await asyncio.sleep(0.1)
+        second = await coord.tick_async([plan])
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first == []
+    assert [c.kind for c in second] == ["move_to"]
+    assert (coord.stats.carried, coord.stats.harvested, coord.stats.on_time) == (1, 1, 0)
+
+
+def test_carried_task_of_absent_proposer_is_cancelled() -> None:
+    coord = Coordinator(arbiter=Arbiter(now_ms_fn=lambda: 1000), bus=Bus())
+    plan = DummyProposer(
+        mk_spec("plan", 10, LatePolicy.carry),
+        mk_intent("plan", "move_to", Resource.locomotion, Tier.planner),
+        delay=5.0,
+    )
+    gaze = DummyProposer(
+        mk_spec("gaze", 100),
+        mk_intent("gaze", "look_at", Resource.head, Tier.reflex),
+        delay=0.0,
+    )
+
+    async def run() -> asyncio.Task[object]:
+        await coord.tick_async([plan])
+        (task,) = asyncio.all_tasks() - {asyncio.current_task()}
+        await coord.tick_async([gaze])  # plan left the roster
+        await asyncio.sleep(0)
+        return task
+
+    task = asyncio.run(run())
+    assert task.cancelled()
+    assert (coord.stats.carried, coord.stats.cancelled, coord.stats.harvested) == (1, 1, 0)
+
+
+def test_tick_deadline_caps_unbudgeted_proposers() -> None:
+    coord = Coordinator(arbiter=Arbiter(now_ms_fn=lambda: 1000), bus=Bus(), tick_deadline_ms=10)
+    slow = DummyProposer(
+        mk_spec("slow", None),
+        mk_intent("slow", "say", Resource.speech, Tier.activity),
+        delay=5.0,
+    )
+    assert asyncio.run(coord.tick_async([slow])) == []
+    assert coord.stats.cancelled == 1
+
+
+def test_submit_urgent_publishes_commit_and_cancel() -> None:
+    bus = Bus()
+    events: list[Event] = []
+    bus.subscribe("commit", events.append)
+    bus.subscribe("cancel", events.append)
+    coord = Coordinator(arbiter=Arbiter(now_ms_fn=lambda: 1000), bus=bus)
+    plan = mk_intent("plan", "say", Resource.speech, Tier.planner)
+    coord.submit(plan)
+    assert coord.tick() == [plan]
+
+    dlg = mk_intent("dlg", "say", Resource.speech, Tier.reflex)
+    assert coord.submit_urgent(dlg)
+    assert [e.topic for e in events] == ["commit", "cancel", "commit"]
+    assert events[1].payload == Preemption(
+        holder="plan",
+        tier=Tier.planner,
+        resources=(Resource.speech,),
+        by="dlg",
+    )
+    assert events[2].payload == [dlg]
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+import random
+
+import pytest
+
+from resobot_gw.agents.coordinator import AgentSpec, Coordinator, ReasoningEffort
+from resobot_gw.agents.engagement import EngagementModel, EngagementWeights, TurnTaker
+from resobot_gw.agents.orchestrator import Arbiter, Tier
+from resobot_gw.bus import Bus
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.t = 0.0
+
+    def __call__(self) -> float:
+        return self.t
+
+
+def test_score_combines_weighted_features() -> None:
+    model = EngagementModel(clock=Clock())
+    model.distance("alice", 0.0)  # proximity 1
+    model.utterance("alice")
+    model.distance("bob", 4.0)  # proximity 0.5
+    model.mention("bob")
+    model.gaze("carol")
+    w = EngagementWeights()
+    ranking = dict(model.ranking())
+    assert ranking["alice"] == pytest.approx(w.a + w.b)
+    assert ranking["bob"] == pytest.approx(0.5 * w.a + w.c)
+    assert ranking["carol"] == pytest.approx(w.d)
+    assert model.pick() == ("alice", pytest.approx(w.a + w.b))
+
+
+def test_decay_is_incremental_and_halves_per_half_life() -> None:
+    clock = Clock()
+    model = EngagementModel(clock=clock)
+    model.utterance("alice")
+    clock.t = 2.0
+    model.scores()  # decays 2 s
+    clock.t = 4.0  # another 2 s: one full freshness half-life in total
+    assert model.pick() == ("alice", pytest.approx(0.5 * EngagementWeights().b))
+
+
+def test_users_grow_beyond_capacity_and_slots_are_reused() -> None:
+    model = EngagementModel(capacity=2, clock=Clock())
+    for i in range(5):
+        model.distance(f"u{i}", float(i))
+    assert len(model) == 5
+    model.remove("u0")
+    model.distance("u5", 0.0)
+    assert model.pick() == ("u5", pytest.approx(EngagementWeights().a))
+    assert {u for u, _ in model.ranking()} == {"u1", "u2", "u3", "u4", "u5"}
+
+
+@pytest.mark.parametrize("n_users", [3, 4, 5, 6])
+def test_ac3_same_user_repeat_rate_below_60_percent(n_users: int) -> None:
+    clock = Clock()
+    model = EngagementModel(clock=clock)
+    rng = random.Random(n_users)
+    users = [f"u{i}" for i in range(n_users)]
+    for i, u in enumerate(users):
+        model.distance(u, 1.0 + i)
+    previous = None
+    repeats = 0
+    turns = 200
+    for _ in range(turns):
+        clock.t += 1.5
+        model.utterance(users[0])  # u0 is close and talks constantly
+        if rng.random() < 0.3:
+            model.utterance(rng.choice(users[1:]))
+        pick = model.pick()
+        assert pick is not None
+        user = pick[0]
+        repeats += user == previous
+        previous = user
+        model.replied(user)
+    assert repeats / turns < 0.6
+
+
+def test_turn_taker_scores_say_and_counts_commits() -> None:
+    clock = Clock()
+    model = EngagementModel(clock=clock)
+    model.distance("alice", 0.0)
+    model.mention("alice")
+    spec = AgentSpec(
+        name="turn_taker",
+        model="gpt",
+        instructions="",
+        reasoning=ReasoningEffort.low,
+        tier=Tier.activity,
+    )
+
+    async def compose(user: str) -> str:
+        await asyncio.sleep(0)
+        return f"Hi {user}!"
+
+    taker = TurnTaker(spec, engagement=model, compose=compose)
+    bus = Bus()
+    bus.subscribe("commit", taker.on_commit)
+    coord = Coordinator(arbiter=Arbiter(), bus=bus)
+    committed = asyncio.run(coord.tick_async([taker]))
+    assert len(committed) == 1
+    say = committed[0]
+    assert say.params == {"text": "Hi alice!", "to": "alice"}
+    assert say.score == pytest.approx(EngagementWeights().a + EngagementWeights().c)
+    assert model.repeat_rate == 0.0
+    # the committed reply now damps alice's next score
+    assert model.pick() == ("alice", pytest.approx(say.score * 0.65))
+
+
+def test_turn_taker_skips_when_nobody_is_engaged() -> None:
+    model = EngagementModel(clock=Clock())
+    model.distance("far", 100.0)
+    spec = AgentSpec(name="tt", model="gpt", instructions="", reasoning=ReasoningEffort.low)
+
+    async def compose(_: str) -> str:
+        await asyncio.sleep(0)
+        return "unused"
+
+    taker = TurnTaker(spec, engagement=model, compose=compose)
+    assert asyncio.run(taker.propose()) == ()
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+
+import pytest
+
+from resobot_gw.agents.coordinator import Coordinator, Proposer
+from resobot_gw.agents.guardian import (
+    Guardian,
+    PolicyIndex,
+    PolicyRule,
+    PrivateObjectRule,
+    Veto,
+    Vetoed,
+)
+from resobot_gw.agents.orchestrator import Arbiter, Intent, Resource, Tier
+from resobot_gw.bus import Bus, Event
+
+
+def mk(kind: str, res: tuple[Resource, ...], **params: object) -> Intent:
+    return Intent("mani", kind, dict(params), res, 1.0, 50, Tier.activity)
+
+
+@dataclass(eq=False)
+class Counting(PolicyRule):
+    name: str = "counting"
+    kinds: frozenset[str] = frozenset()
+    resources: frozenset[Resource] = frozenset()
+    seen: int = 0
+
+    def check(self, intent: Intent) -> Intent | Veto:
+        self.seen += 1
+        return intent
+
+
+@dataclass(eq=False)
+class SlowDown(PolicyRule):
+    name: str = "slow"
+    kinds: frozenset[str] = frozenset({"move_to"})
+    resources: frozenset[Resource] = frozenset()
+
+    def check(self, intent: Intent) -> Intent | Veto:
+        return replace(intent, params={**intent.params, "speed": 0.2})
+
+
+class _Script(Proposer):
+    def __init__(self, intents: list[Intent]) -> None:
+        self.intents = intents
+
+    def propose(self) -> list[Intent]:
+        return self.intents
+
+
+def test_private_object_vetoed_with_reason_on_bus() -> None:
+    bus = Bus()
+    vetoes: list[Event] = []
+    bus.subscribe("veto", vetoes.append)
+    guardian = Guardian([PrivateObjectRule(private={"alice_phone"})], bus=bus)
+    coord = Coordinator(arbiter=Arbiter(now_ms_fn=lambda: 0), bus=bus, guardian=guardian)
+    mine = mk("grab", (Resource.hands_l,), object="alice_phone")
+    cup = mk("grab", (Resource.hands_r,), object="cup")
+
+    assert coord.tick([_Script([mine, cup])]) == [cup]
+    assert not coord.submit_urgent(mine)
+    assert len(vetoes) == 2
+    payload = vetoes[0].payload
+    assert isinstance(payload, Vetoed)
+    assert payload.intent is mine
+    assert payload.rule == "private_object"
+    assert "private" in payload.reason
+    assert payload.detail["object"] == "alice_phone"
+    stats = guardian.stats["private_object"]
+    assert (stats.calls, stats.vetoes) == (3, 2)
+    assert stats.total_ns >= stats.max_ns > 0
+
+
+def test_rules_only_see_matching_kind_and_resources() -> None:
+    any_rule = Counting("any")
+    hands = Counting("hands", resources=frozenset({Resource.hands_l, Resource.hands_r}))
+    says = Counting("says", kinds=frozenset({"say"}))
+    say_ui = Counting("say_ui", kinds=frozenset({"say"}), resources=frozenset({Resource.ui}))
+    index = PolicyIndex([any_rule, hands, says, say_ui])
+
+    assert index.rules_for(mk("say", (Resource.speech,))) == (any_rule, says)
+    assert index.rules_for(mk("say", (Resource.speech, Resource.ui))) == (any_rule, says, say_ui)
+    assert index.rules_for(mk("grab", (Resource.hands_r,))) == (any_rule, hands)
+    assert index.rules_for(mk("emote", (Resource.ui,))) == (any_rule,)
+
+    guardian = Guardian([any_rule, hands, says, say_ui])
+    guardian.filter([mk("grab", (Resource.hands_l,)), mk("look_at", (Resource.head,))])
+    assert (any_rule.seen, hands.seen, says.seen, say_ui.seen) == (2, 1, 0, 0)
+
+
+def test_amendments_apply_and_bad_amendments_veto() -> None:
+    guardian = Guardian([SlowDown()])
+    move = mk("move_to", (Resource.locomotion,), speed=1.0)
+    (out,) = guardian.filter([move])
+    assert out.params == {"speed": 0.2}
+    assert guardian.stats["slow"].amended == 1
+
+    @dataclass(eq=False)
+    class Widen(PolicyRule):
+        name: str = "widen"
+        kinds: frozenset[str] = frozenset({"move_to"})
+
+        def check(self, intent: Intent) -> Intent | Veto:
+            return replace(intent, resources=(*intent.resources, Resource.ui))
+
+    bus = Bus()
+    vetoes: list[Event] = []
+    bus.subscribe("veto", vetoes.append)
+    guardian = Guardian([Widen()], bus=bus)
+    say = mk("say", (Resource.speech,))
+    # the rest of the batch still goes through
+    assert guardian.filter([move, say]) == [say]
+    stats = guardian.stats["widen"]
+    assert (stats.errors, stats.vetoes, stats.amended) == (1, 1, 0)
+    (event,) = vetoes
+    assert event.payload.intent is move
+    assert "bad amendment" in event.payload.reason
+
+
+def test_failing_rule_vetoes() -> None:
+    @dataclass(eq=False)
+    class Broken(PolicyRule):
+        name: str = "broken"
+
+        def check(self, intent: Intent) -> Intent | Veto:
+            raise KeyError(intent.kind)
+
+    bus = Bus()
+    vetoes: list[Event] = []
+    bus.subscribe("veto", vetoes.append)
+    guardian = Guardian([Broken()], bus=bus)
+    assert guardian.check(mk("say", (Resource.speech,))) is None
+    assert guardian.stats["broken"].errors == 1
+    assert "rule error" in vetoes[0].payload.reason
+
+
+def test_duplicate_names_and_budget_overruns() -> None:
+    with pytest.raises(ValueError, match="unique"):
+        Guardian([Counting(), Counting()])
+    guardian = Guardian([Counting()], budget_ms=0)
+    guardian.filter([mk("say", (Resource.speech,))])
+    assert guardian.overruns == 1
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import AsyncIterator
+
+from resobot_gw.agents.coordinator import (
+    AgentSpec,
+    Coordinator,
+    ReasoningEffort,
+    StreamingProposer,
+)
+from resobot_gw.agents.ingest import IntentChannel
+from resobot_gw.agents.orchestrator import Arbiter, Intent, Resource, Tier
+from resobot_gw.bus import Bus, Event
+from resobot_gw.scheduler import TickScheduler
+
+
+def mk(agent: str, res: Resource, tier: Tier = Tier.reflex) -> Intent:
+    return Intent(
+        agent=agent,
+        kind="act",
+        params={},
+        resources=(res,),
+        score=1.0,
+        hold_ms=10,
+        tier=tier,
+    )
+
+
+SPEC = AgentSpec(name="gaze", model="gpt", instructions="", reasoning=ReasoningEffort.low)
+
+
+class ScriptedStream(StreamingProposer):
+    def __init__(self, intents: list[tuple[float, Intent]]) -> None:
+        super().__init__(SPEC)
+        self._intents = intents
+
+    async def stream(self) -> AsyncIterator[Intent]:
+        for delay, intent in self._intents:
+            await asyncio.sleep(delay)
+            yield intent
+
+
+def test_channel_drains_in_order_and_respects_capacity() -> None:
+    woken: list[int] = []
+    ch = IntentChannel(capacity=2, on_submit=lambda: woken.append(1))
+    a, b, c = mk("a", Resource.head), mk("b", Resource.ui), mk("c", Resource.speech)
+    assert ch.submit(a)
+    assert ch.submit(b)
+    assert not ch.submit(c)
+    assert ch.dropped == 1
+    assert len(woken) == 2
+    assert ch.drain() == [a, b]
+    assert ch.drain() == []
+
+
+def test_tick_drains_inbox() -> None:
+    bus = Bus()
+    seen: list[Event] = []
+    bus.subscribe("commit", seen.append)
+    coord = Coordinator(arbiter=Arbiter(now_ms_fn=lambda: 0), bus=bus)
+    coord.submit(mk("gaze", Resource.head))
+    committed = coord.tick()
+    assert [c.agent for c in committed] == ["gaze"]
+    assert len(seen) == 1
+    assert coord.tick() == []
+
+
+def test_streamed_intent_wakes_idle_scheduler() -> None:
+    bus = Bus()
+    coord = Coordinator(arbiter=Arbiter(), bus=bus)
+    stream = ScriptedStream([(0.03, mk("gaze", Resource.head))])
+    committed: list[Intent] = []
+    bus.subscribe("commit", lambda ev: committed.extend(ev.payload))
+
+    async def run() -> float:
+        sched = TickScheduler.for_coordinator(coord, [], rate_hz=1000.0, idle_poll_s=None)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        task = asyncio.create_task(sched.run())
+        await coord.pump(stream)
+        while not committed:
+            await asyncio.sleep(0.001)
+        elapsed = loop.time() - start
+        sched.stop()
+        await task
+        return elapsed
+
+    elapsed = asyncio.run(run())
+    assert [c.agent for c in committed] == ["gaze"]
+    assert elapsed < 0.5
+
+
+def test_submit_from_a_thread_wakes_scheduler_and_keeps_callback() -> None:
+    bus = Bus()
+    committed: list[Intent] = []
+    bus.subscribe("commit", lambda ev: committed.extend(ev.payload))
+    coord = Coordinator(arbiter=Arbiter(), bus=bus)
+    calls: list[str] = []
+    coord.inbox.on_submit = lambda: calls.append(threading.current_thread().name)
+
+    async def run() -> TickScheduler:
+        sched = TickScheduler.for_coordinator(coord, [], rate_hz=1000.0, idle_poll_s=None)
+        task = asyncio.create_task(sched.run())
+        await asyncio.sleep(0.02)
+        assert sched.metrics.ticks == 1
+        producer = threading.Thread(
+            target=coord.submit,
+            args=(mk("gaze", Resource.head),),
+            name="producer",
+        )
+        producer.start()
+        producer.join()
+        await asyncio.sleep(0.02)
+        sched.stop()
+        await task
+        return sched
+
+    sched = asyncio.run(run())
+    assert calls == ["producer"]
+    assert sched.metrics.ticks >= 2
+    assert [c.agent for c in committed] == ["gaze"]
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from resobot_gw.__main__ import main
+from resobot_gw.agents.orchestrator import Resource, Tier
+from resobot_gw.loadgen import BenchTarget, ManualClock, WorkloadSpec, generate, run_bench
+
+
+def test_same_seed_same_workload() -> None:
+    spec = WorkloadSpec(seed=7, proposers=8, ticks=30)
+    a, b = generate(spec), generate(spec)
+    assert a.script == b.script
+    assert generate(WorkloadSpec(seed=8, proposers=8, ticks=30)).script != a.script
+    assert len(a.script) == 30
+    assert all(len(row) == 8 for row in a.script)
+
+
+def test_workload_respects_mixes_and_holds() -> None:
+    spec = WorkloadSpec(
+        proposers=10,
+        ticks=50,
+        propose_rate=1.0,
+        tier_mix={Tier.reflex: 1.0, Tier.planner: 0.0},
+        resource_mix={Resource.speech: 1.0, Resource.head: 1.0},
+        hold_ms=(10, 20),
+        max_resources=5,
+    )
+    intents = [i for t in range(spec.ticks) for i in generate(spec).tick(t)]
+    assert len(intents) == 500
+    assert {i.tier for i in intents} == {Tier.reflex}
+    assert {r for i in intents for r in i.resources} == {Resource.speech, Resource.head}
+    assert all(len(set(i.resources)) == len(i.resources) <= 2 for i in intents)
+    assert all(10 <= i.hold_ms <= 20 for i in intents)
+
+
+def test_spec_validation() -> None:
+    with pytest.raises(ValueError, match="hold_ms"):
+        WorkloadSpec(hold_ms=(10, 5))
+    with pytest.raises(ValueError, match="tier_mix"):
+        WorkloadSpec(tier_mix={Tier.reflex: 0.0})
+
+
+def test_manual_clock() -> None:
+    clock = ManualClock(5)
+    clock.advance(50)
+    assert clock() == 55
+
+
+@pytest.mark.parametrize("target", list(BenchTarget))
+def test_run_bench_reports_json(target: BenchTarget) -> None:
+    workload = generate(WorkloadSpec(proposers=4, ticks=40, warmup_ticks=10))
+    result = run_bench(target, workload)
+    json.dumps(result)
+    assert result["target"] == str(target)
+    assert result["ticks"] == 30
+    tick_us = result["tick_us"]
+    assert isinstance(tick_us, dict)
+    assert 0 < tick_us["p50"] <= tick_us["p95"] <= tick_us["p99"] <= tick_us["max"]
+    assert result["ticks_per_s"] > 0
+    assert set(result["alloc_bytes_per_tick"]) == {"mean", "p95"}  # type: ignore[arg-type]
+
+
+def test_bench_cli_writes_json(tmp_path) -> None:
+    out = tmp_path / "bench.json"
+    code = main(
+        [
+            "bench",
+            "--target",
+            "arbiter",
+            "--ticks",
+            "20",
+            "--warmup",
+            "5",
+            "--tier-mix",
+            "reflex=2,activity=1",
+            "--resource-mix",
+            "speech,handsL=0.5",
+            "--hold-ms",
+            "50:100",
+            "--output",
+            str(out),
+        ],
+    )
+    assert code == 0
+    (result,) = json.loads(out.read_text())
+    assert result["target"] == "arbiter"
+    assert result["workload"]["tier_mix"] == {"reflex": 2.0, "activity": 1.0}
+    assert result["workload"]["resource_mix"] == {"speech": 1.0, "handsL": 0.5}
+    assert result["workload"]["hold_ms"] == [50, 100]
+
+
+def test_bench_cli_rejects_bad_mix(capsys) -> None:
+    with pytest.raises(SystemExit):
+        main(["bench", "--tier-mix", "urgent=1"])
+    assert "unknown tier" in capsys.readouterr().err
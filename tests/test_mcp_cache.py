@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+from agents.mcp import MCPServerStdio
+
+from resobot_gw.agents.mcp_cache import ToolResultCache
+from resobot_gw.bus import Bus, Event
+
+FAKE_SERVER = Path(__file__).with_name("fake_mcp_server.py")
+
+
+def _server(latency_ms: int = 0) -> MCPServerStdio:
+    return MCPServerStdio(
+        params={
+            "command": sys.executable,
+            "args": [str(FAKE_SERVER), "--latency-ms", str(latency_ms)],
+        },
+    )
+
+
+def _calls(result: object) -> int:
+    return json.loads(result.content[0].text)["calls"]  # type: ignore[attr-defined]
+
+
+def test_cache_coalesces_hits_and_invalidates_on_bus_event() -> None:
+    bus = Bus()
+    cache = ToolResultCache(
+        {"world_snapshot": 60.0},
+        invalidate_on={"world.*.changed": ["world_snapshot"]},
+    )
+    cache.bind(bus)
+
+    async def run() -> list[int]:
+        server = _server(latency_ms=20)
+        await server.connect()
+        try:
+            cached = cache.wrap(server)
+            burst = await asyncio.gather(
+                *(cached.call_tool("world_snapshot", {}) for _ in range(4)),
+            )
+            again = await cached.call_tool("world_snapshot", {})
+            bus.publish(Event("world.alice.changed", None))
+            fresh = await cached.call_tool("world_snapshot", {})
+            echo = await cached.call_tool("echo", {"text": "hi"})  # not cached
+            assert echo.content[0].text == "hi"
+            return [*(_calls(r) for r in burst), _calls(again), _calls(fresh)]
+        finally:
+            await server.cleanup()
+
+    assert asyncio.run(run()) == [1, 1, 1, 1, 1, 2]
+    stats = cache.stats
+    assert (stats.misses, stats.coalesced, stats.hits, stats.invalidations) == (2, 3, 1, 1)
+
+
+def test_error_results_are_not_cached() -> None:
+    cache = ToolResultCache({"nope": 60.0})
+
+    async def run() -> list[bool]:
+        server = _server()
+        await server.connect()
+        try:
+            first = await cache.call(server, "nope", {})
+            second = await cache.call(server, "nope", {})
+            return [first.is_error, second.is_error]
+        finally:
+            await server.cleanup()
+
+    assert asyncio.run(run()) == [True, True]
+    assert cache.stats.misses == 2
+    assert len(cache) == 0
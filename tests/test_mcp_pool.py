@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+from agents.mcp import MCPServerStdio
+
+from resobot_gw.agents.mcp_pool import ConnectRetry, MCPSessionPool
+
+FAKE_SERVER = Path(__file__).with_name("fake_mcp_server.py")
+
+
+class FakeSession:
+    """In-process stand-in for an MCP server (connect/cleanup/list_tools only)."""
+
+    spawned = 0
+
+    def __init__(self) -> None:
+        FakeSession.spawned += 1
+        self.name = f"fake{FakeSession.spawned}"
+        self.broken = False
+        self.connected = False
+
+    async def connect(self) -> None:
+        await asyncio.sleep(0)
+        self.connected = True
+
+    async def cleanup(self) -> None:
+        await asyncio.sleep(0)
+        self.connected = False
+
+    async def list_tools(self) -> list[object]:
+        await asyncio.sleep(0)
+        if self.broken:
+            raise ConnectionError("pipe closed")
+        return []
+
+
+def test_pool_lends_distinct_sessions_concurrently() -> None:
+    async def run() -> tuple[set[str], MCPSessionPool]:
+        used: set[str] = set()
+        async with MCPSessionPool(FakeSession, size=3) as pool:
+
+            async def agent() -> None:
+                async with pool.session() as server:
+                    used.add(server.name)
+                    await asyncio.sleep(0.02)
+
+            await asyncio.gather(agent(), agent(), agent())
+        return used, pool
+
+    used, pool = asyncio.run(run())
+    assert len(used) == 3
+    assert pool.stats.waits == 0
+    assert pool.stats.borrows == 3
+
+
+def test_pool_respawns_unhealthy_session() -> None:
+    async def run() -> tuple[str, str, MCPSessionPool]:
+        async with MCPSessionPool(FakeSession, size=1, check_interval_s=0.0) as pool:
+            async with pool.session() as server:
+                first = server.name
+                server.broken = True
+            async with pool.session() as server:
+                second = server.name
+                assert server.connected
+        return first, second, pool
+
+    first, second, pool = asyncio.run(run())
+    assert first != second
+    assert pool.stats.unhealthy == 1
+    assert pool.stats.respawns == 1
+
+
+class RefusedSession(FakeSession):
+    async def connect(self) -> None:
+        await asyncio.sleep(0)
+        msg = f"{self.name} refused"
+        raise ConnectionError(msg)
+
+
+def test_pool_start_gives_up_after_connect_attempts() -> None:
+    pool = MCPSessionPool(RefusedSession, size=2, retry=ConnectRetry(delay_s=0.0, attempts=3))
+    with pytest.raises(ConnectionError, match="refused"):
+        asyncio.run(pool.start())
+    assert pool.stats.connect_failures == 6
+
+
+def test_cancelled_borrow_is_rechecked() -> None:
+    async def run() -> MCPSessionPool:
+        async with MCPSessionPool(FakeSession, size=1) as pool:
+
+            async def hang() -> None:
+                async with pool.session():
+                    await asyncio.sleep(10)
+
+            task = asyncio.create_task(hang())
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            async with pool.session():
+                pass
+        return pool
+
+    pool = asyncio.run(run())
+    assert pool.stats.health_checks == 1
+
+
+def test_pool_with_fake_stdio_server() -> None:
+    def factory() -> MCPServerStdio:
+        return MCPServerStdio(params={"command": sys.executable, "args": [str(FAKE_SERVER)]})
+
+    async def run() -> list[str]:
+        async with MCPSessionPool(factory, size=2) as pool:
+
+            async def call(text: str) -> str:
+                async with pool.session() as server:
+                    result = await server.call_tool("echo", {"text": text})
+                    return result.content[0].text
+
+            return list(await asyncio.gather(call("a"), call("b"), call("c")))
+
+    assert asyncio.run(run()) == ["a", "b", "c"]
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import os
+import random
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from resobot_gw.agents.orchestrator import Intent, Resource, Tier
+from resobot_gw.bus import Bus, Event
+from resobot_gw.memory import (
+    HashingEmbedder,
+    MemoryStore,
+    VectorIndex,
+    _Fitted,
+    episode_text,
+)
+from resobot_gw.slo import ActionDone, Stage
+
+
+def mk(agent: str, kind: str, **params: object) -> Intent:
+    return Intent(agent, kind, dict(params), (Resource.speech,), 1.0, 50, Tier.activity)
+
+
+def test_hashing_embedder_is_deterministic_and_normalised() -> None:
+    emb = HashingEmbedder(dim=32)
+    a = emb.embed("grab the red cup")
+    assert a.dtype == np.float32
+    assert a.shape == (32,)
+    assert np.isclose(np.linalg.norm(a), 1.0)
+    assert np.array_equal(a, HashingEmbedder(dim=32).embed("Grab the red cup!"))
+    assert float(a @ emb.embed("red cup")) > float(a @ emb.embed("say hello world"))
+    assert not emb.embed("").any()
+
+
+def test_bus_events_become_searchable_episodes(tmp_path: Path) -> None:
+    bus = Bus()
+    store = MemoryStore(tmp_path / "mem", HashingEmbedder(), clock=lambda: 42.0)
+    store.bind(bus)
+    say = mk("DialogueReflex", "say", text="hello alice")
+    grab = mk("Manipulation", "grab", object="red cup")
+    bus.publish(Event("commit", [say, grab]))
+    bus.publish(Event("action.done", ActionDone(grab, ok=False, detail="slipped")))
+
+    assert len(store) == 3
+    done = store.episode(2)
+    assert (done.ts_ms, done.stage, done.ok) == (42.0, Stage.done, False)
+    assert done.text == "Manipulation grab object=red cup slipped"
+    (hit,) = store.search("alice", k=1)
+    assert hit.row == 0
+    assert hit.episode.text == episode_text(say)
+    assert {r.row for r in store.search("red cup grab", k=2)} == {1, 2}
+    store.close()
+
+
+def test_reopen_maps_existing_rows_and_keeps_appending(tmp_path: Path) -> None:
+    path = tmp_path / "mem"
+    with MemoryStore(path, HashingEmbedder(), chunk=4) as store:
+        for i in range(10):  # grows past the first chunk twice
+            store.append(f"episode number {i}")
+    size = path.stat().st_size
+    with MemoryStore(path, HashingEmbedder(), chunk=4) as store:
+        assert len(store) == 10
+        assert path.stat().st_size == size
+        assert store.episode(7).text == "episode number 7"
+        assert store.append("one more") == 10
+        assert store.search("one more", k=1)[0].row == 10
+    with pytest.raises(ValueError, match="byte rows"):
+        MemoryStore(path, HashingEmbedder(dim=16))
+
+
+def test_text_is_truncated_on_a_character_boundary(tmp_path: Path) -> None:
+    with MemoryStore(tmp_path / "mem", HashingEmbedder(), text_bytes=8) as store:
+        store.append("héllo wörld")
+        assert store.episode(0).text == "héllo w"
+        with pytest.raises(IndexError):
+            store.episode(1)
+
+
+def test_ivf_index_recalls_nearest_neighbours() -> None:
+    rng = np.random.default_rng(0)
+    # clustered like real embeddings: topics plus per-episode noise
+    topics = rng.standard_normal((100, 32))
+    vectors = (topics[rng.integers(100, size=5000)] + 0.3 * rng.standard_normal((5000, 32))).astype(
+        np.float32,
+    )
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    index = VectorIndex(exact_below=1000, nprobe=8)
+    for row in range(len(vectors)):
+        index.add(vectors, row)
+    index.wait(vectors)
+    assert index.partitions > 0
+    exact = VectorIndex(exact_below=len(vectors) + 1)
+    hits = 0
+    for q in rng.choice(len(vectors), size=50, replace=False):
+        query = vectors[q] + 0.1 * rng.standard_normal(32).astype(np.float32)
+        query /= np.linalg.norm(query)
+        want = {r for r, _ in exact.search(vectors, query, 5)}
+        got = index.search(vectors, query, 5)
+        assert [s for _, s in got] == sorted((s for _, s in got), reverse=True)
+        hits += len(want & {r for r, _ in got})
+    assert hits / (50 * 5) > 0.8
+
+
+def test_training_runs_off_the_append_path(tmp_path: Path) -> None:
+    rng = random.Random(2)
+    words = [f"w{i}" for i in range(500)]
+    with MemoryStore(
+        tmp_path / "mem",
+        HashingEmbedder(),
+        index=VectorIndex(exact_below=200),
+    ) as store:
+        for _ in range(200):
+            store.append(" ".join(rng.choices(words, k=6)))
+        # clustering started in the background; the exact scan still answers
+        assert store.index.training
+        assert store.index.partitions == 0
+        text = store.episode(7).text
+        assert store.search(text, k=1)[0].row == 7
+        store.wait_index()
+        assert not store.index.training
+        assert store.index.partitions > 0
+        assert store.search(text, k=1)[0].row == 7
+
+
+def test_reopened_store_maps_its_saved_index(tmp_path: Path) -> None:
+    rng = random.Random(1)
+    words = [f"w{i}" for i in range(500)]
+    path = tmp_path / "mem"
+    with MemoryStore(path, HashingEmbedder(), index=VectorIndex(exact_below=2000)) as store:
+        for _ in range(3000):
+            store.append(" ".join(rng.choices(words, k=6)))
+        store.wait_index()
+        partitions = store.index.partitions
+        assert partitions > 0
+        texts = [store.episode(row).text for row in (5, 2500)]
+    with MemoryStore(path, HashingEmbedder(), index=VectorIndex(exact_below=2000)) as store:
+        # loaded, not re-clustered
+        assert not store.index.training
+        assert store.index.partitions == partitions
+        # a stored text is its own nearest neighbour, whichever partition it landed in
+        assert [store.search(text, k=1)[0].row for text in texts] == [5, 2500]
+        assert store.append("one more") == 3000
+        assert store.search("one more", k=1)[0].row == 3000
+
+    # without a matching saved index, reopening clusters in the background
+    path.with_name("mem.ivf").unlink()
+    with MemoryStore(path, HashingEmbedder(), index=VectorIndex(exact_below=2000)) as store:
+        assert store.index.training
+        store.wait_index()
+        assert store.index.partitions > 0
+        assert store.search(texts[1], k=1)[0].row == 2500
+    with MemoryStore(path, HashingEmbedder(), index=VectorIndex(exact_below=2000)) as store:
+        assert not store.index.training
+        assert store.index.partitions > 0
+
+
+@dataclass
+class _GatedIndex(VectorIndex):
+    """Clustering that waits for `gate`, to hold a build open across appends."""
+
+    gate: threading.Event = field(default_factory=threading.Event)
+
+    def _fit(self, vectors: np.ndarray) -> _Fitted:
+        self.gate.wait(5)
+        return super()._fit(vectors)
+
+
+def _ftruncate_unmapped(real: Callable[[int, int], None]) -> Callable[[int, int], None]:
+    # Windows refuses to resize a mapped file; fail the same way here
+    def ftruncate(fd: int, size: int) -> None:
+        target = str(Path(f"/proc/self/fd/{fd}").readlink())
+        maps = Path("/proc/self/maps").read_text(encoding="utf-8").splitlines()
+        assert not any(line.endswith(" " + target) for line in maps), f"{target} is mapped"
+        real(fd, size)
+
+    return ftruncate
+
+
+@pytest.mark.skipif(not Path("/proc/self/maps").exists(), reason="needs /proc mappings")
+def test_files_grow_unmapped_while_clustering_runs(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(os, "ftruncate", _ftruncate_unmapped(os.ftruncate))
+    path = tmp_path / "mem"
+    index = _GatedIndex(exact_below=32)
+    with MemoryStore(path, HashingEmbedder(), chunk=16, index=index) as store:
+        for i in range(32):
+            store.append(f"episode number {i}")
+        assert store.index.training
+        size = path.stat().st_size
+        for i in range(32, 80):  # three grow boundaries while the build runs
+            store.append(f"episode number {i}")
+        assert path.stat().st_size > size
+        index.gate.set()
+        store.wait_index()
+        assert store.index.partitions > 0
+        assert store.search("episode number 70", k=1)[0].row == 70
+    with MemoryStore(path, HashingEmbedder(), chunk=16, index=VectorIndex(exact_below=32)) as store:
+        assert len(store) == 80
+        assert store.episode(79).text == "episode number 79"
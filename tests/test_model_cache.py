@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import asyncio
+
+from agents import Agent
+
+from resobot_gw.agents.coordinator import AgentSpec, ReasoningEffort
+from resobot_gw.agents.model_cache import ModelResponseCache, normalize_input
+from resobot_gw.agents.openai_runner import ProposalBatch, build_agent
+
+
+def _spec(name: str, reasoning: ReasoningEffort = ReasoningEffort.low) -> AgentSpec:
+    return AgentSpec(
+        name=name,
+        model="gpt-5-mini",
+        instructions="Decide who speaks next.",
+        reasoning=reasoning,
+    )
+
+
+def test_key_ignores_agent_name_and_whitespace() -> None:
+    cache = ModelResponseCache()
+    a = build_agent(_spec("turn_taker"))
+    b = build_agent(_spec("dialogue_reflex"))
+    assert cache.key_for(a, "world:  alice\nbob") == cache.key_for(b, "world: alice bob")
+    high = build_agent(_spec("turn_taker", ReasoningEffort.high))
+    assert cache.key_for(a, "x") != cache.key_for(high, "x")
+    text = build_agent(_spec("turn_taker"), structured=False)
+    assert cache.key_for(a, "x") != cache.key_for(text, "x")
+    assert normalize_input("  a \t b\n") == "a b"
+
+
+def test_dynamic_instructions_bypass_cache() -> None:
+    cache = ModelResponseCache()
+    agent = Agent(name="dyn", instructions=lambda _ctx, _agent: "now")
+    assert cache.key_for(agent, "x") is None
+
+
+def test_identical_concurrent_runs_coalesce() -> None:
+    cache = ModelResponseCache(ttl_s=5.0)
+    calls = 0
+
+    async def call() -> object:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return ProposalBatch(intents=[])
+
+    agents = [build_agent(_spec(n)) for n in ("turn_taker", "dialogue_reflex", "gaze")]
+
+    async def run() -> list[object]:
+        first = await asyncio.gather(*(cache.run(a, "snapshot 1", call) for a in agents))
+        again = await cache.run(agents[0], "snapshot  1", call)
+        other = await cache.run(agents[0], "snapshot 2", call)
+        return [*first, again, other]
+
+    outputs = asyncio.run(run())
+    assert calls == 2
+    assert all(o is outputs[0] for o in outputs[:4])
+    stats = cache.stats
+    assert (stats.misses, stats.coalesced, stats.hits) == (2, 2, 1)
+    cache.clear()
+    assert len(cache) == 0
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+
+from resobot_gw.agents.multibot import ArbiterConfig, MultiBotArbiter
+from resobot_gw.agents.orchestrator import Arbitration, ConditionalRules, Intent, Resource, Tier
+
+
+def say(agent: str, *, tier: Tier = Tier.activity, hold_ms: int = 100) -> Intent:
+    return Intent(
+        agent=agent,
+        kind="say",
+        params={},
+        resources=(Resource.speech,),
+        score=1.0,
+        hold_ms=hold_ms,
+        tier=tier,
+    )
+
+
+def test_bots_have_isolated_lock_tables() -> None:
+    multi = MultiBotArbiter(now_ms_fn=lambda: 1000)
+    # both bots contend for speech; each commits against its own table
+    first = multi.tick({"alice": [say("dlg"), say("turn")], "bob": [say("dlg"), say("turn")]})
+    assert [c.agent for c in first["alice"]] == ["dlg"]
+    assert [c.agent for c in first["bob"]] == ["dlg"]
+
+    # alice's speech lock blocks alice only
+    second = multi.tick({"alice": [say("turn")], "carol": [say("turn")]})
+    assert second["alice"] == []
+    assert [c.agent for c in second["carol"]] == ["turn"]
+    assert multi.next_expiry_ms() == 1100
+    assert sorted(multi.bots) == ["alice", "bob", "carol"]
+
+
+def test_preemptions_are_reported_per_bot() -> None:
+    multi = MultiBotArbiter(now_ms_fn=lambda: 1000)
+    multi.tick({"alice": [say("plan", tier=Tier.planner)], "bob": [say("plan", tier=Tier.planner)]})
+    multi.tick({"alice": [say("dlg", tier=Tier.reflex)], "bob": []})
+    (alice,) = multi.pop_preempted()["alice"]
+    assert (alice.holder, alice.by) == ("plan", "dlg")
+    assert multi.pop_preempted() == {}
+
+
+def test_sharded_tick_matches_in_process() -> None:
+    now = 1000
+    proposals = {f"bot{i}": [say("plan", tier=Tier.planner)] for i in range(6)}
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        multi = MultiBotArbiter(
+            now_ms_fn=lambda: now,
+            executor=pool,
+            parallel_min_bots=2,
+            shards=2,
+        )
+        first = multi.tick(proposals)
+        assert all(len(c) == 1 for c in first.values())
+
+        # lock tables survive the round trip: equal tier is blocked, higher tier preempts
+        now = 1050
+        second = multi.tick({"bot0": [say("x", tier=Tier.planner)], "bot1": [say("y")]})
+        assert second["bot0"] == []
+        assert [c.agent for c in second["bot1"]] == ["y"]
+
+
+def test_sharded_tick_keeps_arbiter_settings_and_state() -> None:
+    now = 1000
+    proposals = {f"bot{i}": [say("plan", tier=Tier.planner)] for i in range(4)}
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        multi = MultiBotArbiter(
+            now_ms_fn=lambda: now,
+            executor=pool,
+            parallel_min_bots=2,
+            shards=2,
+        )
+        arbiters = {bot: multi.arbiter(bot) for bot in proposals}
+        arbiters["bot0"].strategy = Arbitration.optimal
+        arbiters["bot0"].rules = ConditionalRules()
+        multi.tick(proposals)
+        # the reflex intent preempts the planner lock inside the worker
+        multi.tick({bot: [say("gaze", tier=Tier.reflex)] for bot in proposals})
+
+        preempted = multi.pop_preempted()
+        assert sorted(preempted) == sorted(proposals)
+        assert all([p.holder for p in ps] == ["plan"] for ps in preempted.values())
+        assert multi.pop_preempted() == {}
+        for bot, arb in arbiters.items():
+            assert multi.arbiter(bot) is arb
+            (lock,) = {id(lk): lk for _, lk in arb.locks.items()}.values()
+            assert lock.holder == "gaze"
+        assert arbiters["bot0"].strategy is Arbitration.optimal
+        assert not arbiters["bot0"].rules
+        assert arbiters["bot1"].rules
+
+
+def test_configured_optimal_strategy_applies_in_process_and_sharded() -> None:
+    def packing() -> list[Intent]:
+        both = replace(say("wide"), resources=(Resource.speech, Resource.head))
+        look = replace(say("gaze"), kind="look_at", resources=(Resource.head,))
+        return [both, replace(say("dlg"), score=0.6), replace(look, score=0.6)]
+
+    config = ArbiterConfig(strategy=Arbitration.optimal, search_budget_us=10**6)
+    proposals = {f"bot{i}": packing() for i in range(4)}
+    in_process = MultiBotArbiter(now_ms_fn=lambda: 1000, config=config).tick(proposals)
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        multi = MultiBotArbiter(
+            now_ms_fn=lambda: 1000,
+            executor=pool,
+            parallel_min_bots=2,
+            shards=2,
+            config=config,
+        )
+        sharded = multi.tick(proposals)
+    for committed in (in_process, sharded):
+        # greedy would take the single 1.0 intent; optimal packs the two 0.6s
+        assert {bot: sorted(c.agent for c in cs) for bot, cs in committed.items()} == {
+            bot: ["dlg", "gaze"] for bot in proposals
+        }
+    assert all(multi.arbiter(bot).strategy is Arbitration.optimal for bot in proposals)
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+import socket
+from collections.abc import Iterable, Iterator
+
+import pytest
+
+from resobot_gw import obs
+from resobot_gw.agents.coordinator import AgentSpec, AsyncProposer, Coordinator, ReasoningEffort
+from resobot_gw.agents.orchestrator import Arbiter, Intent, Resource, Tier
+from resobot_gw.bus import Bus
+
+
+@pytest.fixture
+def registry() -> Iterator[obs.Metrics]:
+    yield obs.enable_metrics()
+    obs.disable_metrics()
+
+
+def test_histogram_quantiles_within_a_bucket() -> None:
+    h = obs.Histogram()
+    for ms in range(1, 101):
+        h.observe(ms / 1000)
+    assert h.count == 100
+    assert h.mean == pytest.approx(0.0505)
+    assert h.quantile(0.5) == pytest.approx(0.050, rel=0.2)
+    assert h.quantile(0.99) == pytest.approx(0.099, rel=0.2)
+    assert h.quantile(1.0) <= h.max == pytest.approx(0.1)
+    assert obs.Histogram().quantile(0.5) == 0.0
+
+
+def test_span_is_shared_noop_when_disabled() -> None:
+    obs.disable_metrics()
+    assert obs.span("gather") is obs.span("arbitrate", agent="x")
+    with obs.span("gather"):
+        pass
+    obs.record("tick", 0.1)
+    assert obs.metrics() is None
+
+
+def test_spans_record_labels_and_nesting(registry: obs.Metrics) -> None:
+    with obs.span("outer") as outer:
+        with obs.span("model_run", agent="dialogue") as inner:
+            assert isinstance(inner, obs.Span)
+            assert inner.parent is outer
+        obs.record("propose", 0.002, agent="dialogue")
+    names = {(n, ls) for n, ls, _ in registry.items()}
+    assert names == {
+        ("outer", ()),
+        ("model_run", (("agent", "dialogue"),)),
+        ("propose", (("agent", "dialogue"),)),
+    }
+    assert any(line.startswith("propose agent=dialogue n=1 p50=") for line in registry.summary())
+
+
+def test_prometheus_text_is_cumulative(registry: obs.Metrics) -> None:
+    registry.observe("tick", 0.001, kind='say "hi"')
+    registry.observe("tick", 1.0, kind='say "hi"')
+    text = registry.render_prometheus()
+    assert text.startswith("# TYPE resobot_span_seconds histogram\n")
+    series = 'span="tick",kind="say \\"hi\\""'
+    assert f'resobot_span_seconds_bucket{{{series},le="+Inf"}} 2' in text
+    assert f"resobot_span_seconds_count{{{series}}} 2" in text
+    buckets = [ln for ln in text.splitlines() if "_bucket{" in ln]
+    counts = [int(ln.rsplit(" ", 1)[1]) for ln in buckets]
+    assert counts == sorted(counts)
+
+
+def test_serve_prometheus_answers_http_get(registry: obs.Metrics) -> None:
+    registry.observe("arbitrate", 0.0002)
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+
+    async def run() -> bytes:
+        server = asyncio.create_task(obs.serve_prometheus(registry, port=port))
+        await asyncio.sleep(0.05)
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"GET /metrics HTTP/1.1\r\nHost: x\r\n\r\n")
+        body = await reader.read()
+        writer.close()
+        server.cancel()
+        return body
+
+    body = asyncio.run(run())
+    assert body.startswith(b"HTTP/1.1 200 OK")
+    assert b'span="arbitrate"' in body
+
+
+class _Proposer(AsyncProposer):
+    async def propose(self) -> Iterable[Intent]:
+        await asyncio.sleep(0)
+        return [
+            Intent(
+                agent=self.spec.name,
+                kind="say",
+                params={},
+                resources=(Resource.speech,),
+                score=1.0,
+                hold_ms=100,
+                tier=Tier.reflex,
+            ),
+        ]
+
+
+def test_coordinator_tick_is_instrumented(registry: obs.Metrics) -> None:
+    spec = AgentSpec(name="dlg", model="gpt", instructions="", reasoning=ReasoningEffort.low)
+    coord = Coordinator(arbiter=Arbiter(), bus=Bus())
+    asyncio.run(coord.tick_async([_Proposer(spec)]))
+    names = {(n, ls) for n, ls, _ in registry.items()}
+    assert {
+        ("gather", ()),
+        ("arbitrate", ()),
+        ("publish", ()),
+        ("propose", (("agent", "dlg"),)),
+        ("tick_to_commit", (("kind", "say"),)),
+    } <= names
+
+
+def test_sync_coordinator_tick_is_instrumented(registry: obs.Metrics) -> None:
+    coord = Coordinator(arbiter=Arbiter(), bus=Bus())
+    coord.submit(Intent("dlg", "say", {}, (Resource.speech,), 1.0, 100, Tier.reflex))
+    coord.tick()
+    names = {(n, ls) for n, ls, _ in registry.items()}
+    assert {
+        ("gather", ()),
+        ("arbitrate", ()),
+        ("publish", ()),
+        ("tick_to_commit", (("kind", "say"),)),
+    } <= names
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING
+
+from resobot_gw.agents.coordinator import AgentSpec, Coordinator, ReasoningEffort
+from resobot_gw.agents.openai_runner import (
+    IntentDraft,
+    ModelCallLimiter,
+    OpenAIAgentsRunner,
+    OpenAIProposer,
+    OpenAIStreamingProposer,
+    ProposalBatch,
+    build_agent,
+    to_intents,
+)
+from resobot_gw.agents.orchestrator import Arbiter, Resource, Tier
+from resobot_gw.bus import Bus
+from resobot_gw.ratelimit import TokenBucket
+
+if TYPE_CHECKING:
+    from agents import Agent
+
+GAZE = AgentSpec(
+    name="gaze",
+    model="gpt-5-mini",
+    instructions="Look at whoever is speaking.",
+    reasoning=ReasoningEffort.low,
+    tier=Tier.reflex,
+)
+DIALOGUE = AgentSpec(
+    name="dialogue",
+    model="gpt-5",
+    instructions="Reply to the user.",
+    reasoning=ReasoningEffort.medium,
+)
+
+
+def _batch(kind: str, resource: Resource, params_json: str = "{}") -> ProposalBatch:
+    draft = IntentDraft(
+        kind=kind,
+        resources=[resource],
+        score=0.8,
+        hold_ms=500,
+        params_json=params_json,
+    )
+    return ProposalBatch(intents=[draft])
+
+
+def test_build_agent_uses_spec_settings() -> None:
+    agent = build_agent(DIALOGUE)
+    assert agent.name == "dialogue"
+    assert agent.model == "gpt-5"
+    assert agent.instructions == "Reply to the user."
+    assert agent.model_settings.reasoning is not None
+    assert agent.model_settings.reasoning.effort == "medium"
+    assert agent.output_type is ProposalBatch
+
+
+def test_to_intents_carries_spec_tier_and_params() -> None:
+    intents = to_intents(GAZE, _batch("look_at", Resource.head, '{"target": "alice"}'))
+    assert len(intents) == 1
+    it = intents[0]
+    assert (it.agent, it.kind, it.tier) == ("gaze", "look_at", Tier.reflex)
+    assert it.resources == (Resource.head,)
+    assert it.params == {"target": "alice"}
+    bad = to_intents(GAZE, _batch("look_at", Resource.head, "not json"))
+    assert bad[0].params == {}
+
+
+def test_proposers_run_concurrently_through_coordinator() -> None:
+    outputs = {
+        "gaze": _batch("look_at", Resource.head),
+        "dialogue": _batch("say", Resource.speech),
+    }
+    active = 0
+    peak = 0
+
+    async def fake_run(agent: Agent, run_input: str) -> object:
+        nonlocal active, peak
+        assert agent.name in run_input
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return outputs[agent.name]
+
+    proposers = [OpenAIProposer(s, run=fake_run) for s in (GAZE, DIALOGUE)]
+    coord = Coordinator(arbiter=Arbiter(), bus=Bus())
+    committed = asyncio.run(coord.tick_async(proposers))
+    assert {i.kind for i in committed} == {"look_at", "say"}
+    assert peak == 2
+
+
+def test_per_agent_concurrency_limit() -> None:
+    active = 0
+    peak = 0
+
+    async def fake_run(_agent: Agent, _: str) -> object:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return ProposalBatch(intents=[])
+
+    async def run() -> None:
+        proposer = OpenAIProposer(GAZE, run=fake_run, max_concurrent=2)
+        await asyncio.gather(*(proposer.propose() for _ in range(5)))
+
+    asyncio.run(run())
+    assert peak == 2
+
+
+def test_unexpected_output_proposes_nothing() -> None:
+    async def fake_run(_agent: Agent, _: str) -> object:
+        await asyncio.sleep(0)
+        return "free text"
+
+    proposer = OpenAIProposer(GAZE, run=fake_run)
+    assert asyncio.run(proposer.propose()) == ()
+
+
+def test_runner_builds_limited_proposers() -> None:
+    runner = OpenAIAgentsRunner(
+        specs=(GAZE, DIALOGUE),
+        max_concurrent_per_agent=3,
+        model_calls_per_s=100.0,
+    )
+    proposers = runner.proposers()
+    assert [p.spec.name for p in proposers] == ["gaze", "dialogue"]
+    assert all(p.max_concurrent == 3 for p in proposers)
+
+
+def test_model_call_limiter_takes_a_token_per_call() -> None:
+    bucket = TokenBucket(1000.0, burst=2)
+    hooks = ModelCallLimiter(bucket)
+    agent = build_agent(GAZE)
+
+    async def run() -> None:
+        for _ in range(3):
+            await hooks.on_llm_start(None, agent, None, [])  # type: ignore[arg-type]
+
+    asyncio.run(run())
+    assert bucket.stats.acquired == 3
+    assert bucket.stats.waited == 1
+
+
+def test_streaming_proposer_commits_first_sentence_before_stream_ends() -> None:
+    bus = Bus()
+    commits: list[tuple[str, bool]] = []
+    bus.subscribe(
+        "commit",
+        lambda e: commits.extend((i.params["text"], i.renews) for i in e.payload),
+    )
+    coord = Coordinator(arbiter=Arbiter(), bus=bus)
+    release = asyncio.Event()
+
+    async def prompts() -> AsyncIterator[str]:
+        await asyncio.sleep(0)
+        yield "hello"
+
+    async def fake_stream(agent: Agent, run_input: str) -> AsyncIterator[str]:
+        assert agent.output_type is None
+        assert run_input == "hello"
+        yield "Hi there. "
+        await release.wait()
+        yield "Nice to see you."
+
+    proposer = OpenAIStreamingProposer(GAZE, prompts=prompts, stream_text=fake_stream)
+
+    async def run() -> list[tuple[str, bool]]:
+        pump = asyncio.create_task(coord.pump(proposer))
+        while not len(coord.inbox):
+            await asyncio.sleep(0)
+        coord.tick()
+        early = list(commits)
+        release.set()
+        await pump
+        coord.tick()
+        return early
+
+    early = asyncio.run(run())
+    assert early == [("Hi there.", False)]
+    assert commits == [("Hi there.", False), ("Nice to see you.", True)]
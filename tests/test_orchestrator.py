@@ -1,6 +1,30 @@
 from __future__ import annotations
 
-from resobot_gw.agents.orchestrator import Arbiter, Intent, Resource, Tier
+import itertools
+import pickle  # noqa: S403 - round-trips our own objects
+import random
+from dataclasses import replace
+
+import pytest
+
+from resobot_gw.agents.orchestrator import (
+    _ALLOWED,
+    Arbiter,
+    Arbitration,
+    ConditionalRules,
+    Intent,
+    Lock,
+    LockTable,
+    Preemption,
+    Resource,
+    Tier,
+    resource_mask,
+    resources_compatible,
+    resources_conditional,
+    resources_of,
+    sort_key,
+    walking_grab_rules,
+)
 
 
 def mk_int(
@@ -11,6 +35,7 @@ def mk_int(
     tier: Tier,
     score: float = 1.0,
     hold_ms: int = 50,
+    renews: bool = False,
 ) -> Intent:
     return Intent(
         agent=agent,
@@ -20,6 +45,7 @@ def mk_int(
         score=score,
         hold_ms=hold_ms,
         tier=tier,
+        renews=renews,
     )
 
 
@@ -53,9 +79,352 @@ def test_preempt_lower_tier_lock() -> None:
 def test_locomotion_and_hand_allowed() -> None:
     arb = Arbiter(now_ms_fn=lambda: 1000)
     move = mk_int("nav", "move_to", (Resource.locomotion,), tier=Tier.activity)
+    move = replace(move, params={"speed": 1.0})
     grab = mk_int("mani", "grab", (Resource.hands_l,), tier=Tier.activity)
 
     committed = arb.tick([move, grab])
     kinds = {c.kind for c in committed}
-    # △ in spec treated as allowed in v0
+    # △: both commit, walking at reduced speed (AC-2)
     assert kinds == {"move_to", "grab"}
+    assert next(c for c in committed if c.kind == "move_to").params == {"speed": 0.5}
+
+
+def test_resources_compatible_matches_table() -> None:
+    for a in Resource:
+        for b in Resource:
+            assert resources_compatible((a,), (b,)) is _ALLOWED[a, b]
+    assert resources_compatible((Resource.speech, Resource.head), (Resource.ui,))
+    assert not resources_compatible((Resource.speech, Resource.head), (Resource.ui, Resource.head))
+
+
+def test_intent_masks_precomputed() -> None:
+    both = mk_int("mani", "grab2", (Resource.hands_l, Resource.hands_r), tier=Tier.activity)
+    assert both.mask == resource_mask((Resource.hands_r, Resource.hands_l))
+    assert both.conflicts & both.mask == both.mask
+
+
+def test_conditional_cells_flagged() -> None:
+    assert resources_conditional((Resource.locomotion,), (Resource.hands_r,))
+    assert resources_conditional((Resource.hands_l,), (Resource.locomotion,))
+    assert not resources_conditional((Resource.speech,), (Resource.locomotion,))
+
+
+def test_conflicting_proposals_commit_highest_score() -> None:
+    arb = Arbiter(now_ms_fn=lambda: 1000)
+    low = mk_int("a", "say", (Resource.speech,), tier=Tier.activity, score=0.2)
+    high = mk_int("b", "say", (Resource.speech, Resource.head), tier=Tier.activity, score=0.9)
+    look = mk_int("c", "look_at", (Resource.head,), tier=Tier.activity, score=0.5)
+    wave = mk_int("d", "emote", (Resource.ui,), tier=Tier.activity, score=0.1)
+
+    committed = arb.tick([low, look, wave, high])
+    assert [c.agent for c in committed] == ["b", "d"]
+
+
+def test_lock_table_expires_only_due_locks() -> None:
+    table = LockTable()
+    table.acquire((Resource.speech,), Lock(holder="a", tier=Tier.activity, until_ms=100))
+    table.acquire((Resource.head, Resource.ui), Lock(holder="b", tier=Tier.reflex, until_ms=50))
+    assert table.next_expiry_ms() == 50
+
+    expired = table.expire(50)
+    assert sorted(r for r, _ in expired) == sorted((Resource.head, Resource.ui))
+    assert table.held_mask == resource_mask((Resource.speech,))
+    assert table.next_expiry_ms() == 100
+
+
+def test_lock_table_skips_stale_heap_entries() -> None:
+    table = LockTable()
+    table.acquire((Resource.speech,), Lock(holder="plan", tier=Tier.planner, until_ms=500))
+    # preempted by a shorter lock: the old heap entry must not expire the new one
+    table.acquire((Resource.speech,), Lock(holder="dlg", tier=Tier.reflex, until_ms=100))
+    assert table.next_expiry_ms() == 100
+    assert table.expire(100)[0][1].holder == "dlg"
+    assert table.expire(500) == []
+    assert table.next_expiry_ms() is None
+    assert len(table) == 0
+
+
+def test_arbiter_reports_next_expiry() -> None:
+    now = 1000
+    arb = Arbiter(now_ms_fn=lambda: now)
+    assert arb.next_expiry_ms() is None
+    arb.tick([mk_int("dlg", "say", (Resource.speech,), tier=Tier.reflex, hold_ms=80)])
+    assert arb.next_expiry_ms() == 1080
+
+    now = 1080
+    committed = arb.tick([mk_int("b", "say", (Resource.speech,), tier=Tier.planner)])
+    assert [c.agent for c in committed] == ["b"]
+
+
+def test_submit_urgent_preempts_and_records() -> None:
+    arb = Arbiter(now_ms_fn=lambda: 1000)
+    plan = mk_int("plan", "say", (Resource.speech, Resource.head), tier=Tier.planner, hold_ms=900)
+    assert arb.tick([plan]) == [plan]
+    assert arb.pop_preempted() == []
+
+    gaze = mk_int("gaze", "look_at", (Resource.head,), tier=Tier.reflex)
+    assert arb.submit_urgent(gaze)
+    assert arb.pop_preempted() == [
+        Preemption(holder="plan", tier=Tier.planner, resources=(Resource.head,), by="gaze"),
+    ]
+    assert arb.locks.get(Resource.head).holder == "gaze"
+    assert arb.locks.get(Resource.speech).holder == "plan"
+
+    # same tier cannot preempt
+    other = mk_int("focus", "look_at", (Resource.head,), tier=Tier.reflex)
+    assert not arb.submit_urgent(other)
+    assert arb.pop_preempted() == []
+
+
+def test_preemptions_cover_the_latest_call_only() -> None:
+    now = 1000
+    arb = Arbiter(now_ms_fn=lambda: now)
+    for _ in range(100):  # never drained
+        now += 10
+        arb.tick([mk_int("plan", "say", (Resource.speech,), tier=Tier.planner, hold_ms=900)])
+        arb.submit_urgent(mk_int("dlg", "say", (Resource.speech,), tier=Tier.reflex, hold_ms=1))
+    assert [p.holder for p in arb.pop_preempted()] == ["plan"]
+    arb.tick([])
+    assert arb.pop_preempted() == []
+
+
+def test_renew_extends_own_lock_only() -> None:
+    now = 1000
+    arb = Arbiter(now_ms_fn=lambda: now)
+    first = mk_int("dlg", "say", (Resource.speech,), tier=Tier.reflex, hold_ms=400)
+    assert arb.tick([first]) == [first]
+    follow = mk_int("dlg", "say", (Resource.speech,), tier=Tier.activity, hold_ms=300)
+    assert arb.renew(follow)
+    lock = arb.locks.get(Resource.speech)
+    assert lock is not None
+    # queued behind the first sentence, keeping the original tier
+    assert (lock.until_ms, lock.tier) == (1700, Tier.reflex)
+    assert arb.next_expiry_ms() == 1700
+    other = mk_int("plan", "say", (Resource.speech,), tier=Tier.reflex)
+    assert not arb.renew(other)
+    assert not arb.renew(mk_int("dlg", "look", (Resource.head,), tier=Tier.reflex))
+
+
+def test_tick_renews_follow_ups_even_within_one_tick() -> None:
+    now = 1000
+    arb = Arbiter(now_ms_fn=lambda: now)
+    first = mk_int("dlg", "say", (Resource.speech,), tier=Tier.activity, hold_ms=200)
+    second = mk_int("dlg", "say", (Resource.speech,), tier=Tier.activity, hold_ms=200, renews=True)
+    rival = mk_int("plan", "say", (Resource.speech,), tier=Tier.activity, score=0.5)
+    assert arb.tick([first, second, rival]) == [first, second]
+    third = mk_int("dlg", "say", (Resource.speech,), tier=Tier.activity, hold_ms=200, renews=True)
+    assert arb.tick([third, rival]) == [third]
+    lock = arb.locks.get(Resource.speech)
+    assert lock is not None
+    assert lock.until_ms == 1600
+    # once the lock has lapsed, a follow-up is acquired like any intent
+    now = 2000
+    late = mk_int("dlg", "say", (Resource.speech,), tier=Tier.activity, hold_ms=100, renews=True)
+    assert arb.tick([late]) == [late]
+
+
+def test_sort_key_matches_tier_then_descending_score() -> None:
+    rng = random.Random(5)
+    scores = [0.0, -0.0, 1.0, -1.0, 1e-300, -1e-300, 1e300, float("inf"), float("-inf")]
+    scores += [rng.uniform(-5, 5) for _ in range(200)]
+    pairs = [(t, s) for t in Tier for s in scores]
+    rng.shuffle(pairs)
+    by_tuple = sorted(pairs, key=lambda p: (p[0], -p[1]))
+    by_key = sorted(pairs, key=lambda p: sort_key(*p))
+    assert [(t, s + 0.0) for t, s in by_key] == [(t, s + 0.0) for t, s in by_tuple]
+    assert sort_key(Tier.reflex, 0.0) == sort_key(Tier.reflex, -0.0)
+
+
+def test_intent_is_slotted_interned_and_picklable() -> None:
+    kind = b"look_at".decode()  # a fresh, non-interned string
+    a = mk_int("a", kind, (Resource.head,), tier=Tier.reflex)
+    assert not hasattr(a, "__dict__")
+    assert a.kind is "look_at"  # noqa: F632 - identity is the point
+    assert a.order == sort_key(a.tier, a.score)
+    b = pickle.loads(pickle.dumps(a))  # noqa: S301
+    assert b == a
+    assert b.mask == a.mask
+    assert resources_of(a.mask) is resources_of(a.mask)
+
+
+def test_optimal_packs_two_intents_over_one_wide_one() -> None:
+    wide = mk_int("a", "wave", (Resource.speech, Resource.head), tier=Tier.activity, score=0.9)
+    say = mk_int("b", "say", (Resource.speech,), tier=Tier.activity, score=0.6)
+    look = mk_int("c", "look_at", (Resource.head,), tier=Tier.activity, score=0.6)
+    free = mk_int("d", "note", (), tier=Tier.activity, score=0.0)
+    assert Arbiter(now_ms_fn=lambda: 0).tick([wide, say, look, free]) == [wide, free]
+    optimal = Arbiter(now_ms_fn=lambda: 0, strategy=Arbitration.optimal)
+    assert sorted(optimal.tick([wide, say, look, free]), key=lambda i: i.agent) == [say, look, free]
+
+
+def test_optimal_keeps_tier_priority() -> None:
+    reflex = mk_int("r", "say", (Resource.speech,), tier=Tier.reflex, score=0.1)
+    wide = mk_int("a", "wave", (Resource.speech, Resource.head), tier=Tier.activity, score=5.0)
+    look = mk_int("c", "look_at", (Resource.head,), tier=Tier.activity, score=0.6)
+    arb = Arbiter(now_ms_fn=lambda: 0, strategy=Arbitration.optimal)
+    assert arb.tick([wide, look, reflex]) == [reflex, look]
+
+
+def test_optimal_falls_back_to_greedy_past_budget() -> None:
+    wide = mk_int("a", "wave", (Resource.speech, Resource.head), tier=Tier.activity, score=0.9)
+    say = mk_int("b", "say", (Resource.speech,), tier=Tier.activity, score=0.6)
+    look = mk_int("c", "look_at", (Resource.head,), tier=Tier.activity, score=0.6)
+    arb = Arbiter(now_ms_fn=lambda: 0, strategy=Arbitration.optimal, search_budget_us=-1)
+    assert arb.tick([wide, say, look]) == [wide]
+    assert arb.search_fallbacks == 1
+
+
+def test_optimal_matches_exhaustive_search() -> None:
+    rng = random.Random(11)
+    resources = list(Resource)
+    for _ in range(50):
+        intents = [
+            mk_int(
+                f"a{i}",
+                "act",
+                tuple(rng.sample(resources, rng.randint(1, 3))),
+                tier=Tier.activity,
+                score=round(rng.random(), 3),
+            )
+            for i in range(8)
+        ]
+        best = max(
+            sum(i.score for i in combo)
+            for n in range(len(intents) + 1)
+            for combo in itertools.combinations(intents, n)
+            if all(
+                resources_compatible(a.resources, b.resources)
+                for a, b in itertools.combinations(combo, 2)
+            )
+        )
+        arb = Arbiter(now_ms_fn=lambda: 0, strategy=Arbitration.optimal, search_budget_us=10**6)
+        got = arb.tick(intents)
+        assert sum(i.score for i in got) == pytest.approx(best)
+        greedy = Arbiter(now_ms_fn=lambda: 0).tick(intents)
+        assert sum(i.score for i in got) >= sum(i.score for i in greedy) - 1e-9
+
+
+@pytest.mark.parametrize("strategy", list(Arbitration))
+def test_grab_while_walking_clamps_speed_in_either_order(strategy: Arbitration) -> None:
+    grab = mk_int("mani", "grab", (Resource.hands_r,), tier=Tier.activity, score=0.9)
+    move = Intent("nav", "move_to", {"speed": 1.2}, (Resource.locomotion,), 0.5, 50, Tier.activity)
+    for batch in ([grab, move], [move, grab]):
+        committed = Arbiter(now_ms_fn=lambda: 0, strategy=strategy).tick(batch)
+        by_kind = {c.kind: c for c in committed}
+        assert by_kind["move_to"].params == {"speed": 0.5}
+        assert by_kind["grab"] is grab
+
+
+def test_grab_against_held_walk_republishes_clamped_walk() -> None:
+    arb = Arbiter(now_ms_fn=lambda: 0)
+    move = Intent("nav", "move_to", {"speed": 0.3}, (Resource.locomotion,), 1, 500, Tier.activity)
+    fast = Intent("nav", "move_to", {"speed": 2}, (Resource.locomotion,), 1, 500, Tier.activity)
+    assert arb.tick([move]) == [move]
+    grab = mk_int("mani", "grab", (Resource.hands_l,), tier=Tier.activity)
+    assert arb.tick([grab]) == [grab]  # already slow enough: nothing to re-publish
+
+    arb = Arbiter(now_ms_fn=lambda: 0)
+    arb.tick([fast])
+    committed = arb.tick([grab])
+    by_kind = {c.kind: c for c in committed}
+    assert sorted(by_kind) == ["grab", "move_to"]
+    assert by_kind["move_to"].params == {"speed": 0.5}
+    lock = arb.locks.get(Resource.locomotion)
+    assert lock is not None
+    assert lock.intent is by_kind["move_to"]
+
+
+@pytest.mark.parametrize("strategy", list(Arbitration))
+def test_renewed_walk_is_clamped_and_updates_its_lock(strategy: Arbitration) -> None:
+    now = 0
+    arb = Arbiter(now_ms_fn=lambda: now, strategy=strategy)
+    move = Intent("nav", "move_to", {"speed": 0.3}, (Resource.locomotion,), 1, 500, Tier.activity)
+    grab = mk_int("mani", "grab", (Resource.hands_l,), tier=Tier.activity, hold_ms=900)
+    assert arb.tick([move, grab]) == [move, grab]
+
+    now = 100
+    fast = replace(move, params={"speed": 2.0}, renews=True)
+    (renewed,) = arb.tick([fast])
+    assert renewed.params == {"speed": 0.5}
+    lock = arb.locks.get(Resource.locomotion)
+    assert lock is not None
+    assert (lock.intent, lock.until_ms) == (renewed, 1000)
+
+
+def test_urgent_intents_meet_the_rules() -> None:
+    arb = Arbiter(now_ms_fn=lambda: 0)
+    arb.tick([mk_int("mani", "grab", (Resource.hands_r,), tier=Tier.activity, hold_ms=900)])
+    move = Intent("nav", "move_to", {"speed": 2.0}, (Resource.locomotion,), 1, 500, Tier.reflex)
+    assert arb.submit_urgent(move)
+    lock = arb.locks.get(Resource.locomotion)
+    assert lock is not None
+    assert lock.intent is not None
+    assert lock.intent.params == {"speed": 0.5}
+
+    rules = ConditionalRules({(Resource.locomotion, Resource.hands_r): lambda _a, _b: None})
+    arb = Arbiter(now_ms_fn=lambda: 0, rules=rules)
+    arb.tick([mk_int("mani", "grab", (Resource.hands_r,), tier=Tier.activity, hold_ms=900)])
+    assert not arb.submit_urgent(move)
+
+
+def test_clamped_walk_is_published_once_across_ticks() -> None:
+    now = 0
+    arb = Arbiter(now_ms_fn=lambda: now)
+    walk = Intent("nav", "move_to", {"speed": 1.0}, (Resource.locomotion,), 1, 5000, Tier.activity)
+    grab_l = mk_int("mani", "grab", (Resource.hands_l,), tier=Tier.activity, hold_ms=100)
+    first = arb.tick([walk, grab_l])
+    assert [(c.kind, c.params) for c in first] == [("move_to", {"speed": 0.5}), ("grab", {})]
+    lock = arb.locks.get(Resource.locomotion)
+    assert lock is not None
+    assert lock.intent is first[0]
+
+    # the held walk is already slow enough: later commits beside it stay alone
+    now = 200
+    grab_r = mk_int("mani2", "grab", (Resource.hands_r,), tier=Tier.activity, hold_ms=100)
+    assert arb.tick([grab_r]) == [grab_r]
+    now = 400
+    urgent = mk_int("mani3", "grab", (Resource.hands_l,), tier=Tier.reflex)
+    assert arb.tick([urgent]) == [urgent]
+    now = 600
+    assert arb.submit_urgent(mk_int("mani4", "grab", (Resource.hands_r,), tier=Tier.reflex))
+    assert lock.intent is first[0]
+
+
+def test_walk_without_speed_is_not_rewritten() -> None:
+    arb = Arbiter(now_ms_fn=lambda: 0)
+    walk = mk_int("nav", "move_to", (Resource.locomotion,), tier=Tier.activity, hold_ms=900)
+    grab = mk_int("mani", "grab", (Resource.hands_l,), tier=Tier.activity)
+    assert arb.tick([walk, grab]) == [walk, grab]
+    other = mk_int("mani2", "grab", (Resource.hands_r,), tier=Tier.activity)
+    assert arb.tick([other]) == [other]
+
+
+def test_conditional_rule_can_veto() -> None:
+    rules = ConditionalRules({(Resource.hands_l, Resource.locomotion): lambda _a, _b: None})
+    arb = Arbiter(now_ms_fn=lambda: 0, rules=rules)
+    move = mk_int("nav", "move_to", (Resource.locomotion,), tier=Tier.activity, score=0.9)
+    grab_l = mk_int("mani", "grab", (Resource.hands_l,), tier=Tier.activity, score=0.5)
+    grab_r = mk_int("mani2", "grab", (Resource.hands_r,), tier=Tier.activity, score=0.4)
+    # only (hands_l, locomotion) has a rule, and only in that order
+    assert arb.tick([move, grab_l, grab_r]) == [move, grab_r]
+
+
+def test_conditional_rules_validation_and_lookup() -> None:
+    with pytest.raises(ValueError, match="not a conditional"):
+        ConditionalRules({(Resource.speech, Resource.head): lambda a, b: (a, b)})
+    assert not ConditionalRules()
+    rules = walking_grab_rules()
+    for a, b in itertools.product(Resource, repeat=2):
+        assert (rules.rule(a, b) is not None) == resources_conditional((a,), (b,))
+    hands = resource_mask((Resource.hands_l, Resource.hands_r))
+    assert rules.partners[hands] == resource_mask((Resource.locomotion,))
+
+    def grow(a: Intent, b: Intent) -> tuple[Intent, Intent]:
+        return Intent(a.agent, a.kind, {}, (*a.resources, Resource.ui), 1, 50, a.tier), b
+
+    rules = ConditionalRules({(Resource.hands_l, Resource.locomotion): grow})
+    arb = Arbiter(now_ms_fn=lambda: 0, rules=rules)
+    move = mk_int("nav", "move_to", (Resource.locomotion,), tier=Tier.activity)
+    grab = mk_int("mani", "grab", (Resource.hands_l,), tier=Tier.activity)
+    with pytest.raises(ValueError, match="not resources"):
+        arb.tick([move, grab])
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from resobot_gw.ratelimit import TokenBucket
+
+
+def test_burst_then_rate_limited() -> None:
+    async def run() -> tuple[float, TokenBucket]:
+        bucket = TokenBucket(50.0, burst=3)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for _ in range(5):
+            await bucket.acquire()
+        return loop.time() - start, bucket
+
+    elapsed, bucket = asyncio.run(run())
+    # 3 immediate, then 2 more at 50/s
+    assert elapsed >= 0.035
+    assert bucket.stats.acquired == 5
+    assert bucket.stats.waited == 2
+
+
+def test_try_acquire_uses_injected_clock() -> None:
+    now = [0.0]
+    bucket = TokenBucket(2.0, burst=1, clock=lambda: now[0])
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+    now[0] = 0.5
+    assert bucket.try_acquire()
+
+
+def test_invalid_parameters() -> None:
+    with pytest.raises(ValueError, match="rate_per_s"):
+        TokenBucket(0)
+    with pytest.raises(ValueError, match="burst"):
+        TokenBucket(1.0, burst=0)
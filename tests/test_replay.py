@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import io
+import json
+from dataclasses import replace
+
+import pytest
+
+from resobot_gw.__main__ import main
+from resobot_gw.agents.coordinator import Coordinator, Proposer
+from resobot_gw.agents.multibot import ArbiterConfig
+from resobot_gw.agents.orchestrator import (
+    Arbiter,
+    Arbitration,
+    ConditionalRules,
+    Intent,
+    Resource,
+    Tier,
+)
+from resobot_gw.bus import Bus
+from resobot_gw.loadgen import ManualClock, WorkloadSpec, generate
+from resobot_gw.replay import (
+    LogFormatError,
+    LogWriter,
+    RecordedTick,
+    commit_indices,
+    read_log,
+    replay,
+)
+
+
+class _Script(Proposer):
+    def __init__(self, intents: list[Intent]) -> None:
+        self.intents = intents
+
+    def propose(self) -> list[Intent]:
+        return self.intents
+
+
+def _fast(intent: Intent) -> Intent:
+    # walks need a speed for the default rules to clamp (and re-publish) them
+    if Resource.locomotion not in intent.resources:
+        return intent
+    return replace(intent, params={"speed": 1.0})
+
+
+def _record(
+    ticks: int = 60,
+    config: ArbiterConfig | None = None,
+) -> tuple[bytes, list[list[Intent]]]:
+    workload = generate(WorkloadSpec(seed=3, proposers=12, ticks=ticks, tick_ms=40))
+    clock = ManualClock(10_000)
+    buf = io.BytesIO()
+    arbiter = (config or ArbiterConfig()).build(clock)
+    coord = Coordinator(arbiter=arbiter, bus=Bus(), recorder=LogWriter(buf))
+    commits = []
+    for i in range(ticks):
+        clock.advance(40)
+        commits.append(coord.tick([_Script([_fast(x) for x in workload.tick(i)])]))
+    return buf.getvalue(), commits
+
+
+def test_log_round_trips_proposals_clock_and_commits() -> None:
+    data, commits = _record()
+    ticks = list(read_log(data))
+    assert len(ticks) == 60
+    assert [t.now_ms for t in ticks[:2]] == [10_040, 10_080]
+    assert [t.committed for t in ticks] == [
+        commit_indices(t.proposals, c) for t, c in zip(ticks, commits, strict=True)
+    ]
+    assert sum(map(len, commits)) > sum(len(t.committed) for t in ticks)  # △ re-publishes
+    first = ticks[0].proposals[0]
+    assert first.created_ms > 0
+    assert first.resources  # order preserved for equality
+
+
+def test_params_and_renewals_survive() -> None:
+    buf = io.BytesIO()
+    say = Intent(
+        agent="dlg",
+        kind="say",
+        params={"text": "hi", "to": ["a"]},
+        resources=(Resource.speech, Resource.head),
+        score=0.5,
+        hold_ms=300,
+        tier=Tier.reflex,
+        renews=True,
+    )
+    LogWriter(buf).record_tick(5, [say], [say])
+    (tick,) = read_log(buf.getvalue())
+    assert tick == RecordedTick(5, (say,), (0,))
+    (back,) = tick.proposals
+    assert (back.params, back.renews, back.created_ms) == (say.params, True, say.created_ms)
+
+
+def test_replay_matches_recording() -> None:
+    data, commits = _record()
+    result = replay(read_log(data))
+    assert result.matches
+    assert result.ticks == 60
+    assert result.commits == sum(map(len, commits))
+    out = result.to_json()
+    assert out["mismatches"] == 0
+    assert out["ticks_per_s"] > 0
+
+
+def _veto(_a: Intent, _b: Intent) -> None:
+    return None
+
+
+def test_replay_uses_the_recording_arbiter_settings() -> None:
+    pairs = ((Resource.hands_l, Resource.locomotion), (Resource.locomotion, Resource.hands_l))
+    config = ArbiterConfig(Arbitration.optimal, rules=ConditionalRules(dict.fromkeys(pairs, _veto)))
+    data, _ = _record(config=config)
+    assert not replay(read_log(data)).matches
+    assert replay(read_log(data), config=config).matches
+
+
+def test_urgent_intents_are_recorded_and_replay() -> None:
+    clock = ManualClock(10_000)
+    buf = io.BytesIO()
+    coord = Coordinator(arbiter=Arbiter(now_ms_fn=clock), bus=Bus(), recorder=LogWriter(buf))
+    plan = Intent("plan", "say", {}, (Resource.speech,), 1.0, 500, Tier.planner)
+    coord.tick([_Script([plan])])
+    clock.advance(5)
+    dlg = Intent("dlg", "say", {}, (Resource.speech,), 1.0, 100, Tier.reflex)
+    assert coord.submit_urgent(dlg)
+    assert not coord.submit_urgent(replace(dlg, agent="gaze"))
+
+    ticks = list(read_log(buf.getvalue()))
+    assert [(t.now_ms, t.proposals, t.committed) for t in ticks[1:]] == [
+        (10_005, (dlg,), (0,)),
+        (10_005, (replace(dlg, agent="gaze"),), ()),
+    ]
+    result = replay(ticks)
+    assert result.matches
+    assert result.ticks == 3
+
+
+def test_replay_flags_diverging_ticks() -> None:
+    data, _ = _record(10)
+    ticks = list(read_log(data))
+    i = next(i for i, t in enumerate(ticks) if t.committed)
+    ticks[i] = RecordedTick(ticks[i].now_ms, ticks[i].proposals, ())
+    assert replay(ticks).mismatched_ticks == [i]
+
+
+def test_realtime_replay_sleeps_by_recorded_spacing() -> None:
+    data, _ = _record(5)
+    slept: list[float] = []
+    replay(read_log(data), realtime=True, sleep=slept.append)
+    assert slept
+    assert max(slept) <= 0.161
+
+
+def test_truncated_and_foreign_logs() -> None:
+    data, _ = _record(10)
+    assert len(list(read_log(data[:-3]))) == 9
+    with pytest.raises(LogFormatError):
+        list(read_log(b"not a log"))
+
+
+def test_replay_cli(tmp_path, capsys) -> None:
+    data, _ = _record(20)
+    log = tmp_path / "ticks.rblog"
+    log.write_bytes(data)
+    assert main(["replay", str(log)]) == 0
+    out = json.loads(capsys.readouterr().out)
+    assert (out["ticks"], out["mismatches"]) == (20, 0)
+    (tmp_path / "junk").write_bytes(b"junk")
+    assert main(["replay", str(tmp_path / "junk")]) == 2
+    data, _ = _record(20, ArbiterConfig(Arbitration.optimal))
+    log.write_bytes(data)
+    assert main(["replay", str(log), "--strategy", "optimal"]) == 0
+
+
+def test_commit_indices_match_rewritten_params() -> None:
+    def mk(agent: str, kind: str, res: Resource, params: dict[str, object]) -> Intent:
+        return Intent(agent, kind, params, (res,), 0.5, 100, Tier.activity, created_ms=1.0)
+
+    a = mk("a", "walk", Resource.locomotion, {})
+    b = mk("b", "grab", Resource.hands_l, {})
+    clamped = mk("a", "walk", Resource.locomotion, {"speed": 0.5})
+    stale = mk("c", "walk", Resource.locomotion, {})
+    assert commit_indices([a, b], [b, clamped, stale]) == (1, 0)
@@ -1,9 +1,138 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+from resobot_gw.agents.coordinator import Coordinator, TickRecorder
+from resobot_gw.agents.interface import AgentRunner
+from resobot_gw.agents.orchestrator import Arbiter, Intent, Resource, Tier
+from resobot_gw.bus import AsyncBus, Bus, Event, Publisher
 from resobot_gw.runtime import GatewayRuntime
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
 
 def test_runtime_dry_run() -> None:
     runtime = GatewayRuntime()
     code = runtime.start(dry_run=True)
     assert code == 0
+
+
+def test_recording_without_a_coordinator_is_rejected(tmp_path: Path) -> None:
+    log = tmp_path / "ticks.rblog"
+    assert GatewayRuntime(record_path=log).start(dry_run=True) == 2
+    assert not log.exists()
+
+
+def test_wakeups_need_a_subscribable_bus(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+
+    class Sink(Publisher):
+        def publish(self, event: Event) -> None:
+            pass
+
+    runtime = GatewayRuntime(coordinator=Coordinator(arbiter=Arbiter(), bus=Sink()))
+    assert runtime.start(dry_run=True) == 3
+
+
+class _Ticks(TickRecorder):
+    def __init__(self) -> None:
+        self.ticks: list[tuple[int, int, int]] = []
+
+    def record_tick(
+        self,
+        now_ms: int,
+        proposals: Sequence[Intent],
+        committed: Sequence[Intent],
+    ) -> None:
+        self.ticks.append((now_ms, len(proposals), len(committed)))
+
+
+def test_world_events_wake_the_scheduler(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    bus = Bus()
+    ticks = _Ticks()
+    coord = Coordinator(arbiter=Arbiter(), bus=bus, recorder=ticks)
+    runtime = GatewayRuntime(coordinator=coord, tick_hz=1000.0)
+    seen: list[int] = []
+
+    class Poke(AgentRunner):
+        def __init__(self, main: asyncio.Task[int]) -> None:
+            self.main = main
+
+        async def run(self) -> None:
+            await asyncio.sleep(0.05)
+            seen.append(len(ticks.ticks))  # idle after the first tick
+            bus.publish(Event("world.person.entered", "alice"))
+            await asyncio.sleep(0.02)
+            seen.append(len(ticks.ticks))
+            self.main.cancel()
+
+    async def main() -> int:
+        task: asyncio.Task[int] = asyncio.current_task()  # type: ignore[assignment]
+        return await runtime.run(runner=Poke(task))
+
+    assert asyncio.run(main()) == 0
+    assert seen == [1, 2]
+
+
+def test_runtime_tracks_commit_latency(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    bus = Bus()
+    coord = Coordinator(arbiter=Arbiter(), bus=bus)
+    runtime = GatewayRuntime(coordinator=coord, tick_hz=1000.0)
+    look = Intent("GazeReflex", "look_at", {}, (Resource.head,), 1.0, 100, Tier.reflex)
+
+    class Submit(AgentRunner):
+        def __init__(self, main: asyncio.Task[int]) -> None:
+            self.main = main
+
+        async def run(self) -> None:
+            await asyncio.sleep(0.02)
+            coord.submit(look)
+            await asyncio.sleep(0.02)
+            self.main.cancel()
+
+    async def main() -> int:
+        task: asyncio.Task[int] = asyncio.current_task()  # type: ignore[assignment]
+        return await runtime.run(runner=Submit(task))
+
+    assert asyncio.run(main()) == 0
+    tracker = runtime.latency
+    assert tracker is not None
+    (summary,) = tracker.summaries()
+    assert (summary.agent, summary.count) == ("GazeReflex", 1)
+    bus.publish(Event("commit", [look]))  # unbound once the run ends
+    assert tracker.summaries()[0].count == 1
+
+
+def test_async_bus_events_wake_the_scheduler(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    ticks = _Ticks()
+    seen: list[int] = []
+
+    async def main() -> int:
+        task: asyncio.Task[int] = asyncio.current_task()  # type: ignore[assignment]
+        async with AsyncBus() as bus:
+            coord = Coordinator(arbiter=Arbiter(), bus=bus, recorder=ticks)
+            runtime = GatewayRuntime(coordinator=coord, tick_hz=1000.0)
+
+            class Poke(AgentRunner):
+                async def run(self) -> None:
+                    await asyncio.sleep(0.05)
+                    seen.append(len(ticks.ticks))
+                    bus.publish(Event("world.person.entered", "alice"))
+                    await asyncio.sleep(0.02)
+                    seen.append(len(ticks.ticks))
+                    task.cancel()
+
+            code = await runtime.run(runner=Poke())
+            assert not bus.stats()  # unsubscribed at shutdown
+            return code
+
+    assert asyncio.run(main()) == 0
+    assert seen == [1, 2]
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import asyncio
+
+from resobot_gw.agents.coordinator import AgentSpec, AsyncProposer, Coordinator, ReasoningEffort
+from resobot_gw.agents.orchestrator import Arbiter, Intent, Resource, Tier
+from resobot_gw.bus import Bus
+from resobot_gw.scheduler import TickScheduler
+
+
+def test_busy_ticks_follow_target_rate() -> None:
+    async def run() -> TickScheduler:
+        sched: TickScheduler
+
+        async def tick() -> bool:
+            await asyncio.sleep(0)
+            if sched.metrics.ticks >= 9:
+                sched.stop()
+            return True
+
+        sched = TickScheduler(tick, rate_hz=100.0)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await sched.run()
+        # 10 ticks on a 10 ms grid: ~90 ms between first and last
+        assert 0.08 <= loop.time() - start < 0.5
+        return sched
+
+    sched = asyncio.run(run())
+    assert sched.metrics.ticks == 10
+    assert sched.metrics.idle_waits == 0
+
+
+def test_idle_scheduler_sleeps_until_woken() -> None:
+    async def run() -> TickScheduler:
+        async def tick() -> bool:
+            await asyncio.sleep(0)
+            return False
+
+        sched = TickScheduler(tick, rate_hz=1000.0)
+        task = asyncio.create_task(sched.run())
+        await asyncio.sleep(0.05)
+        assert sched.metrics.ticks == 1  # idle: no polling
+        sched.wake()
+        await asyncio.sleep(0.01)
+        assert sched.metrics.ticks == 2
+        sched.stop()
+        await task
+        return sched
+
+    sched = asyncio.run(run())
+    assert sched.metrics.wakeups >= 1
+
+
+def test_coordinator_scheduler_wakes_at_lock_expiry() -> None:
+    arb = Arbiter()
+    coord = Coordinator(arbiter=arb, bus=Bus())
+    arb.tick(
+        [
+            Intent(
+                agent="plan",
+                kind="say",
+                params={},
+                resources=(Resource.speech,),
+                score=1.0,
+                hold_ms=30,
+                tier=Tier.planner,
+            ),
+        ],
+    )
+
+    async def run() -> TickScheduler:
+        sched = TickScheduler.for_coordinator(coord, [], rate_hz=1000.0, idle_poll_s=None)
+        task = asyncio.create_task(sched.run())
+        await asyncio.sleep(0.01)
+        assert sched.metrics.ticks == 1
+        await asyncio.sleep(0.06)  # idle wait ends at the lock expiry (~30 ms)
+        sched.stop()
+        await task
+        return sched
+
+    sched = asyncio.run(run())
+    # one tick at start, one when the lock expired, then idle with nothing held
+    assert sched.metrics.ticks == 2
+
+
+def test_blocked_proposals_keep_the_scheduler_busy() -> None:
+    arb = Arbiter()
+    coord = Coordinator(arbiter=arb, bus=Bus())
+    arb.tick([Intent("dlg", "say", {}, (Resource.speech,), 1.0, 10_000, Tier.activity)])
+
+    class Waiting(AsyncProposer):
+        async def propose(self) -> tuple[Intent, ...]:
+            return (Intent("plan", "say", {}, (Resource.speech,), 1.0, 100, Tier.activity),)
+
+    spec = AgentSpec("plan", "gpt", "", ReasoningEffort.low)
+
+    async def run() -> TickScheduler:
+        sched = TickScheduler.for_coordinator(
+            coord,
+            [Waiting(spec)],
+            rate_hz=1000.0,
+            idle_poll_s=None,
+        )
+        task = asyncio.create_task(sched.run())
+        await asyncio.sleep(0.05)
+        sched.stop()
+        await task
+        return sched
+
+    sched = asyncio.run(run())
+    # nothing commits, but proposals arrive every tick: no idle waits
+    assert sched.metrics.ticks > 5
+    assert sched.metrics.idle_waits == 0
+
+
+def test_stopped_scheduler_restores_the_submit_hook() -> None:
+    coord = Coordinator(arbiter=Arbiter(), bus=Bus())
+    calls: list[int] = []
+    coord.inbox.on_submit = lambda: calls.append(1)
+    previous = coord.inbox.on_submit
+
+    async def run() -> None:
+        sched = TickScheduler.for_coordinator(coord, [], rate_hz=1000.0)
+        assert coord.inbox.on_submit is not previous
+        task = asyncio.create_task(sched.run())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(run())
+    assert coord.inbox.on_submit is previous
+    # the loop is closed; submitting must not try to wake it
+    coord.submit(Intent("dlg", "say", {}, (Resource.speech,), 1.0, 100, Tier.reflex))
+    assert calls == [1]
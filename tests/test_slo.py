@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from resobot_gw.agents.coordinator import Coordinator
+from resobot_gw.agents.orchestrator import Arbiter, Intent, Resource, Tier
+from resobot_gw.bus import Bus, Event
+from resobot_gw.slo import ActionDone, LatencyTracker, LatencyWindow, SloBreach, Stage
+
+
+def _look(agent: str = "GazeReflex", created_ms: float = 0.0) -> Intent:
+    return Intent(
+        agent=agent,
+        kind="look_at",
+        params={},
+        resources=(Resource.head,),
+        score=1.0,
+        hold_ms=100,
+        tier=Tier.reflex,
+        created_ms=created_ms,
+    )
+
+
+def test_intents_and_events_are_timestamped() -> None:
+    a, b = _look(created_ms=1.0), _look(created_ms=2.0)
+    assert a == b  # the stamp is not part of identity
+    assert "created_ms" not in repr(a)
+    assert Event("x", None).ts_ms <= Event("y", None).ts_ms
+    assert _look().created_ms == 0.0
+
+
+def test_window_quantiles_and_trim() -> None:
+    w = LatencyWindow(window_ms=1000, max_samples=100)
+    for i in range(1, 101):
+        w.add(float(i), float(i))
+    assert w.quantiles(0.5, 0.95, 0.99) == (50.0, 95.0, 99.0)
+    w.trim(1050.0)
+    assert len(w) == 51
+    assert LatencyWindow(1000, 10).quantiles(0.5) == (0.0,)
+
+
+def test_breach_and_recovery_are_edge_triggered() -> None:
+    bus = Bus()
+    events: list[Event] = []
+    bus.subscribe("slo.#", events.append)
+    now = [0.0]
+    tracker = LatencyTracker(bus, {"GazeReflex": 150}, min_samples=5, clock=lambda: now[0])
+
+    for _ in range(5):
+        tracker.observe("GazeReflex", Stage.commit, 100)
+    tracker.check()
+    assert not events
+    for _ in range(5):
+        tracker.observe("GazeReflex", Stage.commit, 400)
+    assert not events  # checked at most once per check_interval_ms
+    tracker.check()
+    assert [e.topic for e in events] == ["slo.breach"]
+    breach = events[0].payload
+    assert isinstance(breach, SloBreach)
+    assert (breach.agent, breach.stage, breach.p95_ms, breach.target_ms) == (
+        "GazeReflex",
+        Stage.commit,
+        400,
+        150,
+    )
+    assert tracker.breached == {("GazeReflex", Stage.commit)}
+
+    # old samples age out of the window; fast ones bring P95 back under target
+    now[0] = 120_000.0
+    for _ in range(5):
+        tracker.observe("GazeReflex", Stage.commit, 90)
+    tracker.check()
+    assert [e.topic for e in events] == ["slo.breach", "slo.recovered"]
+    assert not tracker.breached
+
+    tracker.observe("Planner", Stage.commit, 5000)  # no target, never breaches
+    tracker.check()
+    assert len(events) == 2
+
+
+def test_observe_checks_once_the_interval_passes() -> None:
+    bus = Bus()
+    events: list[Event] = []
+    bus.subscribe("slo.breach", events.append)
+    now = [0.0]
+    tracker = LatencyTracker(bus, {"GazeReflex": 150}, min_samples=3, clock=lambda: now[0])
+    for _ in range(3):
+        tracker.observe("GazeReflex", Stage.commit, 400)
+    assert not events
+    now[0] = tracker.check_interval_ms
+    tracker.observe("GazeReflex", Stage.commit, 400)
+    assert len(events) == 1
+
+
+def test_tracker_measures_commit_and_done_from_the_bus() -> None:
+    bus = Bus()
+    tracker = LatencyTracker(bus)
+    tracker.bind(bus)
+    now = [1000.0]
+    coord = Coordinator(arbiter=Arbiter(now_ms_fn=lambda: int(now[0])), bus=bus)
+
+    intent = _look(created_ms=900.0)
+    coord.submit(intent)
+    committed = coord.tick()
+    assert committed == [intent]
+    bus.publish(Event("action.done", ActionDone(intent), ts_ms=1100.0))
+    bus.publish(Event("action.done", "not an ActionDone"))
+
+    by_stage = {s.stage: s for s in tracker.summaries()}
+    assert by_stage[Stage.commit].count == 1
+    assert by_stage[Stage.commit].p50_ms >= 100.0
+    assert by_stage[Stage.done].p99_ms == 200.0
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+
+from resobot_gw.agents.orchestrator import Resource, Tier
+from resobot_gw.agents.speech import SayOptions, SentenceSplitter, say_intents
+
+
+def test_splitter_waits_for_sentence_boundaries() -> None:
+    sp = SentenceSplitter()
+    assert sp.feed("Hello there") == []
+    assert sp.feed(". It costs 3.5 coins") == ["Hello there."]
+    assert sp.feed("!") == []  # could still be "!?" or a closing quote
+    assert sp.feed(" Bye") == ["It costs 3.5 coins!"]
+    assert sp.feed(". こんにちは。元気") == ["Bye.", "こんにちは。"]
+    assert sp.flush() == "元気"
+    assert sp.flush() is None
+
+
+def test_say_intents_first_fresh_then_renewals() -> None:
+    async def chunks() -> AsyncIterator[str]:
+        for c in ("Hi ", "there. How", " are you? Fine"):
+            await asyncio.sleep(0)
+            yield c
+
+    async def run() -> list:
+        opts = SayOptions(tier=Tier.reflex, ms_per_char=10, min_hold_ms=50)
+        return [i async for i in say_intents("dlg", chunks(), opts)]
+
+    intents = asyncio.run(run())
+    assert [i.params["text"] for i in intents] == ["Hi there.", "How are you?", "Fine"]
+    assert [i.renews for i in intents] == [False, True, True]
+    assert all(i.resources == (Resource.speech,) and i.tier is Tier.reflex for i in intents)
+    assert [i.hold_ms for i in intents] == [90, 120, 50]
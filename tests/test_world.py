@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import pytest
+
+from resobot_gw.bus import Bus, Event
+from resobot_gw.world import WorldState, WorldUpdate
+
+
+def test_snapshots_are_immutable_and_versioned() -> None:
+    world = WorldState(buckets=4)
+    v1 = world.apply(WorldUpdate({"user.alice.pos": (0, 0), "user.bob.pos": (1, 0)}))
+    snap1 = world.snapshot
+    v2 = world.apply(WorldUpdate({"user.alice.pos": (2, 0)}, removed=("user.bob.pos",)))
+    assert (v1, v2) == (1, 2)
+    assert dict(snap1) == {"user.alice.pos": (0, 0), "user.bob.pos": (1, 0)}
+    assert dict(world.snapshot) == {"user.alice.pos": (2, 0)}
+    assert len(world.snapshot) == 1
+    assert "user.bob.pos" not in world.snapshot
+    assert world.at(1) is snap1
+    # unchanged values do not create a version
+    assert world.apply(WorldUpdate({"user.alice.pos": (2, 0)}, removed=("nobody",))) == 2
+
+
+def test_updates_share_untouched_buckets() -> None:
+    world = WorldState(buckets=64)
+    world.apply(WorldUpdate({f"k{i}": i for i in range(1000)}))
+    before = world.snapshot
+    world.apply(WorldUpdate({"k1": -1}))
+    after = world.snapshot
+    pairs = zip(before._buckets, after._buckets, strict=True)  # noqa: SLF001
+    assert sum(a is b for a, b in pairs) == 63
+    assert (before["k1"], after["k1"]) == (1, -1)
+
+
+def test_diff_since_reports_changes_and_removals() -> None:
+    world = WorldState()
+    world.apply(WorldUpdate({"a": 1, "b": 2}))
+    world.apply(WorldUpdate({"a": 3}))
+    world.apply(WorldUpdate(removed=("b",)))
+    diff = world.diff_since(1)
+    assert diff is not None
+    assert (diff.since, diff.version) == (1, 3)
+    assert dict(diff.changed) == {"a": 3}
+    assert diff.removed == frozenset({"b"})
+    empty = world.diff_since(3)
+    assert empty is not None
+    assert not empty
+    with pytest.raises(ValueError, match="future"):
+        world.diff_since(4)
+
+
+def test_old_versions_are_compacted() -> None:
+    world = WorldState(max_versions=3)
+    for i in range(10):
+        world.apply(WorldUpdate({"tick": i}))
+    assert world.version == 10
+    assert world.oldest_version == 8
+    assert world.at(7) is None
+    assert world.diff_since(7) is None
+    diff = world.diff_since(8)
+    assert diff is not None
+    assert dict(diff.changed) == {"tick": 9}
+
+
+def test_ingests_world_events_from_bus() -> None:
+    bus = Bus()
+    world = WorldState()
+    world.bind(bus)
+    bus.publish(Event("world.users", WorldUpdate({"user.alice.present": True})))
+    bus.publish(Event("world.users", "not an update"))
+    bus.publish(Event("chat.alice", WorldUpdate({"ignored": 1})))
+    assert dict(world.snapshot) == {"user.alice.present": True}
+    assert world.version == 1